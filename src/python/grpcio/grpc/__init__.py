@@ -2102,6 +2102,28 @@ def channel_ready_future(channel):
     return _utilities.channel_ready_future(channel)
 
 
+def channels_ready(channels, timeout=None):
+    """Blocks until all the given Channels are ready.
+
+    This is an EXPERIMENTAL API.
+
+    Every channel is asked to connect and the connectivity of all of them is
+    watched concurrently, without starting a thread per channel.
+
+    Args:
+      channels: A sequence of Channel objects.
+      timeout: An optional duration of time in seconds to wait for. None means
+        waiting indefinitely.
+
+    Raises:
+      FutureTimeoutError: If some of the channels are not ready before the
+        timeout.
+    """
+    from grpc import _utilities  # pylint: disable=cyclic-import
+
+    _utilities.channels_ready(channels, timeout)
+
+
 def insecure_channel(target, options=None, compression=None):
     """Creates an insecure Channel to a server.
 
@@ -2156,6 +2178,47 @@ def secure_channel(target, credentials, options=None, compression=None):
     )
 
 
+def channel_pool(
+    target, size, credentials=None, options=None, compression=None
+):
+    """Creates a Channel that spreads RPCs over several channels to a server.
+
+    This is an EXPERIMENTAL API.
+
+    The returned Channel owns `size` channels to the same target, each with
+    its own connections, and starts every RPC on the one with the fewest
+    outstanding RPCs. It affords the same multicallables as any other
+    Channel, so stubs can be created on it unchanged. This is useful when a
+    single connection is limited by the maximum number of concurrent streams
+    or by flow control.
+
+    Subscribers to its connectivity are told the best state of its channels,
+    in the order READY, CONNECTING, IDLE, TRANSIENT_FAILURE, SHUTDOWN.
+    channel_ready_future and channels_ready wait for all of its channels to
+    be ready.
+
+    The returned Channel is thread-safe.
+
+    Args:
+      target: The server address.
+      size: The number of channels in the pool.
+      credentials: An optional ChannelCredentials instance. The channels are
+        insecure if None is passed.
+      options: An optional list of key-value pairs (:term:`channel_arguments`
+        in gRPC Core runtime) to configure the channels.
+      compression: An optional value indicating the compression method to be
+        used over the lifetime of the channels.
+
+    Returns:
+      A Channel.
+    """
+    from grpc import _channel_pool  # pylint: disable=cyclic-import
+
+    return _channel_pool.ChannelPool(
+        target, size, credentials, options, compression
+    )
+
+
 def intercept_channel(channel, *interceptors):
     """Intercepts a channel through a set of interceptors.
 
@@ -2296,7 +2359,9 @@ __all__ = (
     "access_token_call_credentials",
     "alts_channel_credentials",
     "alts_server_credentials",
+    "channel_pool",
     "channel_ready_future",
+    "channels_ready",
     "composite_call_credentials",
     "composite_channel_credentials",
     "compute_engine_channel_credentials",
@@ -13,6 +13,7 @@
 # limitations under the License.
 """Invocation-side implementation of gRPC Python."""
 
+import collections
 import copy
 import functools
 import logging
@@ -24,6 +25,7 @@ import types
 from typing import (
     Any,
     Callable,
+    Deque,
     Dict,
     Iterator,
     List,
@@ -33,6 +35,7 @@ from typing import (
     Tuple,
     Union,
 )
+import weakref
 
 import grpc
 from grpc import _common
@@ -62,6 +65,14 @@ _DEFAULT_SINGLE_THREADED_UNARY_STREAM = (
     os.getenv("GRPC_SINGLE_THREADED_UNARY_STREAM") is not None
 )
 
+# The number of seconds a channel's call polling thread stays alive after its
+# last call completes, waiting to poll for the channel's next call.
+_DEFAULT_CALL_POLLER_LINGER = 1.0
+
+# The maximum number of threads running channel subscription callbacks,
+# shared by all the channels of the process.
+_CONNECTIVITY_DELIVERY_THREADS = 4
+
 _UNARY_UNARY_INITIAL_DUE = (
     cygrpc.OperationType.send_initial_metadata,
     cygrpc.OperationType.send_message,
@@ -121,14 +132,13 @@ def _unknown_code_details(
 class _RPCState:
     condition: threading.Condition
     due: Set[cygrpc.OperationType]
-    initial_metadata: Optional[MetadataType]
     response: Any
-    trailing_metadata: Optional[MetadataType]
     code: Optional[grpc.StatusCode]
     details: Optional[str]
     debug_error_string: Optional[str]
     cancelled: bool
     callbacks: List[NullaryCallbackType]
+    request_sent_callback: Optional[NullaryCallbackType]
     fork_epoch: Optional[int]
     rpc_start_time: Optional[float]  # In relative seconds
     rpc_end_time: Optional[float]  # In relative seconds
@@ -154,9 +164,14 @@ class _RPCState:
         # calls, there may briefly be events in `due` that do not correspond to
         # operations submitted to Core.
         self.due = set(due)
-        self.initial_metadata = initial_metadata
+        # Received metadata is held by the operation that received it and is
+        # decoded only once it is asked for, since many calls never look at
+        # it.
+        self._initial_metadata = initial_metadata
+        self._initial_metadata_operation = None
         self.response = None
-        self.trailing_metadata = trailing_metadata
+        self._trailing_metadata = trailing_metadata
+        self._trailing_metadata_operation = None
         self.code = code
         self.details = details
         self.debug_error_string = None
@@ -173,8 +188,48 @@ class _RPCState:
         # prior to termination of the RPC.
         self.cancelled = False
         self.callbacks = []
+        # Invoked, with `condition` held, whenever a sent request completes.
+        self.request_sent_callback = None
         self.fork_epoch = cygrpc.get_fork_epoch()
 
+    @property
+    def initial_metadata(self) -> Optional[MetadataType]:
+        if self._initial_metadata_operation is not None:
+            self._initial_metadata = (
+                self._initial_metadata_operation.initial_metadata()
+            )
+            self._initial_metadata_operation = None
+        return self._initial_metadata
+
+    @initial_metadata.setter
+    def initial_metadata(self, initial_metadata: Optional[MetadataType]):
+        self._initial_metadata = initial_metadata
+        self._initial_metadata_operation = None
+
+    @property
+    def trailing_metadata(self) -> Optional[MetadataType]:
+        if self._trailing_metadata_operation is not None:
+            self._trailing_metadata = (
+                self._trailing_metadata_operation.trailing_metadata()
+            )
+            self._trailing_metadata_operation = None
+        return self._trailing_metadata
+
+    @trailing_metadata.setter
+    def trailing_metadata(self, trailing_metadata: Optional[MetadataType]):
+        self._trailing_metadata = trailing_metadata
+        self._trailing_metadata_operation = None
+
+    def receive_initial_metadata(
+        self, operation: cygrpc.ReceiveInitialMetadataOperation
+    ) -> None:
+        self._initial_metadata_operation = operation
+
+    def receive_trailing_metadata(
+        self, operation: cygrpc.ReceiveStatusOnClientOperation
+    ) -> None:
+        self._trailing_metadata_operation = operation
+
     def reset_postfork_child(self):
         self.condition = threading.Condition()
 
@@ -198,7 +253,7 @@ def _handle_event(
         operation_type = batch_operation.type()
         state.due.remove(operation_type)
         if operation_type == cygrpc.OperationType.receive_initial_metadata:
-            state.initial_metadata = batch_operation.initial_metadata()
+            state.receive_initial_metadata(batch_operation)
         elif operation_type == cygrpc.OperationType.receive_message:
             serialized_response = batch_operation.message()
             if serialized_response is not None:
@@ -210,8 +265,11 @@ def _handle_event(
                     _abort(state, grpc.StatusCode.INTERNAL, details)
                 else:
                     state.response = response
+        elif operation_type == cygrpc.OperationType.send_message:
+            if state.request_sent_callback is not None:
+                state.request_sent_callback()
         elif operation_type == cygrpc.OperationType.receive_status_on_client:
-            state.trailing_metadata = batch_operation.trailing_metadata()
+            state.receive_trailing_metadata(batch_operation)
             if state.code is None:
                 code = _common.CYGRPC_STATUS_CODE_TO_STATUS_CODE.get(
                     batch_operation.code()
@@ -254,100 +312,278 @@ def _event_handler(
     return handle_event
 
 
-# TODO(xuanwn): Create a base class for IntegratedCall and SegregatedCall.
-# pylint: disable=too-many-statements
-def _consume_request_iterator(
-    request_iterator: Iterator,
-    state: _RPCState,
-    call: Union[cygrpc.IntegratedCall, cygrpc.SegregatedCall],
-    request_serializer: SerializingFunction,
-    event_handler: Optional[UserTag],
-) -> None:
-    """Consume a request supplied by the user."""
+class _RequestConsumptionPool:
+    """Drives the request iterators of a channel's RPCs on a bounded set of
+    threads.
+
+    Each request iterator is advanced one request at a time, and only once
+    the previous request has been sent, so a thread is held by a stream only
+    while that stream's iterator is producing a request.
+    """
 
-    def consume_request_iterator():  # pylint: disable=too-many-branches
-        # Iterate over the request iterator until it is exhausted or an error
-        # condition is encountered.
+    _condition: threading.Condition
+    _ready: Deque[NullaryCallbackType]
+    _max_threads: int
+    _linger: float
+    _threads: int
+    _idle_threads: int
+    _closed: bool
+    thread_starts: int
+
+    def __init__(self, max_threads: int, linger: float):
+        self._condition = threading.Condition()
+        self._ready = collections.deque()
+        self._max_threads = max_threads
+        self._linger = linger
+        self._threads = 0
+        self._idle_threads = 0
+        self._closed = False
+        self.thread_starts = 0
+
+    def submit(self, behavior: NullaryCallbackType) -> None:
+        with self._condition:
+            self._ready.append(behavior)
+            if (
+                self._idle_threads < len(self._ready)
+                and self._threads < self._max_threads
+            ):
+                self._threads += 1
+                self.thread_starts += 1
+                thread = cygrpc.ForkManagedThread(target=self._work)
+                thread.setDaemon(True)
+                thread.start()
+            else:
+                self._condition.notify()
+
+    def _work(self) -> None:
         while True:
-            return_from_user_request_generator_invoked = False
+            with self._condition:
+                if not self._ready and not self._closed:
+                    self._idle_threads += 1
+                    self._condition.wait_for(
+                        lambda: self._ready or self._closed,
+                        timeout=self._linger,
+                    )
+                    self._idle_threads -= 1
+                if not self._ready:
+                    self._threads -= 1
+                    return
+                behavior = self._ready.popleft()
             try:
-                # The thread may die in user-code. Do not block fork for this.
-                cygrpc.enter_user_request_generator()
-                request = next(request_iterator)
-            except StopIteration:
-                break
+                behavior()
             except Exception:  # pylint: disable=broad-except
-                cygrpc.return_from_user_request_generator()
-                return_from_user_request_generator_invoked = True
-                code = grpc.StatusCode.UNKNOWN
-                details = "Exception iterating requests!"
-                _LOGGER.exception(details)
-                call.cancel(
-                    _common.STATUS_CODE_TO_CYGRPC_STATUS_CODE[code], details
+                _LOGGER.exception("Exception consuming request iterator!")
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+
+# TODO(xuanwn): Create a base class for IntegratedCall and SegregatedCall.
+class _RequestWriter:
+    """Sends the requests of a client-streaming RPC.
+
+    At most one request is ever being sent to Core, which applies flow control
+    to it. Up to `window` requests, including the one being sent, may be
+    pulled from the request iterator and serialized ahead of time; each is
+    sent as soon as the one before it completes.
+
+    All members other than the request iterator are guarded by the RPC's
+    state.condition.
+    """
+
+    _request_iterator: Iterator
+    _state: _RPCState
+    _call: Union[cygrpc.IntegratedCall, cygrpc.SegregatedCall]
+    _request_serializer: SerializingFunction
+    _event_handler: Optional[UserTag]
+    _window: int
+    _consumption_pool: Optional[_RequestConsumptionPool]
+    _pending: Deque[Any]
+    _half_close_pending: bool
+    _parked: bool
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        request_iterator: Iterator,
+        state: _RPCState,
+        call: Union[cygrpc.IntegratedCall, cygrpc.SegregatedCall],
+        request_serializer: SerializingFunction,
+        event_handler: Optional[UserTag],
+        window: int,
+        consumption_pool: Optional[_RequestConsumptionPool],
+    ):
+        self._request_iterator = request_iterator
+        self._state = state
+        self._call = call
+        self._request_serializer = request_serializer
+        self._event_handler = event_handler
+        self._window = window
+        self._consumption_pool = consumption_pool
+        self._pending = collections.deque()
+        self._half_close_pending = False
+        self._parked = False
+
+    def _sending(self) -> bool:
+        return cygrpc.OperationType.send_message in self._state.due
+
+    def _has_room(self) -> bool:
+        return len(self._pending) + self._sending() < self._window
+
+    def _send(self, serialized_request: Any) -> bool:
+        self._state.due.add(cygrpc.OperationType.send_message)
+        operations = (
+            cygrpc.SendMessageOperation(serialized_request, _EMPTY_FLAGS),
+        )
+        if self._call.operate(operations, self._event_handler):
+            return True
+        self._state.due.remove(cygrpc.OperationType.send_message)
+        self._pending.clear()
+        return False
+
+    def _half_close(self) -> None:
+        if self._state.code is None:
+            self._state.due.add(cygrpc.OperationType.send_close_from_client)
+            operations = (cygrpc.SendCloseFromClientOperation(_EMPTY_FLAGS),)
+            operating = self._call.operate(operations, self._event_handler)
+            if not operating:
+                self._state.due.remove(
+                    cygrpc.OperationType.send_close_from_client
                 )
-                _abort(state, code, details)
-                return
-            finally:
-                if not return_from_user_request_generator_invoked:
-                    cygrpc.return_from_user_request_generator()
-            serialized_request = _common.serialize(request, request_serializer)
-            with state.condition:
-                if state.code is None and not state.cancelled:
-                    if serialized_request is None:
-                        code = grpc.StatusCode.INTERNAL
-                        details = "Exception serializing request!"
-                        call.cancel(
-                            _common.STATUS_CODE_TO_CYGRPC_STATUS_CODE[code],
-                            details,
-                        )
-                        _abort(state, code, details)
-                        return
-                    state.due.add(cygrpc.OperationType.send_message)
-                    operations = (
-                        cygrpc.SendMessageOperation(
-                            serialized_request, _EMPTY_FLAGS
-                        ),
-                    )
-                    operating = call.operate(operations, event_handler)
-                    if not operating:
-                        state.due.remove(cygrpc.OperationType.send_message)
-                        return
 
-                    def _done():
-                        return (
-                            state.code is not None
-                            or cygrpc.OperationType.send_message
-                            not in state.due
-                        )
-
-                    _common.wait(
-                        state.condition.wait,
-                        _done,
-                        spin_cb=functools.partial(
-                            cygrpc.block_if_fork_in_progress, state
-                        ),
-                    )
-                    if state.code is not None:
-                        return
+    def on_request_sent(self) -> None:
+        """Reacts to the completion of a sent request.
+
+        Must be invoked with state.condition held.
+        """
+        if self._state.code is not None:
+            self._pending.clear()
+        elif self._pending:
+            self._send(self._pending.popleft())
+        elif self._half_close_pending:
+            self._half_close_pending = False
+            self._half_close()
+        if self._parked:
+            self._parked = False
+            self._consumption_pool.submit(self.consume)
+
+    def _next_serialized_request(self) -> Optional[Any]:
+        """Pulls and serializes the next request supplied by the user.
+
+        Returns:
+          The serialized request, or None if consumption of the request
+          iterator has ended, either because it is exhausted (in which case
+          the client has been or will be half-closed) or because of an error
+          condition.
+        """
+        return_from_user_request_generator_invoked = False
+        try:
+            # The thread may die in user-code. Do not block fork for this.
+            cygrpc.enter_user_request_generator()
+            request = next(self._request_iterator)
+        except StopIteration:
+            cygrpc.return_from_user_request_generator()
+            return_from_user_request_generator_invoked = True
+            with self._state.condition:
+                if self._sending():
+                    self._half_close_pending = True
                 else:
+                    self._half_close()
+            return None
+        except Exception:  # pylint: disable=broad-except
+            cygrpc.return_from_user_request_generator()
+            return_from_user_request_generator_invoked = True
+            code = grpc.StatusCode.UNKNOWN
+            details = "Exception iterating requests!"
+            _LOGGER.exception(details)
+            self._call.cancel(
+                _common.STATUS_CODE_TO_CYGRPC_STATUS_CODE[code], details
+            )
+            _abort(self._state, code, details)
+            return None
+        finally:
+            if not return_from_user_request_generator_invoked:
+                cygrpc.return_from_user_request_generator()
+        serialized_request = _common.serialize(
+            request, self._request_serializer
+        )
+        if serialized_request is None:
+            with self._state.condition:
+                if self._state.code is None and not self._state.cancelled:
+                    code = grpc.StatusCode.INTERNAL
+                    details = "Exception serializing request!"
+                    self._call.cancel(
+                        _common.STATUS_CODE_TO_CYGRPC_STATUS_CODE[code],
+                        details,
+                    )
+                    _abort(self._state, code, details)
+        return serialized_request
+
+    def _done(self) -> bool:
+        return self._state.code is not None or self._has_room()
+
+    def consume(self) -> None:
+        """Sends requests until the request iterator is exhausted, the RPC
+        terminates, or (when consuming on a pool) the window is full.
+        """
+        state = self._state
+        while True:
+            with state.condition:
+                if state.code is not None or state.cancelled:
                     return
-        with state.condition:
-            if state.code is None:
-                state.due.add(cygrpc.OperationType.send_close_from_client)
-                operations = (
-                    cygrpc.SendCloseFromClientOperation(_EMPTY_FLAGS),
+            serialized_request = self._next_serialized_request()
+            if serialized_request is None:
+                return
+            with state.condition:
+                if state.code is not None or state.cancelled:
+                    return
+                if self._sending():
+                    self._pending.append(serialized_request)
+                elif not self._send(serialized_request):
+                    return
+                if self._has_room():
+                    continue
+                if self._consumption_pool is not None:
+                    # Resumed by on_request_sent.
+                    self._parked = True
+                    return
+                _common.wait(
+                    state.condition.wait,
+                    self._done,
+                    spin_cb=functools.partial(
+                        cygrpc.block_if_fork_in_progress, state
+                    ),
                 )
-                operating = call.operate(operations, event_handler)
-                if not operating:
-                    state.due.remove(
-                        cygrpc.OperationType.send_close_from_client
-                    )
 
-    consumption_thread = cygrpc.ForkManagedThread(
-        target=consume_request_iterator
+
+def _consume_request_iterator(
+    request_iterator: Iterator,
+    state: _RPCState,
+    call: Union[cygrpc.IntegratedCall, cygrpc.SegregatedCall],
+    request_serializer: SerializingFunction,
+    event_handler: Optional[UserTag],
+    write_window: int,
+    consumption_pool: Optional[_RequestConsumptionPool],
+) -> None:
+    """Consume a request supplied by the user."""
+    writer = _RequestWriter(
+        request_iterator,
+        state,
+        call,
+        request_serializer,
+        event_handler,
+        write_window,
+        consumption_pool,
     )
-    consumption_thread.setDaemon(True)
-    consumption_thread.start()
+    state.request_sent_callback = writer.on_request_sent
+    if consumption_pool is None:
+        consumption_thread = cygrpc.ForkManagedThread(target=writer.consume)
+        consumption_thread.setDaemon(True)
+        consumption_thread.start()
+    else:
+        consumption_pool.submit(writer.consume)
 
 
 def _rpc_state_string(class_name: str, rpc_state: _RPCState) -> str:
@@ -766,7 +1002,12 @@ class _SingleThreadedRendezvous(
                 # no data race on `due`.
                 self._state.due.add(cygrpc.OperationType.receive_message)
                 operating = self._call.operate(
-                    (cygrpc.ReceiveMessageOperation(_EMPTY_FLAGS),), None
+                    (
+                        _common.receive_message_operation(
+                            self._response_deserializer
+                        ),
+                    ),
+                    None,
                 )
                 if not operating:
                     self._state.due.remove(cygrpc.OperationType.receive_message)
@@ -937,7 +1178,11 @@ class _MultiThreadedRendezvous(
                 )
                 self._state.due.add(cygrpc.OperationType.receive_message)
                 operating = self._call.operate(
-                    (cygrpc.ReceiveMessageOperation(_EMPTY_FLAGS),),
+                    (
+                        _common.receive_message_operation(
+                            self._response_deserializer
+                        ),
+                    ),
                     event_handler,
                 )
                 if not operating:
@@ -1000,14 +1245,16 @@ def _end_unary_response_blocking(
 
 
 def _stream_unary_invocation_operations(
-    metadata: Optional[MetadataType], initial_metadata_flags: int
+    metadata: Optional[MetadataType],
+    initial_metadata_flags: int,
+    response_deserializer: Optional[DeserializingFunction],
 ) -> Sequence[Sequence[cygrpc.Operation]]:
     return (
         (
             cygrpc.SendInitialMetadataOperation(
                 metadata, initial_metadata_flags
             ),
-            cygrpc.ReceiveMessageOperation(_EMPTY_FLAGS),
+            _common.receive_message_operation(response_deserializer),
             cygrpc.ReceiveStatusOnClientOperation(_EMPTY_FLAGS),
         ),
         (cygrpc.ReceiveInitialMetadataOperation(_EMPTY_FLAGS),),
@@ -1015,7 +1262,9 @@ def _stream_unary_invocation_operations(
 
 
 def _stream_unary_invocation_operations_and_tags(
-    metadata: Optional[MetadataType], initial_metadata_flags: int
+    metadata: Optional[MetadataType],
+    initial_metadata_flags: int,
+    response_deserializer: Optional[DeserializingFunction],
 ) -> Sequence[Tuple[Sequence[cygrpc.Operation], Optional[UserTag]]]:
     return tuple(
         (
@@ -1023,7 +1272,7 @@ def _stream_unary_invocation_operations_and_tags(
             None,
         )
         for operations in _stream_unary_invocation_operations(
-            metadata, initial_metadata_flags
+            metadata, initial_metadata_flags, response_deserializer
         )
     )
 
@@ -1111,7 +1360,7 @@ class _UnaryUnaryMultiCallable(grpc.UnaryUnaryMultiCallable):
             cygrpc.SendMessageOperation(serialized_request, _EMPTY_FLAGS),
             cygrpc.SendCloseFromClientOperation(_EMPTY_FLAGS),
             cygrpc.ReceiveInitialMetadataOperation(_EMPTY_FLAGS),
-            cygrpc.ReceiveMessageOperation(_EMPTY_FLAGS),
+            _common.receive_message_operation(self._response_deserializer),
             cygrpc.ReceiveStatusOnClientOperation(_EMPTY_FLAGS),
         )
         return state, operations, deadline, None
@@ -1417,15 +1666,19 @@ class _StreamUnaryMultiCallable(grpc.StreamUnaryMultiCallable):
     _response_deserializer: Optional[DeserializingFunction]
     _context: Any
     _registered_call_handle: Optional[int]
+    _write_window: int
+    _request_consumption_pool: Optional[_RequestConsumptionPool]
 
     __slots__ = [
         "_channel",
         "_context",
         "_managed_call",
         "_method",
+        "_request_consumption_pool",
         "_request_serializer",
         "_response_deserializer",
         "_target",
+        "_write_window",
     ]
 
     # pylint: disable=too-many-arguments
@@ -1438,6 +1691,8 @@ class _StreamUnaryMultiCallable(grpc.StreamUnaryMultiCallable):
         request_serializer: Optional[SerializingFunction],
         response_deserializer: Optional[DeserializingFunction],
         _registered_call_handle: Optional[int],
+        write_window: int,
+        request_consumption_pool: Optional[_RequestConsumptionPool],
     ):
         self._channel = channel
         self._managed_call = managed_call
@@ -1447,6 +1702,8 @@ class _StreamUnaryMultiCallable(grpc.StreamUnaryMultiCallable):
         self._response_deserializer = response_deserializer
         self._context = cygrpc.build_census_context()
         self._registered_call_handle = _registered_call_handle
+        self._write_window = write_window
+        self._request_consumption_pool = request_consumption_pool
 
     def _blocking(
         self,
@@ -1476,13 +1733,21 @@ class _StreamUnaryMultiCallable(grpc.StreamUnaryMultiCallable):
             augmented_metadata,
             None if credentials is None else credentials._credentials,
             _stream_unary_invocation_operations_and_tags(
-                augmented_metadata, initial_metadata_flags
+                augmented_metadata,
+                initial_metadata_flags,
+                self._response_deserializer,
             ),
             self._context,
             self._registered_call_handle,
         )
         _consume_request_iterator(
-            request_iterator, state, call, self._request_serializer, None
+            request_iterator,
+            state,
+            call,
+            self._request_serializer,
+            None,
+            self._write_window,
+            self._request_consumption_pool,
         )
         while True:
             event = call.next_event()
@@ -1560,7 +1825,7 @@ class _StreamUnaryMultiCallable(grpc.StreamUnaryMultiCallable):
             augmented_metadata,
             None if credentials is None else credentials._credentials,
             _stream_unary_invocation_operations(
-                metadata, initial_metadata_flags
+                metadata, initial_metadata_flags, self._response_deserializer
             ),
             event_handler,
             self._context,
@@ -1572,6 +1837,8 @@ class _StreamUnaryMultiCallable(grpc.StreamUnaryMultiCallable):
             call,
             self._request_serializer,
             event_handler,
+            self._write_window,
+            self._request_consumption_pool,
         )
         return _MultiThreadedRendezvous(
             state, call, self._response_deserializer, deadline
@@ -1587,15 +1854,19 @@ class _StreamStreamMultiCallable(grpc.StreamStreamMultiCallable):
     _response_deserializer: Optional[DeserializingFunction]
     _context: Any
     _registered_call_handle: Optional[int]
+    _write_window: int
+    _request_consumption_pool: Optional[_RequestConsumptionPool]
 
     __slots__ = [
         "_channel",
         "_context",
         "_managed_call",
         "_method",
+        "_request_consumption_pool",
         "_request_serializer",
         "_response_deserializer",
         "_target",
+        "_write_window",
     ]
 
     # pylint: disable=too-many-arguments
@@ -1608,6 +1879,8 @@ class _StreamStreamMultiCallable(grpc.StreamStreamMultiCallable):
         request_serializer: Optional[SerializingFunction],
         response_deserializer: Optional[DeserializingFunction],
         _registered_call_handle: Optional[int],
+        write_window: int,
+        request_consumption_pool: Optional[_RequestConsumptionPool],
     ):
         self._channel = channel
         self._managed_call = managed_call
@@ -1617,6 +1890,8 @@ class _StreamStreamMultiCallable(grpc.StreamStreamMultiCallable):
         self._response_deserializer = response_deserializer
         self._context = cygrpc.build_census_context()
         self._registered_call_handle = _registered_call_handle
+        self._write_window = write_window
+        self._request_consumption_pool = request_consumption_pool
 
     def __call__(
         self,
@@ -1666,6 +1941,8 @@ class _StreamStreamMultiCallable(grpc.StreamStreamMultiCallable):
             call,
             self._request_serializer,
             event_handler,
+            self._write_window,
+            self._request_consumption_pool,
         )
         return _MultiThreadedRendezvous(
             state, call, self._response_deserializer, deadline
@@ -1699,15 +1976,32 @@ class _ChannelCallState:
     channel: cygrpc.Channel
     managed_calls: int
     threading: bool
+    polling: bool
+    closed: bool
+    linger: float
+    poller_starts: int
 
-    def __init__(self, channel: cygrpc.Channel):
+    def __init__(self, channel: cygrpc.Channel, linger: float):
         self.lock = threading.Lock()
+        self.condition = threading.Condition(self.lock)
         self.channel = channel
         self.managed_calls = 0
         self.threading = False
+        self.polling = False
+        self.closed = False
+        # A lingering thread would not check in with fork support, so the
+        # poller exits as soon as it is idle when fork support is enabled.
+        self.linger = 0.0 if cygrpc.is_fork_support_enabled() else linger
+        self.poller_starts = 0
 
     def reset_postfork_child(self) -> None:
         self.managed_calls = 0
+        self.polling = False
+
+    def close(self) -> None:
+        with self.lock:
+            self.closed = True
+            self.condition.notify_all()
 
     def __del__(self):
         try:
@@ -1718,6 +2012,21 @@ class _ChannelCallState:
             pass
 
 
+def _await_managed_call(state: _ChannelCallState) -> bool:
+    """Waits for a call to be created on an idle channel.
+
+    The caller must hold state.lock.
+
+    Returns:
+      Whether a call was created within the channel's linger period.
+    """
+    if state.linger > 0 and not state.closed:
+        state.condition.wait_for(
+            lambda: state.managed_calls or state.closed, timeout=state.linger
+        )
+    return state.managed_calls > 0
+
+
 def _run_channel_spin_thread(state: _ChannelCallState) -> None:
     def channel_spin():
         while True:
@@ -1729,9 +2038,13 @@ def _run_channel_spin_thread(state: _ChannelCallState) -> None:
             if call_completed:
                 with state.lock:
                     state.managed_calls -= 1
-                    if state.managed_calls == 0:
+                    if state.managed_calls == 0 and not _await_managed_call(
+                        state
+                    ):
+                        state.polling = False
                         return
 
+    state.poller_starts += 1
     channel_spin_thread = cygrpc.ForkManagedThread(target=channel_spin)
     channel_spin_thread.setDaemon(True)
     channel_spin_thread.start()
@@ -1791,11 +2104,12 @@ def _channel_managed_call_management(state: _ChannelCallState):
                 context,
                 _registered_call_handle,
             )
-            if state.managed_calls == 0:
-                state.managed_calls = 1
+            state.managed_calls += 1
+            if not state.polling:
+                state.polling = True
                 _run_channel_spin_thread(state)
-            else:
-                state.managed_calls += 1
+            elif state.managed_calls == 1:
+                state.condition.notify()
             return call
 
     return create
@@ -1860,7 +2174,6 @@ def _deliver(
                 _LOGGER.exception(
                     _CHANNEL_SUBSCRIPTION_CALLBACK_ERROR_LOG_MESSAGE
                 )
-        cygrpc.block_if_fork_in_progress(state)
         with state.lock:
             callbacks = _deliveries(state)
             if callbacks:
@@ -1870,91 +2183,169 @@ def _deliver(
                 return
 
 
+class _ConnectivityReactor:
+    """Watches the connectivity of the subscribed channels of the process.
+
+    A single thread waits on one completion queue for the connectivity
+    changes of every subscribed channel, and subscription callbacks are run
+    by at most _CONNECTIVITY_DELIVERY_THREADS threads.
+
+    The threads are not fork-managed since they block indefinitely; the
+    reactor is recreated instead when first used in a forked child.
+    """
+
+    # Untyped due to reference cycle.
+    _singleton = None
+    _lock: threading.Lock = threading.Lock()
+
+    _pid: int
+    _completion_queue: cygrpc.CompletionQueue
+    _condition: threading.Condition
+    _deliveries: Deque[
+        Tuple[
+            _ChannelConnectivityState,
+            grpc.ChannelConnectivity,
+            Sequence[Callable[[grpc.ChannelConnectivity], None]],
+        ]
+    ]
+    _delivery_threads: int
+    _idle_delivery_threads: int
+
+    def __init__(self):
+        self._pid = os.getpid()
+        self._completion_queue = cygrpc.CompletionQueue()
+        self._condition = threading.Condition()
+        self._deliveries = collections.deque()
+        self._delivery_threads = 0
+        self._idle_delivery_threads = 0
+        watching_thread = threading.Thread(
+            target=self._watch_forever, daemon=True
+        )
+        watching_thread.start()
+
+    @staticmethod
+    def get():
+        singleton = _ConnectivityReactor._singleton
+        if singleton is None or singleton._pid != os.getpid():
+            with _ConnectivityReactor._lock:
+                singleton = _ConnectivityReactor._singleton
+                if singleton is None or singleton._pid != os.getpid():
+                    singleton = _ConnectivityReactor()
+                    _ConnectivityReactor._singleton = singleton
+        return singleton
+
+    def watch(
+        self,
+        state: _ChannelConnectivityState,
+        last_observed_connectivity: cygrpc.ConnectivityState,
+    ) -> None:
+        """Should only be called while holding state.lock.
+
+        The watch has no deadline and only holds a weak reference to the
+        state, so it does not keep a dropped channel alive.
+        """
+        state.channel.watch_connectivity_state_on(
+            last_observed_connectivity,
+            None,
+            self._completion_queue,
+            weakref.ref(state),
+        )
+
+    def _watch_forever(self) -> None:
+        while True:
+            event = self._completion_queue.poll()
+            state = event.tag()
+            if state is None:
+                # The channel was garbage collected.
+                continue
+            with state.lock:
+                if not state.callbacks_and_connectivities:
+                    _stop_watching_connectivity(state)
+                    continue
+                try:
+                    connectivity = state.channel.check_connectivity_state(False)
+                    _update_connectivity(state, connectivity)
+                    self.watch(state, connectivity)
+                except ValueError:
+                    # The channel was closed.
+                    _stop_watching_connectivity(state)
+
+    def deliver(
+        self,
+        state: _ChannelConnectivityState,
+        connectivity: grpc.ChannelConnectivity,
+        callbacks: Sequence[Callable[[grpc.ChannelConnectivity], None]],
+    ) -> None:
+        with self._condition:
+            self._deliveries.append((state, connectivity, callbacks))
+            if self._idle_delivery_threads:
+                self._idle_delivery_threads -= 1
+                self._condition.notify()
+            elif self._delivery_threads < _CONNECTIVITY_DELIVERY_THREADS:
+                self._delivery_threads += 1
+                delivering_thread = threading.Thread(
+                    target=self._deliver_forever, daemon=True
+                )
+                delivering_thread.start()
+
+    def _deliver_forever(self) -> None:
+        while True:
+            with self._condition:
+                while not self._deliveries:
+                    self._idle_delivery_threads += 1
+                    self._condition.wait()
+                delivery = self._deliveries.popleft()
+            _deliver(*delivery)
+
+
 def _spawn_delivery(
     state: _ChannelConnectivityState,
     callbacks: Sequence[Callable[[grpc.ChannelConnectivity], None]],
 ) -> None:
-    """Spawn a thread running the _deliver function.
+    """Hand the callbacks to the threads delivering connectivity changes.
 
     Should only be called while holding state.lock.
     """
-    delivering_thread = cygrpc.ForkManagedThread(
-        target=_deliver,
-        args=(
-            state,
-            state.connectivity,
-            callbacks,
-        ),
-    )
-    delivering_thread.setDaemon(True)
-    delivering_thread.start()
+    _ConnectivityReactor.get().deliver(state, state.connectivity, callbacks)
     state.delivering = True
 
 
-# NOTE(https://github.com/grpc/grpc/issues/3064): We'd rather not poll.
-def _poll_connectivity(
+def _update_connectivity(
     state: _ChannelConnectivityState,
-    channel: grpc.Channel,
-    initial_try_to_connect: bool,
+    connectivity: cygrpc.ConnectivityState,
 ) -> None:
-    try_to_connect = initial_try_to_connect
-    connectivity = channel.check_connectivity_state(try_to_connect)
-    with state.lock:
-        state.connectivity = (
-            _common.CYGRPC_CONNECTIVITY_STATE_TO_CHANNEL_CONNECTIVITY[
-                connectivity
-            ]
-        )
-        callbacks = tuple(
-            callback for callback, _ in state.callbacks_and_connectivities
-        )
-        for callback_and_connectivity in state.callbacks_and_connectivities:
-            callback_and_connectivity[1] = state.connectivity
+    """Should only be called while holding state.lock."""
+    state.connectivity = (
+        _common.CYGRPC_CONNECTIVITY_STATE_TO_CHANNEL_CONNECTIVITY[connectivity]
+    )
+    if not state.delivering:
+        callbacks = _deliveries(state)
         if callbacks:
             _spawn_delivery(state, callbacks)
-    while True:
-        event = channel.watch_connectivity_state(
-            connectivity, time.time() + 0.2
-        )
-        cygrpc.block_if_fork_in_progress(state)
-        with state.lock:
-            if (
-                not state.callbacks_and_connectivities
-                and not state.try_to_connect
-            ):
-                state.polling = False
-                state.connectivity = None
-                break
-            try_to_connect = state.try_to_connect
-            state.try_to_connect = False
-        if event.success or try_to_connect:
-            connectivity = channel.check_connectivity_state(try_to_connect)
-            with state.lock:
-                state.connectivity = (
-                    _common.CYGRPC_CONNECTIVITY_STATE_TO_CHANNEL_CONNECTIVITY[
-                        connectivity
-                    ]
-                )
-                if not state.delivering:
-                    callbacks = _deliveries(state)
-                    if callbacks:
-                        _spawn_delivery(state, callbacks)
 
 
-def _spawn_poll_connectivity(
+def _stop_watching_connectivity(state: _ChannelConnectivityState) -> None:
+    """Should only be called while holding state.lock."""
+    state.polling = False
+    state.connectivity = None
+    state.try_to_connect = False
+
+
+def _watch_connectivity(
     state: _ChannelConnectivityState, try_to_connect: bool
 ) -> None:
-    """Spawn a thread running the _poll_connectivity function.
+    """Start watching the connectivity of a channel with the reactor.
 
     Should only be called while holding state.lock.
     """
-    polling_thread = cygrpc.ForkManagedThread(
-        target=_poll_connectivity,
-        args=(state, state.channel, bool(try_to_connect)),
-    )
-    polling_thread.setDaemon(True)
-    polling_thread.start()
-    state.polling = True
+    try:
+        connectivity = state.channel.check_connectivity_state(try_to_connect)
+        state.polling = True
+        _update_connectivity(state, connectivity)
+        _ConnectivityReactor.get().watch(state, connectivity)
+    except ValueError:
+        # The channel was closed.
+        _stop_watching_connectivity(state)
 
 
 def _subscribe(
@@ -1963,18 +2354,19 @@ def _subscribe(
     try_to_connect: bool,
 ) -> None:
     with state.lock:
-        if not state.callbacks_and_connectivities and not state.polling:
-            _spawn_poll_connectivity(state, try_to_connect)
-            state.callbacks_and_connectivities.append([callback, None])
-        elif not state.delivering and state.connectivity is not None:
-            _spawn_delivery(state, (callback,))
-            state.try_to_connect |= bool(try_to_connect)
-            state.callbacks_and_connectivities.append(
-                [callback, state.connectivity]
-            )
-        else:
-            state.try_to_connect |= bool(try_to_connect)
-            state.callbacks_and_connectivities.append([callback, None])
+        state.callbacks_and_connectivities.append([callback, None])
+        state.try_to_connect |= bool(try_to_connect)
+        if not state.polling:
+            _watch_connectivity(state, try_to_connect)
+            return
+        if try_to_connect:
+            try:
+                # A resulting change is reported by the pending watch.
+                state.channel.check_connectivity_state(True)
+            except ValueError:
+                pass
+        if not state.delivering and state.connectivity is not None:
+            _spawn_delivery(state, _deliveries(state))
 
 
 def _unsubscribe(
@@ -2014,9 +2406,12 @@ def _separate_channel_options(
     core_options = []
     python_options = []
     for pair in options:
-        if (
-            pair[0]
-            == grpc.experimental.ChannelOptions.SingleThreadedUnaryStream
+        if pair[0] in (
+            grpc.experimental.ChannelOptions.SingleThreadedUnaryStream,
+            grpc.experimental.ChannelOptions.ZeroCopyReceive,
+            grpc.experimental.ChannelOptions.CallPollerLinger,
+            grpc.experimental.ChannelOptions.RequestConsumptionThreads,
+            grpc.experimental.ChannelOptions.StreamWriteWindow,
         ):
             python_options.append(pair)
         else:
@@ -2024,18 +2419,25 @@ def _separate_channel_options(
     return python_options, core_options
 
 
-def _maybe_spawn_poll_connectivity_postfork(
+def _maybe_watch_connectivity_postfork(
     state: _ChannelConnectivityState,
 ) -> None:
     with state.lock:
-        if state.callbacks_and_connectivities and not state.polling:
-            _spawn_poll_connectivity(state, state.try_to_connect)
+        # The watch of the parent process does not survive the fork.
+        state.reset_postfork_child()
+        if state.callbacks_and_connectivities:
+            _watch_connectivity(state, state.try_to_connect)
 
 
 class Channel(grpc.Channel):
     """A cygrpc.Channel-backed implementation of grpc.Channel."""
 
     _single_threaded_unary_stream: bool
+    _zero_copy_receive: bool
+    _call_poller_linger: float
+    _request_consumption_threads: Optional[int]
+    _request_consumption_pool: Optional[_RequestConsumptionPool]
+    _stream_write_window: int
     _channel: cygrpc.Channel
     _call_state: _ChannelCallState
     _connectivity_state: _ChannelConnectivityState
@@ -2062,6 +2464,10 @@ class Channel(grpc.Channel):
         self._single_threaded_unary_stream = (
             _DEFAULT_SINGLE_THREADED_UNARY_STREAM
         )
+        self._zero_copy_receive = False
+        self._call_poller_linger = _DEFAULT_CALL_POLLER_LINGER
+        self._request_consumption_threads = None
+        self._stream_write_window = 1
         self._process_python_options(python_options)
         self._channel = cygrpc.Channel(
             _common.encode(target),
@@ -2069,7 +2475,20 @@ class Channel(grpc.Channel):
             credentials,
         )
         self._target = target
-        self._call_state = _ChannelCallState(self._channel)
+        self._call_state = _ChannelCallState(
+            self._channel, self._call_poller_linger
+        )
+        # Pool threads idling between requests would not check in with fork
+        # support, so each RPC keeps its own thread when it is enabled.
+        if (
+            self._request_consumption_threads is None
+            or cygrpc.is_fork_support_enabled()
+        ):
+            self._request_consumption_pool = None
+        else:
+            self._request_consumption_pool = _RequestConsumptionPool(
+                self._request_consumption_threads, self._call_poller_linger
+            )
         self._connectivity_state = _ChannelConnectivityState(self._channel)
         cygrpc.fork_register_channel(self)
         if cygrpc.g_gevent_activated:
@@ -2101,6 +2520,28 @@ class Channel(grpc.Channel):
                 == grpc.experimental.ChannelOptions.SingleThreadedUnaryStream
             ):
                 self._single_threaded_unary_stream = True
+            elif pair[0] == grpc.experimental.ChannelOptions.ZeroCopyReceive:
+                self._zero_copy_receive = bool(pair[1])
+            elif pair[0] == grpc.experimental.ChannelOptions.CallPollerLinger:
+                self._call_poller_linger = float(pair[1])
+            elif (
+                pair[0]
+                == grpc.experimental.ChannelOptions.RequestConsumptionThreads
+            ):
+                self._request_consumption_threads = (
+                    _common.validate_positive_int_option(pair[0], pair[1])
+                )
+            elif pair[0] == grpc.experimental.ChannelOptions.StreamWriteWindow:
+                self._stream_write_window = (
+                    _common.validate_positive_int_option(pair[0], pair[1])
+                )
+
+    def _wrap_response_deserializer(
+        self, response_deserializer: Optional[DeserializingFunction]
+    ) -> Optional[DeserializingFunction]:
+        if self._zero_copy_receive:
+            return _common.zero_copy_deserializer(response_deserializer)
+        return response_deserializer
 
     def subscribe(
         self,
@@ -2131,7 +2572,7 @@ class Channel(grpc.Channel):
             _common.encode(method),
             _common.encode(self._target),
             request_serializer,
-            response_deserializer,
+            self._wrap_response_deserializer(response_deserializer),
             _registered_call_handle,
         )
 
@@ -2156,7 +2597,7 @@ class Channel(grpc.Channel):
                 _common.encode(method),
                 _common.encode(self._target),
                 request_serializer,
-                response_deserializer,
+                self._wrap_response_deserializer(response_deserializer),
                 _registered_call_handle,
             )
         return _UnaryStreamMultiCallable(
@@ -2165,7 +2606,7 @@ class Channel(grpc.Channel):
             _common.encode(method),
             _common.encode(self._target),
             request_serializer,
-            response_deserializer,
+            self._wrap_response_deserializer(response_deserializer),
             _registered_call_handle,
         )
 
@@ -2186,8 +2627,10 @@ class Channel(grpc.Channel):
             _common.encode(method),
             _common.encode(self._target),
             request_serializer,
-            response_deserializer,
+            self._wrap_response_deserializer(response_deserializer),
             _registered_call_handle,
+            self._stream_write_window,
+            self._request_consumption_pool,
         )
 
     # pylint: disable=arguments-differ
@@ -2207,8 +2650,10 @@ class Channel(grpc.Channel):
             _common.encode(method),
             _common.encode(self._target),
             request_serializer,
-            response_deserializer,
+            self._wrap_response_deserializer(response_deserializer),
             _registered_call_handle,
+            self._stream_write_window,
+            self._request_consumption_pool,
         )
 
     def _unsubscribe_all(self) -> None:
@@ -2220,6 +2665,9 @@ class Channel(grpc.Channel):
     def _close(self) -> None:
         self._unsubscribe_all()
         self._channel.close(cygrpc.StatusCode.cancelled, "Channel closed!")
+        self._call_state.close()
+        if self._request_consumption_pool is not None:
+            self._request_consumption_pool.close()
         cygrpc.fork_unregister_channel(self)
         if cygrpc.g_gevent_activated:
             cygrpc.gevent_decrement_channel_count()
@@ -2228,7 +2676,7 @@ class Channel(grpc.Channel):
         self._channel.cancel_calls_on_fork(
             cygrpc.StatusCode.cancelled, "Call cancelled in fork child"
         )
-        _maybe_spawn_poll_connectivity_postfork(self._connectivity_state)
+        _maybe_watch_connectivity_postfork(self._connectivity_state)
 
     def __enter__(self):
         return self
@@ -0,0 +1,549 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""A Channel spreading RPCs over several channels to the same target."""
+
+import functools
+import threading
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+import grpc
+
+from ._typing import ChannelArgumentType
+from ._typing import DeserializingFunction
+from ._typing import MetadataType
+from ._typing import SerializingFunction
+
+# Gives each channel of a pool its own subchannels, and therefore its own
+# connections, instead of sharing them through the global subchannel pool.
+_LOCAL_SUBCHANNEL_POOL_OPTION = ("grpc.use_local_subchannel_pool", 1)
+
+# Orders the connectivity states from the most to the least usable one, to
+# report the state of a pool as the best state of its channels.
+_CONNECTIVITY_PRECEDENCE = (
+    grpc.ChannelConnectivity.READY,
+    grpc.ChannelConnectivity.CONNECTING,
+    grpc.ChannelConnectivity.IDLE,
+    grpc.ChannelConnectivity.TRANSIENT_FAILURE,
+    grpc.ChannelConnectivity.SHUTDOWN,
+)
+
+
+class _OutstandingCalls:
+    """Counts the outstanding RPCs of each channel of a pool.
+
+    Does no locking of its own; see _LockedOutstandingCalls.
+    """
+
+    _counts: List[int]
+    _next_index: int
+
+    def __init__(self, size: int):
+        self._counts = [0] * size
+        self._next_index = 0
+
+    def acquire(self) -> int:
+        """Picks the channel with the fewest outstanding RPCs.
+
+        Ties are broken round-robin, so that channels are used evenly under
+        light load.
+        """
+        size = len(self._counts)
+        start = self._next_index
+        index = start
+        for offset in range(1, size):
+            candidate = (start + offset) % size
+            if self._counts[candidate] < self._counts[index]:
+                index = candidate
+        self._counts[index] += 1
+        self._next_index = (index + 1) % size
+        return index
+
+    def release(self, index: int) -> None:
+        self._counts[index] -= 1
+
+    def release_when_done(self, index: int, unused_done: Any) -> None:
+        """Releases <index>; meant to be bound as a done callback."""
+        self.release(index)
+
+
+class _LockedOutstandingCalls(_OutstandingCalls):
+    """Counts the outstanding RPCs of each channel of a pool used from
+    several threads.
+    """
+
+    _lock: threading.Lock
+
+    def __init__(self, size: int):
+        super().__init__(size)
+        self._lock = threading.Lock()
+
+    def acquire(self) -> int:
+        with self._lock:
+            return super().acquire()
+
+    def release(self, index: int) -> None:
+        with self._lock:
+            super().release(index)
+
+
+def _release_on_termination(
+    outstanding_calls: _OutstandingCalls, index: int, call: grpc.Call
+) -> None:
+    release = functools.partial(outstanding_calls.release, index)
+    if not call.add_callback(release):
+        release()
+
+
+def _release_on_done(
+    outstanding_calls: _OutstandingCalls, index: int, future: grpc.Future
+) -> None:
+    future.add_done_callback(
+        functools.partial(outstanding_calls.release_when_done, index)
+    )
+
+
+class _PoolSubscription:
+    """Subscribes a callback to the connectivity of a pool.
+
+    The callback is told the best state of the channels of the pool, once
+    every channel has reported its state and then whenever the best state
+    changes.
+    """
+
+    callback: Callable[[grpc.ChannelConnectivity], None]
+    _channels: Sequence[grpc.Channel]
+    _updates: Tuple[Callable[[grpc.ChannelConnectivity], None], ...]
+    _lock: threading.Lock
+    _delivery_lock: threading.RLock
+    _connectivities: List[Optional[grpc.ChannelConnectivity]]
+    _connectivity: Optional[grpc.ChannelConnectivity]
+
+    def __init__(
+        self,
+        callback: Callable[[grpc.ChannelConnectivity], None],
+        channels: Sequence[grpc.Channel],
+    ):
+        self.callback = callback
+        self._channels = channels
+        self._updates = tuple(
+            functools.partial(self._update, index)
+            for index in range(len(channels))
+        )
+        self._lock = threading.Lock()
+        # Held while delivering, so that the channels, which deliver their
+        # states on different threads, cannot reorder the pool's states.
+        self._delivery_lock = threading.RLock()
+        self._connectivities = [None] * len(channels)
+        self._connectivity = None
+
+    def subscribe(self, try_to_connect: Optional[bool]) -> None:
+        for channel, update in zip(self._channels, self._updates):
+            channel.subscribe(update, try_to_connect=try_to_connect)
+
+    def unsubscribe(self) -> None:
+        for channel, update in zip(self._channels, self._updates):
+            channel.unsubscribe(update)
+
+    def _update(
+        self, index: int, connectivity: grpc.ChannelConnectivity
+    ) -> None:
+        with self._delivery_lock:
+            with self._lock:
+                self._connectivities[index] = connectivity
+                if None in self._connectivities:
+                    return
+                for pool_connectivity in _CONNECTIVITY_PRECEDENCE:
+                    if pool_connectivity in self._connectivities:
+                        break
+                if pool_connectivity is self._connectivity:
+                    return
+                self._connectivity = pool_connectivity
+            self.callback(pool_connectivity)
+
+
+class _PooledMultiCallable:
+    _multi_callables: Sequence[Any]
+    _outstanding_calls: _OutstandingCalls
+
+    def __init__(
+        self,
+        multi_callables: Sequence[Any],
+        outstanding_calls: _OutstandingCalls,
+    ):
+        self._multi_callables = multi_callables
+        self._outstanding_calls = outstanding_calls
+
+    def _invoke_blocking(self, invoker: Callable[[Any], Any]) -> Any:
+        index = self._outstanding_calls.acquire()
+        try:
+            return invoker(self._multi_callables[index])
+        finally:
+            self._outstanding_calls.release(index)
+
+    def _invoke_future(self, invoker: Callable[[Any], Any]) -> Any:
+        index = self._outstanding_calls.acquire()
+        try:
+            future = invoker(self._multi_callables[index])
+        except BaseException:
+            self._outstanding_calls.release(index)
+            raise
+        _release_on_done(self._outstanding_calls, index, future)
+        return future
+
+    def _invoke_streaming(self, invoker: Callable[[Any], Any]) -> Any:
+        index = self._outstanding_calls.acquire()
+        try:
+            call = invoker(self._multi_callables[index])
+        except BaseException:
+            self._outstanding_calls.release(index)
+            raise
+        _release_on_termination(self._outstanding_calls, index, call)
+        return call
+
+
+class _UnaryUnaryMultiCallable(
+    _PooledMultiCallable, grpc.UnaryUnaryMultiCallable
+):
+    def __call__(
+        self,
+        request: Any,
+        timeout: Optional[float] = None,
+        metadata: Optional[MetadataType] = None,
+        credentials: Optional[grpc.CallCredentials] = None,
+        wait_for_ready: Optional[bool] = None,
+        compression: Optional[grpc.Compression] = None,
+    ) -> Any:
+        return self._invoke_blocking(
+            lambda multi_callable: multi_callable(
+                request,
+                timeout=timeout,
+                metadata=metadata,
+                credentials=credentials,
+                wait_for_ready=wait_for_ready,
+                compression=compression,
+            )
+        )
+
+    def with_call(
+        self,
+        request: Any,
+        timeout: Optional[float] = None,
+        metadata: Optional[MetadataType] = None,
+        credentials: Optional[grpc.CallCredentials] = None,
+        wait_for_ready: Optional[bool] = None,
+        compression: Optional[grpc.Compression] = None,
+    ) -> Any:
+        return self._invoke_blocking(
+            lambda multi_callable: multi_callable.with_call(
+                request,
+                timeout=timeout,
+                metadata=metadata,
+                credentials=credentials,
+                wait_for_ready=wait_for_ready,
+                compression=compression,
+            )
+        )
+
+    def future(
+        self,
+        request: Any,
+        timeout: Optional[float] = None,
+        metadata: Optional[MetadataType] = None,
+        credentials: Optional[grpc.CallCredentials] = None,
+        wait_for_ready: Optional[bool] = None,
+        compression: Optional[grpc.Compression] = None,
+    ) -> Any:
+        return self._invoke_future(
+            lambda multi_callable: multi_callable.future(
+                request,
+                timeout=timeout,
+                metadata=metadata,
+                credentials=credentials,
+                wait_for_ready=wait_for_ready,
+                compression=compression,
+            )
+        )
+
+
+class _UnaryStreamMultiCallable(
+    _PooledMultiCallable, grpc.UnaryStreamMultiCallable
+):
+    def __call__(
+        self,
+        request: Any,
+        timeout: Optional[float] = None,
+        metadata: Optional[MetadataType] = None,
+        credentials: Optional[grpc.CallCredentials] = None,
+        wait_for_ready: Optional[bool] = None,
+        compression: Optional[grpc.Compression] = None,
+    ) -> Any:
+        return self._invoke_streaming(
+            lambda multi_callable: multi_callable(
+                request,
+                timeout=timeout,
+                metadata=metadata,
+                credentials=credentials,
+                wait_for_ready=wait_for_ready,
+                compression=compression,
+            )
+        )
+
+
+class _StreamUnaryMultiCallable(
+    _PooledMultiCallable, grpc.StreamUnaryMultiCallable
+):
+    def __call__(
+        self,
+        request_iterator: Any,
+        timeout: Optional[float] = None,
+        metadata: Optional[MetadataType] = None,
+        credentials: Optional[grpc.CallCredentials] = None,
+        wait_for_ready: Optional[bool] = None,
+        compression: Optional[grpc.Compression] = None,
+    ) -> Any:
+        return self._invoke_blocking(
+            lambda multi_callable: multi_callable(
+                request_iterator,
+                timeout=timeout,
+                metadata=metadata,
+                credentials=credentials,
+                wait_for_ready=wait_for_ready,
+                compression=compression,
+            )
+        )
+
+    def with_call(
+        self,
+        request_iterator: Any,
+        timeout: Optional[float] = None,
+        metadata: Optional[MetadataType] = None,
+        credentials: Optional[grpc.CallCredentials] = None,
+        wait_for_ready: Optional[bool] = None,
+        compression: Optional[grpc.Compression] = None,
+    ) -> Any:
+        return self._invoke_blocking(
+            lambda multi_callable: multi_callable.with_call(
+                request_iterator,
+                timeout=timeout,
+                metadata=metadata,
+                credentials=credentials,
+                wait_for_ready=wait_for_ready,
+                compression=compression,
+            )
+        )
+
+    def future(
+        self,
+        request_iterator: Any,
+        timeout: Optional[float] = None,
+        metadata: Optional[MetadataType] = None,
+        credentials: Optional[grpc.CallCredentials] = None,
+        wait_for_ready: Optional[bool] = None,
+        compression: Optional[grpc.Compression] = None,
+    ) -> Any:
+        return self._invoke_future(
+            lambda multi_callable: multi_callable.future(
+                request_iterator,
+                timeout=timeout,
+                metadata=metadata,
+                credentials=credentials,
+                wait_for_ready=wait_for_ready,
+                compression=compression,
+            )
+        )
+
+
+class _StreamStreamMultiCallable(
+    _PooledMultiCallable, grpc.StreamStreamMultiCallable
+):
+    def __call__(
+        self,
+        request_iterator: Any,
+        timeout: Optional[float] = None,
+        metadata: Optional[MetadataType] = None,
+        credentials: Optional[grpc.CallCredentials] = None,
+        wait_for_ready: Optional[bool] = None,
+        compression: Optional[grpc.Compression] = None,
+    ) -> Any:
+        return self._invoke_streaming(
+            lambda multi_callable: multi_callable(
+                request_iterator,
+                timeout=timeout,
+                metadata=metadata,
+                credentials=credentials,
+                wait_for_ready=wait_for_ready,
+                compression=compression,
+            )
+        )
+
+
+class ChannelPool(grpc.Channel):
+    """A Channel backed by several channels to the same target.
+
+    Each RPC is started on the channel with the fewest outstanding RPCs.
+    Subscribers are told the best connectivity state of the channels, and a
+    pool is ready for channel_ready_future once all of its channels are.
+    """
+
+    _channels: Sequence[grpc.Channel]
+    _outstanding_calls: _OutstandingCalls
+    _subscriptions_lock: threading.Lock
+    _subscriptions: List[_PoolSubscription]
+
+    def __init__(
+        self,
+        target: str,
+        size: int,
+        credentials: Optional[grpc.ChannelCredentials],
+        options: Optional[Sequence[ChannelArgumentType]],
+        compression: Optional[grpc.Compression],
+    ):
+        if size < 1:
+            error_msg = f"size must be positive, got {size}."
+            raise ValueError(error_msg)
+        options = (
+            *(() if options is None else options),
+            _LOCAL_SUBCHANNEL_POOL_OPTION,
+        )
+        if credentials is None:
+            self._channels = tuple(
+                grpc.insecure_channel(target, options, compression)
+                for _ in range(size)
+            )
+        else:
+            self._channels = tuple(
+                grpc.secure_channel(target, credentials, options, compression)
+                for _ in range(size)
+            )
+        self._outstanding_calls = _LockedOutstandingCalls(size)
+        self._subscriptions_lock = threading.Lock()
+        self._subscriptions = []
+
+    @property
+    def channels(self) -> Sequence[grpc.Channel]:
+        """The channels of the pool, which channel_ready_future waits on."""
+        return self._channels
+
+    def subscribe(
+        self, callback: Callable, try_to_connect: Optional[bool] = False
+    ):
+        subscription = _PoolSubscription(callback, self._channels)
+        with self._subscriptions_lock:
+            self._subscriptions.append(subscription)
+        subscription.subscribe(try_to_connect)
+
+    def unsubscribe(self, callback: Callable):
+        with self._subscriptions_lock:
+            for index, subscription in enumerate(self._subscriptions):
+                if subscription.callback == callback:
+                    self._subscriptions.pop(index)
+                    break
+            else:
+                return
+        subscription.unsubscribe()
+
+    # pylint: disable=arguments-differ
+    def unary_unary(
+        self,
+        method: str,
+        request_serializer: Optional[SerializingFunction] = None,
+        response_deserializer: Optional[DeserializingFunction] = None,
+        _registered_method: Optional[bool] = False,
+    ) -> grpc.UnaryUnaryMultiCallable:
+        return _UnaryUnaryMultiCallable(
+            [
+                channel.unary_unary(
+                    method,
+                    request_serializer,
+                    response_deserializer,
+                    _registered_method,
+                )
+                for channel in self._channels
+            ],
+            self._outstanding_calls,
+        )
+
+    # pylint: disable=arguments-differ
+    def unary_stream(
+        self,
+        method: str,
+        request_serializer: Optional[SerializingFunction] = None,
+        response_deserializer: Optional[DeserializingFunction] = None,
+        _registered_method: Optional[bool] = False,
+    ) -> grpc.UnaryStreamMultiCallable:
+        return _UnaryStreamMultiCallable(
+            [
+                channel.unary_stream(
+                    method,
+                    request_serializer,
+                    response_deserializer,
+                    _registered_method,
+                )
+                for channel in self._channels
+            ],
+            self._outstanding_calls,
+        )
+
+    # pylint: disable=arguments-differ
+    def stream_unary(
+        self,
+        method: str,
+        request_serializer: Optional[SerializingFunction] = None,
+        response_deserializer: Optional[DeserializingFunction] = None,
+        _registered_method: Optional[bool] = False,
+    ) -> grpc.StreamUnaryMultiCallable:
+        return _StreamUnaryMultiCallable(
+            [
+                channel.stream_unary(
+                    method,
+                    request_serializer,
+                    response_deserializer,
+                    _registered_method,
+                )
+                for channel in self._channels
+            ],
+            self._outstanding_calls,
+        )
+
+    # pylint: disable=arguments-differ
+    def stream_stream(
+        self,
+        method: str,
+        request_serializer: Optional[SerializingFunction] = None,
+        response_deserializer: Optional[DeserializingFunction] = None,
+        _registered_method: Optional[bool] = False,
+    ) -> grpc.StreamStreamMultiCallable:
+        return _StreamStreamMultiCallable(
+            [
+                channel.stream_stream(
+                    method,
+                    request_serializer,
+                    response_deserializer,
+                    _registered_method,
+                )
+                for channel in self._channels
+            ],
+            self._outstanding_calls,
+        )
+
+    def close(self):
+        for channel in self._channels:
+            channel.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
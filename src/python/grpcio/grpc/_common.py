@@ -58,6 +58,8 @@ STATUS_CODE_TO_CYGRPC_STATUS_CODE = {
 
 MAXIMUM_WAIT_TIMEOUT = 0.1
 
+_EMPTY_FLAGS = 0
+
 _ERROR_MESSAGE_PORT_BINDING_FAILED = (
     "Failed to bind to address %s; set "
     "GRPC_VERBOSITY=debug environment variable to see detailed error message."
@@ -78,11 +80,9 @@ def decode(b: AnyStr) -> str:
 
 def _transform(
     message: Any,
-    transformer: Union[SerializingFunction, DeserializingFunction, None],
+    transformer: Union[SerializingFunction, DeserializingFunction],
     exception_message: str,
 ) -> Any:
-    if transformer is None:
-        return message
     try:
         return transformer(message)
     except Exception:  # pylint: disable=broad-except
@@ -91,17 +91,60 @@ def _transform(
 
 
 def serialize(message: Any, serializer: Optional[SerializingFunction]) -> bytes:
+    if serializer is None:
+        return message
     return _transform(message, serializer, "Exception serializing message!")
 
 
 def deserialize(
     serialized_message: bytes, deserializer: Optional[DeserializingFunction]
 ) -> Any:
+    if deserializer is None:
+        return serialized_message
     return _transform(
         serialized_message, deserializer, "Exception deserializing message!"
     )
 
 
+class ZeroCopyDeserializer:
+    """A deserializer that is handed received messages as buffers.
+
+    Messages received for a method using this deserializer are passed to it
+    as read-only objects supporting the buffer protocol, which reference the
+    memory gRPC Core received them into, rather than as copies in bytes.
+    """
+
+    __slots__ = ("deserializer",)
+
+    deserializer: Optional[DeserializingFunction]
+
+    def __init__(self, deserializer: Optional[DeserializingFunction]):
+        self.deserializer = deserializer
+
+    def __call__(self, message: Any) -> Any:
+        if self.deserializer is None:
+            return message
+        # Deserializers such as protobuf's FromString accept memoryviews but
+        # not arbitrary buffer objects.
+        return self.deserializer(memoryview(message))
+
+
+def zero_copy_deserializer(
+    deserializer: Optional[DeserializingFunction],
+) -> ZeroCopyDeserializer:
+    if isinstance(deserializer, ZeroCopyDeserializer):
+        return deserializer
+    return ZeroCopyDeserializer(deserializer)
+
+
+def receive_message_operation(
+    deserializer: Optional[DeserializingFunction],
+) -> cygrpc.ReceiveMessageOperation:
+    if isinstance(deserializer, ZeroCopyDeserializer):
+        return cygrpc.ReceiveMessageBufferOperation(_EMPTY_FLAGS)
+    return cygrpc.ReceiveMessageOperation(_EMPTY_FLAGS)
+
+
 def fully_qualified_method(group: str, method: str) -> str:
     return "/{}/{}".format(group, method)
 
@@ -178,3 +221,21 @@ def validate_port_binding_result(address: str, port: int) -> int:
         # is raising an exception to prevent further confusion.
         raise RuntimeError(_ERROR_MESSAGE_PORT_BINDING_FAILED % address)
     return port
+
+
+def validate_positive_int_option(key: str, value: Any) -> int:
+    """Validates the value of an option that must be a positive integer.
+
+    Booleans are rejected even though they are ints, as they are far more
+    likely to be a mistake than a count.
+
+    Args:
+        key: The name of the option.
+        value: The value given for the option.
+    """
+    if not isinstance(value, int) or isinstance(value, bool) or value < 1:
+        error_msg = "{} must be a positive integer, got {!r}.".format(
+            key, value
+        )
+        raise ValueError(error_msg)
+    return value
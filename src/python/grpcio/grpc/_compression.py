@@ -58,6 +58,9 @@ def augment_metadata(
 ):
     if not metadata and not compression:
         return None
+    if not compression and isinstance(metadata, cygrpc.PreparedMetadata):
+        # Passed through as is, so that it is sent without re-encoding it.
+        return metadata
     base_metadata = tuple(metadata) if metadata else ()
     compression_metadata = (
         (compression_algorithm_to_metadata(compression),) if compression else ()
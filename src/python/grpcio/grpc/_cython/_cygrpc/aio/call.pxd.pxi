@@ -36,7 +36,9 @@ cdef class _AioCall(GrpcCallWrapper):
         # tasks that are asking for one of the field when they are not yet
         # available.
         readonly AioRpcStatus _status
-        readonly tuple _initial_metadata
+        # A tuple, or the operation that received the initial metadata until
+        # the metadata is asked for.
+        object _initial_metadata
         list _waiters_status
         list _waiters_initial_metadata
 
@@ -46,4 +48,4 @@ cdef class _AioCall(GrpcCallWrapper):
     cdef void _create_grpc_call(self, object timeout, bytes method, CallCredentials credentials) except *
     cdef void _maybe_set_client_call_tracer_on_call(self, bytes method) except *
     cdef void _set_status(self, AioRpcStatus status) except *
-    cdef void _set_initial_metadata(self, tuple initial_metadata) except *
+    cdef void _set_initial_metadata(self, object initial_metadata) except *
@@ -119,7 +119,7 @@ cdef class _AioCall(GrpcCallWrapper):
             self._channel.channel,
             NULL,
             _EMPTY_MASK,
-            global_completion_queue(),
+            loop_completion_queue(self._loop),
             method_slice,
             NULL,
             c_deadline,
@@ -168,7 +168,7 @@ cdef class _AioCall(GrpcCallWrapper):
         for callback in self._done_callbacks:
             callback()
 
-    cdef void _set_initial_metadata(self, tuple initial_metadata) except *:
+    cdef void _set_initial_metadata(self, object initial_metadata) except *:
         if self._initial_metadata is not None:
             # Some gRPC calls might end before the initial metadata arrived in
             # the Call object. That causes this method to be invoked twice: 1.
@@ -275,6 +275,21 @@ cdef class _AioCall(GrpcCallWrapper):
         """Returns if the RPC is ended with ok."""
         return self.done() and self._status.code() == StatusCode.ok
 
+    def received_initial_metadata(self):
+        """Returns the initial metadata of the RPC call if it has arrived.
+
+        The metadata is decoded the first time it is asked for, since many
+        calls never look at it.
+
+        Returns:
+            The tuple object with the initial metadata, or None.
+        """
+        if isinstance(self._initial_metadata, ReceiveInitialMetadataOperation):
+            self._initial_metadata = (
+                <ReceiveInitialMetadataOperation>self._initial_metadata
+            ).initial_metadata()
+        return self._initial_metadata
+
     async def initial_metadata(self):
         """Returns the initial metadata of the RPC call.
 
@@ -284,14 +299,12 @@ cdef class _AioCall(GrpcCallWrapper):
         Returns:
             The tuple object with the initial metadata.
         """
-        if self._initial_metadata is not None:
-            return self._initial_metadata
-
-        future = self._loop.create_future()
-        self._waiters_initial_metadata.append(future)
-        await future
+        if self._initial_metadata is None:
+            future = self._loop.create_future()
+            self._waiters_initial_metadata.append(future)
+            await future
 
-        return self._initial_metadata
+        return self.received_initial_metadata()
 
     def is_locally_cancelled(self):
         """Returns if the RPC was cancelled locally.
@@ -314,7 +327,7 @@ cdef class _AioCall(GrpcCallWrapper):
         ))
 
     async def unary_unary(self,
-                          bytes request,
+                          object request,
                           tuple outbound_initial_metadata,
                           object context = None):
         """Performs a unary unary RPC.
@@ -347,7 +360,7 @@ cdef class _AioCall(GrpcCallWrapper):
                             ops,
                             self._loop)
 
-        self._set_initial_metadata(receive_initial_metadata_op.initial_metadata())
+        self._set_initial_metadata(receive_initial_metadata_op)
 
         cdef grpc_status_code code
         code = receive_status_on_client_op.code()
@@ -355,7 +368,7 @@ cdef class _AioCall(GrpcCallWrapper):
         self._set_status(AioRpcStatus(
             code,
             receive_status_on_client_op.details(),
-            receive_status_on_client_op.trailing_metadata(),
+            receive_status_on_client_op,
             receive_status_on_client_op.error_string(),
         ))
 
@@ -377,7 +390,7 @@ cdef class _AioCall(GrpcCallWrapper):
         self._set_status(AioRpcStatus(
             op.code(),
             op.details(),
-            op.trailing_metadata(),
+            op,
             op.error_string(),
         ))
 
@@ -398,14 +411,29 @@ cdef class _AioCall(GrpcCallWrapper):
         else:
             return EOF
 
-    async def send_serialized_message(self, bytes message):
-        """Sends one single raw message in bytes."""
+    async def send_serialized_message(self, object message):
+        """Sends one single raw message, given as a bytes-like object."""
         await _send_message(self,
                             message,
                             None,
                             False,
                             self._loop)
 
+    async def send_serialized_messages(self, list messages):
+        """Sends several raw messages, submitting them to Core back-to-back.
+
+        All but the last message carry the buffer hint, so that they can be
+        coalesced into fewer writes to the transport.
+        """
+        cdef int index
+        cdef int last_index = len(messages) - 1
+        for index, message in enumerate(messages):
+            await _send_message(self,
+                                message,
+                                None,
+                                _EMPTY_FLAGS if index == last_index else GRPC_WRITE_BUFFER_HINT,
+                                self._loop)
+
     async def send_receive_close(self):
         """Half close the RPC on the client-side."""
         cdef SendCloseFromClientOperation op = SendCloseFromClientOperation(_EMPTY_FLAGS)
@@ -413,7 +441,7 @@ cdef class _AioCall(GrpcCallWrapper):
         await execute_batch(self, ops, self._loop)
 
     async def initiate_unary_stream(self,
-                           bytes request,
+                           object request,
                            tuple outbound_initial_metadata,
                            object context = None):
         """Implementation of the start of a unary-stream call."""
@@ -504,7 +532,7 @@ cdef class _AioCall(GrpcCallWrapper):
         self._set_status(AioRpcStatus(
             code,
             receive_status_on_client_op.details(),
-            receive_status_on_client_op.trailing_metadata(),
+            receive_status_on_client_op,
             receive_status_on_client_op.error_string(),
         ))
 
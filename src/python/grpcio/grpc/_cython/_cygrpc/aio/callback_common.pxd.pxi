@@ -50,6 +50,11 @@ cdef class CallbackWrapper:
             grpc_completion_queue_functor* functor,
             int succeed) noexcept
 
+    @staticmethod
+    cdef void functor_run_threadsafe(
+            grpc_completion_queue_functor* functor,
+            int succeed) noexcept with gil
+
     cdef grpc_completion_queue_functor *c_functor(self)
 
 
@@ -30,10 +30,40 @@ cdef class CallbackFailureHandler:
         ))
 
 
+# Set by the CALLBACK engine, whose functors are invoked on Core's threads
+# rather than on the thread of the event loop awaiting them.
+cdef bint _threadsafe_callbacks = False
+
+# The completions handed to each event loop by the CALLBACK engine's functors
+# that the loop has not run yet, as (CallbackWrapper, success) pairs. Only the
+# first completion of a batch wakes the loop; later ones join the batch until
+# the loop runs it. Guarded by the GIL.
+cdef dict _pending_completions = {}
+
+
+def _run_pending_completions(object loop):
+    cdef list completions = _pending_completions.pop(loop)
+    for callback_wrapper, success in completions:
+        _handle_callback_wrapper(callback_wrapper, success)
+
+
+cdef void _drop_pending_completions(object loop) except *:
+    # The loop is closed, so nothing is left to await the results.
+    cdef list completions = _pending_completions.pop(loop)
+    for callback_wrapper, unused_success in completions:
+        cpython.Py_DECREF(callback_wrapper)
+
+
+# Per-RPC objects are allocated and freed at a high rate by the AsyncIO stack,
+# so freed instances are kept around for reuse.
+@cython.freelist(64)
 cdef class CallbackWrapper:
 
     def __cinit__(self, object future, object loop, CallbackFailureHandler failure_handler):
-        self.context.functor.functor_run = self.functor_run
+        if _threadsafe_callbacks:
+            self.context.functor.functor_run = CallbackWrapper.functor_run_threadsafe
+        else:
+            self.context.functor.functor_run = CallbackWrapper.functor_run
         self.context.waiter = <cpython.PyObject*>future
         self.context.loop = <cpython.PyObject*>loop
         self.context.failure_handler = <cpython.PyObject*>failure_handler
@@ -60,6 +90,28 @@ cdef class CallbackWrapper:
                 waiter.set_result(None)
         cpython.Py_DECREF(<object>context.callback_wrapper)
 
+    @staticmethod
+    cdef void functor_run_threadsafe(
+            grpc_completion_queue_functor* functor,
+            int success) noexcept with gil:
+        cdef CallbackContext *context = <CallbackContext *>functor
+        cdef object loop = <object>context.loop
+        cdef list completions = _pending_completions.get(loop)
+        if completions is None:
+            completions = []
+            _pending_completions[loop] = completions
+            completions.append((<CallbackWrapper>context.callback_wrapper, success))
+            try:
+                loop.call_soon_threadsafe(_run_pending_completions, loop)
+            except RuntimeError:
+                _drop_pending_completions(loop)
+        elif loop.is_closed():
+            # The loop closed before running the batch already scheduled.
+            completions.append((<CallbackWrapper>context.callback_wrapper, success))
+            _drop_pending_completions(loop)
+        else:
+            completions.append((<CallbackWrapper>context.callback_wrapper, success))
+
     cdef grpc_completion_queue_functor *c_functor(self):
         return &self.context.functor
 
@@ -74,18 +126,23 @@ class ExecuteBatchError(InternalError):
     """Raised when execute batch returns a failure from Core."""
 
 
-async def execute_batch(GrpcCallWrapper grpc_call_wrapper,
-                               tuple operations,
-                               object loop):
-    """The callback version of start batch operations."""
-    cdef _BatchOperationTag batch_operation_tag = _BatchOperationTag(None, operations, None)
+cdef object _start_batch(GrpcCallWrapper grpc_call_wrapper,
+                         _BatchOperationTag batch_operation_tag,
+                         object loop):
+    """Starts batch operations, returning a future resolved on completion.
+
+    The caller is responsible for calling batch_operation_tag.event once the
+    future resolves successfully.
+    """
     batch_operation_tag.prepare()
 
     cdef object future = loop.create_future()
     cdef CallbackWrapper wrapper = CallbackWrapper(
         future,
         loop,
-        CallbackFailureHandler('execute_batch', operations, ExecuteBatchError))
+        CallbackFailureHandler('execute_batch',
+                               batch_operation_tag._operations,
+                               ExecuteBatchError))
     cdef grpc_call_error error = grpc_call_start_batch(
         grpc_call_wrapper.call,
         batch_operation_tag.c_ops,
@@ -95,8 +152,15 @@ async def execute_batch(GrpcCallWrapper grpc_call_wrapper,
     if error != GRPC_CALL_OK:
         grpc_call_error_string = grpc_call_error_to_string(error).decode()
         raise ExecuteBatchError("Failed grpc_call_start_batch: {} with grpc_call_error value: '{}'".format(error, grpc_call_error_string))
+    return future
 
-    await future
+
+async def execute_batch(GrpcCallWrapper grpc_call_wrapper,
+                               tuple operations,
+                               object loop):
+    """The callback version of start batch operations."""
+    cdef _BatchOperationTag batch_operation_tag = _BatchOperationTag(None, operations, None)
+    await _start_batch(grpc_call_wrapper, batch_operation_tag, loop)
 
     cdef grpc_event c_event
     # Tag.event must be called, otherwise messages won't be parsed from C
@@ -137,7 +201,7 @@ async def _receive_message(GrpcCallWrapper grpc_call_wrapper,
 
 
 async def _send_message(GrpcCallWrapper grpc_call_wrapper,
-                        bytes message,
+                        object message,
                         Operation send_initial_metadata_op,
                         int write_flag,
                         object loop):
@@ -164,7 +228,8 @@ async def _receive_initial_metadata(GrpcCallWrapper grpc_call_wrapper,
     cdef ReceiveInitialMetadataOperation op = ReceiveInitialMetadataOperation(_EMPTY_FLAGS)
     cdef tuple ops = (op,)
     await execute_batch(grpc_call_wrapper, ops, loop)
-    return op.initial_metadata()
+    # Returned undecoded; see _AioCall.received_initial_metadata.
+    return op
 
 async def _send_error_status_from_server(GrpcCallWrapper grpc_call_wrapper,
                                          grpc_status_code code,
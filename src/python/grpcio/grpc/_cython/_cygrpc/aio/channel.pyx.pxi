@@ -90,7 +90,7 @@ cdef class AioChannel:
             self.channel,
             last_observed_state,
             c_deadline,
-            global_completion_queue(),
+            loop_completion_queue(self.loop),
             wrapper.c_functor())
 
         try:
@@ -44,7 +44,7 @@ cdef object deserialize(object deserializer, bytes raw_message):
         return raw_message
 
 
-cdef bytes serialize(object serializer, object message):
+cdef object serialize(object serializer, object message):
     """Perform serialization on a message.
 
     Failure to serialize is a fatal error.
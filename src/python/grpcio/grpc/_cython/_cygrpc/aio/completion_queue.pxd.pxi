@@ -35,6 +35,34 @@ cdef extern from *:
     inline void _unified_socket_write_impl(int fd) nogil
 
 
+cdef extern from *:
+    """
+    #ifdef __linux__
+    #include <stdint.h>
+    #include <sys/eventfd.h>
+    #include <unistd.h>
+    #endif
+
+    /* Returns a non-blocking eventfd, or -1 where eventfd is unavailable. */
+    static int _wakeup_eventfd_create_impl(void) {
+    #ifdef __linux__
+        return eventfd(0, EFD_NONBLOCK | EFD_CLOEXEC);
+    #else
+        return -1;
+    #endif
+    }
+
+    static void _wakeup_eventfd_write_impl(int fd) {
+    #ifdef __linux__
+        uint64_t one = 1;
+        write(fd, &one, sizeof(one));
+    #endif
+    }
+    """
+    int _wakeup_eventfd_create_impl() nogil
+    void _wakeup_eventfd_write_impl(int fd) nogil
+
+
 cdef void _unified_socket_write(int fd) noexcept nogil
 
 
@@ -52,13 +80,36 @@ cdef class _BoundEventLoop:
 
 cdef class PollerCompletionQueue(BaseCompletionQueue):
     cdef bint _shutdown
+    cdef bint _retired          # Released by the poller thread on shutdown
     cdef cpp_event_queue _queue
     cdef mutex _queue_mutex
     cdef object _poller_thread  # threading.Thread
     cdef int _write_fd
-    cdef object _read_socket    # socket.socket
+    cdef int _event_fd          # -1 unless signalling through an eventfd
+    cdef object _read_socket    # socket.socket, or the eventfd as an int
     cdef object _write_socket   # socket.socket
     cdef dict _loops            # Mapping[asyncio.AbstractLoop, _BoundEventLoop]
+    # Written by the poller thread only.
+    cdef unsigned long long _events
+    cdef unsigned long long _wakeups
 
     cdef int _poll(self) except -1 nogil
+    cdef void _signal(self) noexcept nogil
+    cdef _unbind_loops(self)
+    cdef _release(self)
+    cdef retire(self)
+    cdef shutdown(self)
+
+
+cdef struct _CallbackCompletionQueueShutdown:
+    # The functor Core invokes once a callback completion queue is shut down,
+    # along with the threading.Event it sets.
+    grpc_completion_queue_functor functor
+    cpython.PyObject *done
+
+
+cdef class CallbackCompletionQueue(BaseCompletionQueue):
+    cdef _CallbackCompletionQueueShutdown _shutdown_context
+    cdef object _shutdown_done  # threading.Event
+
     cdef shutdown(self)
@@ -15,7 +15,12 @@
 import socket
 
 cdef gpr_timespec _GPR_INF_FUTURE = gpr_inf_future(GPR_CLOCK_REALTIME)
+cdef gpr_timespec _GPR_INF_PAST = gpr_inf_past(GPR_CLOCK_REALTIME)
 cdef float _POLL_AWAKE_INTERVAL_S = 0.2
+# The most events the poller thread takes from Core before handing them to the
+# loops, so that a steady stream of events still reaches them promptly.
+cdef enum:
+    _MAX_POLL_BATCH = 64
 
 # This bool indicates if the event loop impl can monitor a given fd, or has
 # loop.add_reader method.
@@ -68,29 +73,51 @@ cdef class PollerCompletionQueue(BaseCompletionQueue):
     def __cinit__(self):
         self._cq = grpc_completion_queue_create_for_next(NULL)
         self._shutdown = False
-        self._poller_thread = threading.Thread(target=self._poll_wrapper, daemon=True)
-        self._poller_thread.start()
+        self._retired = False
+        self._events = 0
+        self._wakeups = 0
 
-        self._read_socket, self._write_socket = socket.socketpair()
-        self._write_fd = self._write_socket.fileno()
+        # Wakes loops up through an eventfd where available, which costs a
+        # single file descriptor and no socket buffers.
+        self._event_fd = _wakeup_eventfd_create_impl()
+        if self._event_fd >= 0:
+            self._read_socket = self._event_fd
+            self._write_socket = None
+            self._write_fd = self._event_fd
+        else:
+            self._read_socket, self._write_socket = socket.socketpair()
+            self._write_fd = self._write_socket.fileno()
+            # The read socket might be read by multiple threads. But only one
+            # of them will read the 1 byte sent by the poller thread. This
+            # setting is essential to allow multiple loops in multiple threads
+            # bound to the same poller.
+            self._read_socket.setblocking(False)
         self._loops = {}
 
-        # The read socket might be read by multiple threads. But only one of them will
-        # read the 1 byte sent by the poller thread. This setting is essential to allow
-        # multiple loops in multiple threads bound to the same poller.
-        self._read_socket.setblocking(False)
-
         self._queue = cpp_event_queue()
 
+        self._poller_thread = threading.Thread(target=self._poll_wrapper, daemon=True)
+        self._poller_thread.start()
+
     def bind_loop(self, object loop):
         if loop in self._loops:
             return
         else:
             self._loops[loop] = _BoundEventLoop(loop, self._read_socket, self._handle_events)
 
+    cdef void _signal(self) noexcept nogil:
+        self._wakeups += 1
+        if self._event_fd >= 0:
+            _wakeup_eventfd_write_impl(self._event_fd)
+        else:
+            _unified_socket_write(self._write_fd)
+
     cdef int _poll(self) except -1 nogil:
         cdef grpc_event event
-        cdef CallbackContext *context
+        cdef grpc_event batch[_MAX_POLL_BATCH]
+        cdef int batch_size
+        cdef int index
+        cdef bint was_empty
 
         while not self._shutdown:
             event = grpc_completion_queue_next(self._cq,
@@ -103,12 +130,34 @@ cdef class PollerCompletionQueue(BaseCompletionQueue):
             elif event.type == GRPC_QUEUE_SHUTDOWN:
                 self._shutdown = True
             else:
+                # Takes whatever else Core has ready without blocking, so a
+                # burst of events costs a single wake-up. The queue is not
+                # locked meanwhile, as the loops take the lock with the GIL held.
+                batch[0] = event
+                batch_size = 1
+                while batch_size < _MAX_POLL_BATCH:
+                    event = grpc_completion_queue_next(self._cq,
+                                                       _GPR_INF_PAST,
+                                                       NULL)
+                    if event.type == GRPC_QUEUE_TIMEOUT:
+                        break
+                    elif event.type == GRPC_QUEUE_SHUTDOWN:
+                        self._shutdown = True
+                        break
+                    batch[batch_size] = event
+                    batch_size += 1
                 self._queue_mutex.lock()
-                self._queue.push(event)
+                # A non-empty queue means the loops have been signalled and
+                # have yet to drain it, so the batch needs no signal of its own.
+                was_empty = self._queue.empty()
+                for index in range(batch_size):
+                    self._queue.push(batch[index])
                 self._queue_mutex.unlock()
+                self._events += batch_size
                 if _has_fd_monitoring:
-                    _unified_socket_write(self._write_fd)
-                else:
+                    if was_empty:
+                        self._signal()
+                elif not self._retired:
                     with gil:
                         # Event loops can be paused or killed at any time. So,
                         # instead of delegate to any thread, the polling thread
@@ -116,30 +165,61 @@ cdef class PollerCompletionQueue(BaseCompletionQueue):
                         self._handle_events(None)
         return 0
 
+    def stats(self):
+        """Returns the number of events polled and of wake-ups signalled."""
+        return self._events, self._wakeups
+
     def _poll_wrapper(self):
         with nogil:
             self._poll()
+        if self._retired:
+            self._release()
 
-    cdef shutdown(self):
+    cdef _unbind_loops(self):
         # Removes the socket hook from loops
         for loop in self._loops:
             self._loops.get(loop).close()
 
+    cdef _release(self):
+        grpc_completion_queue_destroy(self._cq)
+
+        # Clean up the write socket
+        if self._event_fd < 0:
+            self._write_socket.close()
+        else:
+            os.close(self._event_fd)
+
+    cdef retire(self):
+        """Shuts the queue down without waiting for its poller thread.
+
+        For queues whose loops are closed: calls left on them may never
+        complete, so the poller thread releases the queue itself once Core
+        has drained it.
+        """
+        self._unbind_loops()
+        if self._event_fd < 0:
+            self._read_socket.close()
+        self._retired = True
+        grpc_completion_queue_shutdown(self._cq)
+
+    cdef shutdown(self):
+        self._unbind_loops()
+
         # Close the read socket to prevent the `_poller_thread` from blocking on a `write` syscall
         # when the Unix-domain socket buffer is full. Once the loops above are closed, the read
         # socket is no longer being read, so close it to avoid `write` syscall hangs.
         #
         # See `sock_alloc_send_pskb` for more details about these `write` syscall hangs.
-        self._read_socket.close()
+        # Writes to a non-blocking eventfd never block, so it stays open until
+        # the poller thread is done with it.
+        if self._event_fd < 0:
+            self._read_socket.close()
 
         # TODO(https://github.com/grpc/grpc/issues/22365) perform graceful shutdown
         grpc_completion_queue_shutdown(self._cq)
         while not self._shutdown:
             self._poller_thread.join(timeout=_POLL_AWAKE_INTERVAL_S)
-        grpc_completion_queue_destroy(self._cq)
-
-        # Clean up the write socket
-        self._write_socket.close()
+        self._release()
 
     def _handle_events(self, object context_loop):
         cdef bytes data
@@ -149,12 +229,17 @@ cdef class PollerCompletionQueue(BaseCompletionQueue):
                 # In case of multiple loops, the read socket might be read by multiple threads.
                 # But only one of them will read the 1 byte sent by the poller thread.
                 # So, we need to handle the case where the socket is already empty.
-                data = self._read_socket.recv(1)
+                if self._event_fd >= 0:
+                    # Reading an eventfd resets its counter.
+                    data = os.read(self._event_fd, 8)
+                else:
+                    data = self._read_socket.recv(1)
             except BlockingIOError:
                 pass
         cdef grpc_event event
         cdef CallbackContext *context
 
+        _drain_released_message_buffers()
         while True:
             self._queue_mutex.lock()
             if self._queue.empty():
@@ -179,3 +264,40 @@ cdef class PollerCompletionQueue(BaseCompletionQueue):
                     <CallbackWrapper>context.callback_wrapper,
                     event.success
                 )
+
+
+cdef void _callback_completion_queue_shutdown_run(
+        grpc_completion_queue_functor* functor,
+        int success) noexcept with gil:
+    cdef _CallbackCompletionQueueShutdown *context = (
+        <_CallbackCompletionQueueShutdown *>functor)
+    (<object>context.done).set()
+
+
+cdef class CallbackCompletionQueue(BaseCompletionQueue):
+    """A completion queue that runs each tag's functor as soon as it completes.
+
+    Core invokes the functors on its own threads, each of which takes the GIL
+    to queue its result for the event loop the tag belongs to. The first
+    result queued for a loop wakes it with loop.call_soon_threadsafe, which
+    writes to the loop's self-pipe; results queued before the loop gets to run
+    them join the same wakeup, as the PollerCompletionQueue batches its events.
+    There is no poller thread, but each completion still costs a GIL
+    acquisition on a Core thread.
+    """
+
+    def __cinit__(self):
+        self._shutdown_done = threading.Event()
+        self._shutdown_context.functor.functor_run = (
+            _callback_completion_queue_shutdown_run)
+        self._shutdown_context.functor.inlineable = 0
+        self._shutdown_context.done = <cpython.PyObject*>self._shutdown_done
+        self._cq = grpc_completion_queue_create_for_callback(
+            &self._shutdown_context.functor,
+            NULL)
+
+    cdef shutdown(self):
+        grpc_completion_queue_shutdown(self._cq)
+        while not self._shutdown_done.wait(timeout=_POLL_AWAKE_INTERVAL_S):
+            pass
+        grpc_completion_queue_destroy(self._cq)
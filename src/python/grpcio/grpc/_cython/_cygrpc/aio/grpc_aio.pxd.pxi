@@ -18,11 +18,17 @@ cdef class _AioState:
     cdef int refcount
     cdef object engine  # AsyncIOEngine
     cdef BaseCompletionQueue cq
+    # Mapping[asyncio.AbstractEventLoop, PollerCompletionQueue], populated by
+    # the PER_LOOP_POLLER engine only.
+    cdef dict loop_cqs
 
 
 cdef grpc_completion_queue *global_completion_queue()
 
 
+cdef grpc_completion_queue *loop_completion_queue(object loop) except NULL
+
+
 cpdef init_grpc_aio()
 
 
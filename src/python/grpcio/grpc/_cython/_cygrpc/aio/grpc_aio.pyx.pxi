@@ -15,7 +15,6 @@
 import enum
 import sys
 
-cdef str _GRPC_ASYNCIO_ENGINE = os.environ.get('GRPC_ASYNCIO_ENGINE', 'poller').upper()
 cdef _AioState _global_aio_state = _AioState()
 
 
@@ -24,6 +23,12 @@ class AsyncIOEngine(enum.Enum):
     # EventEngine project, which will be the only IO platform in Core.
     CUSTOM_IO_MANAGER = 'custom_io_manager'
     POLLER = 'poller'
+    # Like POLLER, but each event loop gets a completion queue and poller
+    # thread of its own, so events never have to be handed between loops.
+    PER_LOOP_POLLER = 'per_loop_poller'
+    # Core runs a callback as each operation completes, which takes the GIL to
+    # hand the result to the awaiting event loop, without a poller thread.
+    CALLBACK = 'callback'
 
 
 cdef _default_asyncio_engine():
@@ -34,6 +39,39 @@ cdef grpc_completion_queue *global_completion_queue():
     return _global_aio_state.cq.c_ptr()
 
 
+cdef _retire_closed_loop_pollers():
+    """Retires the completion queues of loops that have since been closed.
+
+    Must be called with the lock held.
+    """
+    cdef list closed_loops = [
+        loop for loop in _global_aio_state.loop_cqs if loop.is_closed()]
+    for loop in closed_loops:
+        (<PollerCompletionQueue>_global_aio_state.loop_cqs.pop(loop)).retire()
+
+
+cdef PollerCompletionQueue _loop_poller(object loop):
+    cdef PollerCompletionQueue cq = _global_aio_state.loop_cqs.get(loop)
+    if cq is None:
+        with _global_aio_state.lock:
+            cq = _global_aio_state.loop_cqs.get(loop)
+            if cq is None:
+                # asyncio offers no hook on a loop closing, so the pollers of
+                # closed loops are retired as pollers for new loops are made.
+                _retire_closed_loop_pollers()
+                cq = PollerCompletionQueue()
+                cq.bind_loop(loop)
+                _global_aio_state.loop_cqs[loop] = cq
+    return cq
+
+
+cdef grpc_completion_queue *loop_completion_queue(object loop) except NULL:
+    """Returns the completion queue whose events are handled on `loop`."""
+    if _global_aio_state.engine is AsyncIOEngine.PER_LOOP_POLLER:
+        return _loop_poller(loop).c_ptr()
+    return _global_aio_state.cq.c_ptr()
+
+
 cdef class _AioState:
 
     def __cinit__(self):
@@ -41,6 +79,27 @@ cdef class _AioState:
         self.refcount = 0
         self.engine = None
         self.cq = None
+        self.loop_cqs = {}
+
+
+def poller_stats():
+    """Counts the work done by the completion queue pollers of this process.
+
+    Returns:
+      A tuple of the number of Core events polled and the number of times an
+      event loop was signalled to handle them. Batching makes the latter
+      smaller than the former under load.
+    """
+    cdef list cqs = list(_global_aio_state.loop_cqs.values())
+    if isinstance(_global_aio_state.cq, PollerCompletionQueue):
+        cqs.append(_global_aio_state.cq)
+    events = 0
+    wakeups = 0
+    for cq in cqs:
+        cq_events, cq_wakeups = cq.stats()
+        events += cq_events
+        wakeups += cq_wakeups
+    return events, wakeups
 
 
 cdef _initialize_poller():
@@ -51,10 +110,19 @@ cdef _initialize_poller():
     _global_aio_state.cq = PollerCompletionQueue()
 
 
+cdef _initialize_callback():
+    global _threadsafe_callbacks
+    grpc_init()
+    _threadsafe_callbacks = True
+    _global_aio_state.cq = CallbackCompletionQueue()
+
+
 cdef _actual_aio_initialization():
-    # Picks the engine for gRPC AsyncIO Stack
+    # Picks the engine for gRPC AsyncIO Stack. The environment is read on
+    # first use rather than on import, so that a process may pick its engine
+    # after importing grpc.
     _global_aio_state.engine = AsyncIOEngine.__members__.get(
-        _GRPC_ASYNCIO_ENGINE,
+        os.environ.get('GRPC_ASYNCIO_ENGINE', 'poller').upper(),
         _default_asyncio_engine(),
     )
     _LOGGER.debug('Using %s as I/O engine', _global_aio_state.engine)
@@ -62,6 +130,11 @@ cdef _actual_aio_initialization():
     # Initializes the process-level state accordingly
     if _global_aio_state.engine is AsyncIOEngine.POLLER:
         _initialize_poller()
+    elif _global_aio_state.engine is AsyncIOEngine.PER_LOOP_POLLER:
+        # Completion queues are created as loops are bound.
+        grpc_init()
+    elif _global_aio_state.engine is AsyncIOEngine.CALLBACK:
+        _initialize_callback()
     else:
         raise ValueError('Unsupported engine type [%s]' % _global_aio_state.engine)
 
@@ -79,6 +152,14 @@ cdef _actual_aio_shutdown():
     if _global_aio_state.engine is AsyncIOEngine.POLLER:
         (<PollerCompletionQueue>_global_aio_state.cq).shutdown()
         grpc_shutdown()
+    elif _global_aio_state.engine is AsyncIOEngine.PER_LOOP_POLLER:
+        for cq in _global_aio_state.loop_cqs.values():
+            (<PollerCompletionQueue>cq).shutdown()
+        _global_aio_state.loop_cqs.clear()
+        grpc_shutdown()
+    elif _global_aio_state.engine is AsyncIOEngine.CALLBACK:
+        (<CallbackCompletionQueue>_global_aio_state.cq).shutdown()
+        grpc_shutdown()
     else:
         raise ValueError('Unsupported engine type [%s]' % _global_aio_state.engine)
 
@@ -87,6 +168,8 @@ cdef _initialize_per_loop():
     cdef object loop = get_working_loop()
     if _global_aio_state.engine is AsyncIOEngine.POLLER:
         _global_aio_state.cq.bind_loop(loop)
+    elif _global_aio_state.engine is AsyncIOEngine.PER_LOOP_POLLER:
+        _loop_poller(loop)
 
 
 cpdef init_grpc_aio():
@@ -18,8 +18,9 @@ cdef class AioRpcStatus(Exception):
     cdef readonly:
         grpc_status_code _code
         str _details
-        # Per the spec, only client-side status has trailing metadata.
-        tuple _trailing_metadata
+        # Per the spec, only client-side status has trailing metadata. Holds
+        # the operation that received it until the metadata is asked for.
+        object _trailing_metadata
         str _debug_error_string
 
     cpdef grpc_status_code code(self)
@@ -21,7 +21,7 @@ cdef class AioRpcStatus(Exception):
     def __cinit__(self,
                   grpc_status_code code,
                   str details,
-                  tuple trailing_metadata,
+                  object trailing_metadata,
                   str debug_error_string):
         self._code = code
         self._details = details
@@ -35,6 +35,10 @@ cdef class AioRpcStatus(Exception):
         return self._details
 
     cpdef tuple trailing_metadata(self):
+        if isinstance(self._trailing_metadata, ReceiveStatusOnClientOperation):
+            self._trailing_metadata = (
+                <ReceiveStatusOnClientOperation>self._trailing_metadata
+            ).trailing_metadata()
         return self._trailing_metadata
 
     cpdef str debug_error_string(self):
@@ -14,12 +14,17 @@
 
 cdef class _HandlerCallDetails:
     cdef readonly str method
-    cdef readonly tuple invocation_metadata
+    cdef RPCState _rpc_state
 
 
 cdef class RPCState(GrpcCallWrapper):
     cdef grpc_call_details details
     cdef grpc_metadata_array request_metadata
+    cdef tuple _invocation_metadata
+    # The request of a call to a method Core reads the request of along with
+    # the call. See RegisteredMethod.reads_initial_payload.
+    cdef bint reads_initial_payload
+    cdef grpc_byte_buffer *initial_payload
     cdef AioServer server
     # NOTE(lidiz) Under certain corner case, receiving the client close
     # operation won't immediately fail ongoing RECV_MESSAGE operations. Here I
@@ -35,9 +40,12 @@ cdef class RPCState(GrpcCallWrapper):
     cdef object compression_algorithm
     cdef bint disable_next_compression
     cdef object callbacks
+    cdef object registered_method  # Optional[bytes]
+    cdef object registered_handler  # Optional[grpc.RpcMethodHandler]
 
     cdef bytes method(self)
     cdef tuple invocation_metadata(self)
+    cdef bytes take_initial_payload(self)
     cdef void raise_for_termination(self) except *
     cdef int get_write_flag(self)
     cdef Operation create_send_initial_metadata_op_if_not_sent(self)
@@ -48,6 +56,7 @@ cdef class _ServicerContext:
     cdef object _loop  # asyncio.AbstractEventLoop
     cdef object _request_deserializer  # Callable[[bytes], Any]
     cdef object _response_serializer  # Callable[[Any], bytes]
+    cdef list _corked_messages  # Optional[List[bytes]]
 
 
 cdef class _SyncServicerContext:
@@ -88,5 +97,13 @@ cdef class AioServer:
     cdef tuple _interceptors
     cdef object _thread_pool  # concurrent.futures.ThreadPoolExecutor
     cdef _ConcurrentRpcLimiter _limiter
+    cdef int _request_call_depth
+    cdef int _request_calls_outstanding
+    cdef object _request_calls_drained  # asyncio.Future
+    cdef object _request_call_error  # Exception
+    cdef set _rpc_tasks
+    cdef dict _registered_method_handlers  # Mapping[bytes, grpc.RpcMethodHandler]
+    cdef bint _inline_cancellation_listener
+    cdef bint _eager_task_execution
 
     cdef thread_pool(self)
@@ -19,6 +19,8 @@ import functools
 
 
 cdef int _EMPTY_FLAG = 0
+# Tasks can run their first step eagerly since Python 3.12.
+cdef bint _EAGER_START_SUPPORTED = sys.version_info >= (3, 12)
 cdef str _RPC_FINISHED_DETAILS = 'RPC already finished.'
 cdef str _SERVER_STOPPED_DETAILS = 'Server already stopped.'
 
@@ -32,10 +34,15 @@ cdef _augment_metadata(tuple metadata, object compression):
         ),) + metadata
 
 
+@cython.freelist(64)
 cdef class _HandlerCallDetails:
-    def __cinit__(self, str method, tuple invocation_metadata):
+    def __cinit__(self, str method, RPCState rpc_state):
         self.method = method
-        self.invocation_metadata = invocation_metadata
+        self._rpc_state = rpc_state
+
+    @property
+    def invocation_metadata(self):
+        return self._rpc_state.invocation_metadata()
 
 
 class _ServerStoppedError(BaseError):
@@ -50,6 +57,8 @@ cdef class RPCState:
         self.server = server
         grpc_metadata_array_init(&self.request_metadata)
         grpc_call_details_init(&self.details)
+        self.reads_initial_payload = False
+        self.initial_payload = NULL
         self.client_closed = False
         self.abort_exception = None
         self.metadata_sent = False
@@ -61,12 +70,30 @@ cdef class RPCState:
         self.compression_algorithm = None
         self.disable_next_compression = False
         self.callbacks = []
+        self.registered_method = None
+        self.registered_handler = None
 
     cdef bytes method(self):
+        # Core leaves the call details empty for registered methods.
+        if self.registered_method is not None:
+            return self.registered_method
         return _slice_bytes(self.details.method)
 
     cdef tuple invocation_metadata(self):
-        return _metadata(&self.request_metadata)
+        # Decoded the first time it is asked for, since many handlers never
+        # look at it.
+        if self._invocation_metadata is None:
+            self._invocation_metadata = _metadata(&self.request_metadata)
+        return self._invocation_metadata
+
+    cdef bytes take_initial_payload(self):
+        """Returns the request Core read along with the call, if any."""
+        cdef bytes request_raw = None
+        if self.initial_payload != NULL:
+            request_raw = _byte_buffer_message(self.initial_payload)
+            grpc_byte_buffer_destroy(self.initial_payload)
+            self.initial_payload = NULL
+        return request_raw
 
     cdef void raise_for_termination(self) except *:
         """Raise exceptions if RPC is not running.
@@ -107,11 +134,14 @@ cdef class RPCState:
         """Cleans the Core objects."""
         grpc_call_details_destroy(&self.details)
         grpc_metadata_array_destroy(&self.request_metadata)
+        if self.initial_payload != NULL:
+            grpc_byte_buffer_destroy(self.initial_payload)
         if self.call:
             grpc_call_unref(self.call)
         shutdown_grpc_aio()
 
 
+@cython.freelist(64)
 cdef class _ServicerContext:
 
     def __cinit__(self,
@@ -123,6 +153,7 @@ cdef class _ServicerContext:
         self._request_deserializer = request_deserializer
         self._response_serializer = response_serializer
         self._loop = loop
+        self._corked_messages = None
 
     async def read(self):
         cdef bytes raw_message
@@ -140,6 +171,10 @@ cdef class _ServicerContext:
     async def write(self, object message):
         self._rpc_state.raise_for_termination()
 
+        if self._corked_messages is not None:
+            self._corked_messages.append(
+                serialize(self._response_serializer, message))
+            return
         await _send_message(self._rpc_state,
                             serialize(self._response_serializer, message),
                             self._rpc_state.create_send_initial_metadata_op_if_not_sent(),
@@ -147,6 +182,51 @@ cdef class _ServicerContext:
                             self._loop)
         self._rpc_state.metadata_sent = True
 
+    async def write_many(self, object messages):
+        """Writes several messages, submitting them to Core back-to-back.
+
+        All but the last message carry the buffer hint, so that they can be
+        coalesced into fewer writes to the transport.
+        """
+        self._rpc_state.raise_for_termination()
+
+        cdef list serialized_messages = [
+            serialize(self._response_serializer, message)
+            for message in messages
+        ]
+        if self._corked_messages is not None:
+            self._corked_messages.extend(serialized_messages)
+        else:
+            await self._write_serialized(serialized_messages)
+
+    def cork(self):
+        """Buffers the messages of later writes until uncork is called."""
+        if self._corked_messages is None:
+            self._corked_messages = []
+
+    async def uncork(self):
+        """Writes the messages buffered since cork was called."""
+        cdef list serialized_messages = self._corked_messages
+        self._corked_messages = None
+        if serialized_messages:
+            self._rpc_state.raise_for_termination()
+            await self._write_serialized(serialized_messages)
+
+    async def _write_serialized(self, list serialized_messages):
+        cdef int index
+        cdef int write_flag
+        cdef int last_index = len(serialized_messages) - 1
+        for index, serialized_message in enumerate(serialized_messages):
+            write_flag = self._rpc_state.get_write_flag()
+            if index != last_index:
+                write_flag |= GRPC_WRITE_BUFFER_HINT
+            await _send_message(self._rpc_state,
+                                serialized_message,
+                                self._rpc_state.create_send_initial_metadata_op_if_not_sent(),
+                                write_flag,
+                                self._loop)
+            self._rpc_state.metadata_sent = True
+
     async def send_initial_metadata(self, object metadata):
         self._rpc_state.raise_for_termination()
 
@@ -367,9 +447,18 @@ def _is_async_handler(object handler):
     return inspect.isawaitable(handler) or inspect.iscoroutinefunction(handler) or inspect.isasyncgenfunction(handler)
 
 
-async def _find_method_handler(str method, tuple metadata, list generic_handlers,
-                          tuple interceptors):
+async def _find_method_handler(str method, RPCState rpc_state, list generic_handlers,
+                          tuple interceptors, object registered_handler=None):
+    # Registered methods already know their handler, so skip the lookup
+    # unless interceptors need to see the call.
+    if registered_handler is not None and not interceptors:
+        return registered_handler
+
     def query_handlers(handler_call_details):
+        # If the same method have both generic and registered handler,
+        # registered handler will take precedence.
+        if registered_handler is not None:
+            return registered_handler
         for generic_handler in generic_handlers:
             method_handler = generic_handler.service(handler_call_details)
             if method_handler is not None:
@@ -377,7 +466,7 @@ async def _find_method_handler(str method, tuple metadata, list generic_handlers
         return None
 
     cdef _HandlerCallDetails handler_call_details = _HandlerCallDetails(method,
-                                                                        metadata)
+                                                                        rpc_state)
     # interceptor
     if interceptors:
         return await _run_interceptor(iter(interceptors), query_handlers,
@@ -426,7 +515,7 @@ async def _finish_handler_with_unary_response(RPCState rpc_state,
     rpc_state.raise_for_termination()
 
     # Serializes the response message
-    cdef bytes response_raw
+    cdef object response_raw
     if rpc_state.status_code == StatusCode.ok:
         response_raw = serialize(
             response_serializer,
@@ -504,6 +593,10 @@ async def _finish_handler_with_stream_responses(RPCState rpc_state,
 
             await servicer_context.write(response_message)
 
+    # Writes whatever the handler left corked, whichever API it used.
+    if servicer_context._corked_messages is not None:
+        await servicer_context.uncork()
+
     # Raises exception if aborted
     rpc_state.raise_for_termination()
 
@@ -531,7 +624,11 @@ async def _handle_unary_unary_rpc(object method_handler,
                                   RPCState rpc_state,
                                   object loop):
     # Receives request message
-    cdef bytes request_raw = await _receive_message(rpc_state, loop)
+    cdef bytes request_raw
+    if rpc_state.reads_initial_payload:
+        request_raw = rpc_state.take_initial_payload()
+    else:
+        request_raw = await _receive_message(rpc_state, loop)
     if request_raw is None:
         # The RPC was cancelled immediately after start on client side.
         return
@@ -565,7 +662,11 @@ async def _handle_unary_stream_rpc(object method_handler,
                                    RPCState rpc_state,
                                    object loop):
     # Receives request message
-    cdef bytes request_raw = await _receive_message(rpc_state, loop)
+    cdef bytes request_raw
+    if rpc_state.reads_initial_payload:
+        request_raw = rpc_state.take_initial_payload()
+    else:
+        request_raw = await _receive_message(rpc_state, loop)
     if request_raw is None:
         return
 
@@ -739,15 +840,19 @@ async def _handle_exceptions(RPCState rpc_state, object rpc_coro, object loop):
                 traceback.print_exc()
 
 
+cdef _run_done_callbacks(RPCState rpc_state):
+    try:
+        for callback in rpc_state.callbacks:
+            # The _ServicerContext object is bound in add_done_callback.
+            callback()
+    except:
+        _LOGGER.exception('Error in callback for method [%s]', _decode(rpc_state.method()))
+
+
 cdef _add_callback_handler(object rpc_task, RPCState rpc_state):
 
     def handle_callbacks(object unused_task):
-        try:
-            for callback in rpc_state.callbacks:
-                # The _ServicerContext object is bound in add_done_callback.
-                callback()
-        except:
-            _LOGGER.exception('Error in callback for method [%s]', _decode(rpc_state.method()))
+        _run_done_callbacks(rpc_state)
 
     rpc_task.add_done_callback(handle_callbacks)
 
@@ -800,15 +905,72 @@ async def _schedule_rpc_coro(object rpc_coro,
             rpc_state.call = NULL
 
 
+async def _run_rpc_coro(object rpc_coro,
+                        RPCState rpc_state,
+                        object loop):
+    """Runs the RPC coroutine in the current task.
+
+    Unlike _schedule_rpc_coro, cancellation from the client is listened for
+    with a callback on the batch receiving it, instead of in another task.
+    """
+    cdef object rpc_task = asyncio.current_task(loop)
+    cdef ReceiveCloseOnServerOperation op = ReceiveCloseOnServerOperation(_EMPTY_FLAG)
+    cdef _BatchOperationTag batch_operation_tag = _BatchOperationTag(None, (op,), None)
+    handler_running = True
+
+    def handle_client_close(object closed):
+        cdef grpc_event c_event
+        if closed.exception() is not None:
+            return
+        batch_operation_tag.event(c_event)
+        rpc_state.client_closed = True
+        # Same conditions as in _handle_cancellation_from_core.
+        if op.cancelled() and handler_running and not rpc_state.status_sent:
+            rpc_task.cancel()
+
+    # Starts listening before the RPC coroutine runs, so no cancellation is
+    # missed.
+    cdef object client_closed = _start_batch(rpc_state, batch_operation_tag, loop)
+    client_closed.add_done_callback(handle_client_close)
+    try:
+        try:
+            await _handle_exceptions(rpc_state, rpc_coro, loop)
+        except asyncio.CancelledError:
+            # A cancellation from the client that landed after the servicer
+            # method had returned, e.g. while an error status was being sent.
+            _LOGGER.debug('RPC cancelled for servicer method [%s]', _decode(rpc_state.method()))
+        except:
+            _LOGGER.exception('Exception not handled by _handle_exceptions in servicer method [%s]' % (
+                _decode(rpc_state.method()),
+            ))
+            traceback.print_exc()
+        finally:
+            handler_running = False
+            # Done callbacks run as the RPC finishes, as they do when it runs
+            # in a task of its own, not once the client gets around to closing.
+            _run_done_callbacks(rpc_state)
+        try:
+            await client_closed
+        except ExecuteBatchError:
+            # The batch fails when the call is torn down, in which case there
+            # is no cancellation left to listen for.
+            pass
+    finally:
+        if rpc_state.call:
+            grpc_call_unref(rpc_state.call)
+            rpc_state.call = NULL
+
+
 async def _handle_rpc(list generic_handlers, tuple interceptors,
                       RPCState rpc_state, object loop, bint concurrency_exceeded):
     cdef object method_handler
     # Finds the method handler (application logic)
     method_handler = await _find_method_handler(
         rpc_state.method().decode(),
-        rpc_state.invocation_metadata(),
+        rpc_state,
         generic_handlers,
         interceptors,
+        rpc_state.registered_handler,
     )
     if method_handler is None:
         rpc_state.status_sent = True
@@ -884,7 +1046,7 @@ cdef class _ConcurrentRpcLimiter:
         self._active_rpcs = 0
         self.limiter_concurrency_exceeded = False
 
-    def check_before_request_call(self):
+    def check_on_accepted_call(self):
         if self._active_rpcs >= self._maximum_concurrent_rpcs:
             self.limiter_concurrency_exceeded = True
         else:
@@ -902,7 +1064,9 @@ cdef class _ConcurrentRpcLimiter:
 cdef class AioServer:
 
     def __init__(self, loop, thread_pool, generic_handlers, interceptors,
-                 options, maximum_concurrent_rpcs):
+                 options, maximum_concurrent_rpcs, request_call_depth=1,
+                 inline_cancellation_listener=False,
+                 eager_task_execution=False):
         init_grpc_aio()
         # NOTE(lidiz) Core objects won't be deallocated automatically.
         # If AioServer.shutdown is not called, those objects will leak.
@@ -910,7 +1074,7 @@ cdef class AioServer:
         self._server = Server(options, False)
         grpc_server_register_completion_queue(
             self._server.c_server,
-            global_completion_queue(),
+            loop_completion_queue(loop),
             NULL
         )
 
@@ -936,10 +1100,38 @@ cdef class AioServer:
         self._thread_pool = thread_pool
         if maximum_concurrent_rpcs is not None:
             self._limiter = _ConcurrentRpcLimiter(maximum_concurrent_rpcs)
+        if request_call_depth <= 0:
+            raise ValueError("request_call_depth should be a positive integer")
+        self._request_call_depth = request_call_depth
+        self._request_calls_outstanding = 0
+        self._request_calls_drained = None
+        self._request_call_error = None
+        self._rpc_tasks = set()
+        self._registered_method_handlers = {}
+        self._inline_cancellation_listener = inline_cancellation_listener
+        self._eager_task_execution = eager_task_execution
 
     def add_generic_rpc_handlers(self, object generic_rpc_handlers):
         self._generic_handlers.extend(generic_rpc_handlers)
 
+    def add_registered_method_handlers(self, dict method_handlers):
+        """Registers handlers for fully-qualified method names with Core.
+
+        Core matches incoming calls against the registered methods itself, so
+        their handlers are found without querying the generic handlers.
+        """
+        # Can't register method once server started.
+        if self._status != AIO_SERVER_STATUS_READY:
+            return
+        for method, method_handler in method_handlers.items():
+            # Core reads the request of a unary-request method along with the
+            # call, so that its handler starts without awaiting it. Not when
+            # interceptors may substitute a handler that streams requests.
+            self._server.register_method(
+                method,
+                not self._interceptors and not method_handler.request_streaming)
+            self._registered_method_handlers[str_to_bytes(method)] = method_handler
+
     def add_insecure_port(self, address):
         return self._server.add_http2_port(address)
 
@@ -947,74 +1139,165 @@ cdef class AioServer:
         return self._server.add_http2_port(address,
                                            server_credentials._credentials)
 
-    async def _request_call(self):
+    def _request_call(self, bytes method=None):
+        """Requests a call from Core.
+
+        Args:
+          method: The fully-qualified name of a registered method to request a
+            call for, or None to request a call for any other method.
+
+        Returns the RPCState the call will be accepted into, along with a
+        future that resolves once Core has accepted it.
+        """
         cdef grpc_call_error error
+        cdef RegisteredMethod registered_method
         cdef RPCState rpc_state = RPCState(self)
         cdef object future = self._loop.create_future()
         cdef CallbackWrapper wrapper = CallbackWrapper(
             future,
             self._loop,
             REQUEST_CALL_FAILURE_HANDLER)
-        error = grpc_server_request_call(
-            self._server.c_server, &rpc_state.call, &rpc_state.details,
-            &rpc_state.request_metadata,
-            global_completion_queue(), global_completion_queue(),
-            wrapper.c_functor()
-        )
-        if error != GRPC_CALL_OK:
-            raise InternalError("Error in grpc_server_request_call: %s" % error)
+        if method is None:
+            error = grpc_server_request_call(
+                self._server.c_server, &rpc_state.call, &rpc_state.details,
+                &rpc_state.request_metadata,
+                loop_completion_queue(self._loop),
+                loop_completion_queue(self._loop),
+                wrapper.c_functor()
+            )
+            if error != GRPC_CALL_OK:
+                raise InternalError("Error in grpc_server_request_call: %s" % error)
+        else:
+            registered_method = self._server.registered_methods[method]
+            rpc_state.registered_method = method
+            rpc_state.registered_handler = self._registered_method_handlers[method]
+            rpc_state.reads_initial_payload = registered_method.reads_initial_payload
+            error = grpc_server_request_registered_call(
+                self._server.c_server,
+                registered_method.c_registered_method,
+                &rpc_state.call, &rpc_state.details.deadline,
+                &rpc_state.request_metadata,
+                &rpc_state.initial_payload if rpc_state.reads_initial_payload else NULL,
+                loop_completion_queue(self._loop),
+                loop_completion_queue(self._loop),
+                wrapper.c_functor()
+            )
+            if error != GRPC_CALL_OK:
+                raise InternalError("Error in grpc_server_request_registered_call: %s" % error)
 
-        await future
-        return rpc_state
+        return rpc_state, future
 
-    async def _server_main_loop(self,
-                                object server_started):
-        self._server.start(backup_queue=False)
-        cdef RPCState rpc_state
-        server_started.set_result(True)
-        rpc_tasks = set()
+    def _arm_request_call(self, bytes method=None):
+        """Requests a call from Core and re-arms it once Core accepts it."""
+        rpc_state, accepted = self._request_call(method)
+        self._request_calls_outstanding += 1
+        accepted.add_done_callback(
+            lambda future: self._on_call_accepted(rpc_state, future))
 
-        while True:
-            # When shutdown begins, no more new connections.
-            if self._status != AIO_SERVER_STATUS_RUNNING:
-                break
+    def _on_call_accepted(self, RPCState rpc_state, object accepted):
+        """Dispatches an accepted call.
 
-            concurrency_exceeded = False
-            if self._limiter is not None:
-                self._limiter.check_before_request_call()
-                concurrency_exceeded = self._limiter.limiter_concurrency_exceeded
-
-            # Accepts new request from Core
-            rpc_state = await self._request_call()
-
-            # Creates the dedicated RPC coroutine. If we schedule it right now,
-            # there is no guarantee if the cancellation listening coroutine is
-            # ready or not. So, we should control the ordering by scheduling
-            # the coroutine onto event loop inside of the cancellation
-            # coroutine.
-            rpc_coro = _handle_rpc(self._generic_handlers,
-                                   self._interceptors,
-                                   rpc_state,
-                                   self._loop,
-                                   concurrency_exceeded)
-
-            # Fires off a task that listens on the cancellation from client.
-            rpc_task = self._loop.create_task(
-                _schedule_rpc_coro(
-                    rpc_coro,
-                    rpc_state,
-                    self._loop
-                ),
-                name="rpc_task",
+        Runs as the done callback of the accepted future, so a new call is
+        requested from Core before any RPC coroutine gets scheduled, instead
+        of whenever the serving task is next resumed.
+        """
+        self._request_calls_outstanding -= 1
+        error = accepted.exception()
+        if error is None:
+            # When shutdown begins, no more new connections.
+            if self._status == AIO_SERVER_STATUS_RUNNING:
+                try:
+                    self._arm_request_call(rpc_state.registered_method)
+                except InternalError as internal_error:
+                    # Fails the serving task, so that the crash handler
+                    # shuts the server down rather than have it keep serving
+                    # with one request fewer than configured.
+                    self._request_call_error = internal_error
+                    if not self._request_calls_drained.done():
+                        self._request_calls_drained.set_result(None)
+            self._dispatch_rpc(rpc_state)
+        else:
+            # Core fails the outstanding requests once shutdown begins. The
+            # others may already be accepted, so keep waiting for them.
+            self._request_call_error = error
+
+        if (self._request_calls_outstanding == 0 and
+                not self._request_calls_drained.done()):
+            self._request_calls_drained.set_result(None)
+
+    def _dispatch_rpc(self, RPCState rpc_state):
+        concurrency_exceeded = False
+        if self._limiter is not None:
+            self._limiter.check_on_accepted_call()
+            concurrency_exceeded = self._limiter.limiter_concurrency_exceeded
+
+        # Creates the dedicated RPC coroutine. If we schedule it right now,
+        # there is no guarantee if the cancellation listening coroutine is
+        # ready or not. So, we should control the ordering by scheduling
+        # the coroutine onto event loop inside of the cancellation
+        # coroutine.
+        rpc_coro = _handle_rpc(self._generic_handlers,
+                               self._interceptors,
+                               rpc_state,
+                               self._loop,
+                               concurrency_exceeded)
+
+        if self._inline_cancellation_listener:
+            rpc_coro = _run_rpc_coro(
+                rpc_coro,
+                rpc_state,
+                self._loop
             )
+        else:
+            # Listens on the cancellation from client before scheduling the
+            # RPC coroutine.
+            rpc_coro = _schedule_rpc_coro(
+                rpc_coro,
+                rpc_state,
+                self._loop
+            )
+
+        if self._eager_task_execution and _EAGER_START_SUPPORTED:
+            # Runs the task until it first suspends right away, rather than on
+            # a later iteration of the event loop. For a registered method with
+            # a unary request, whose request Core delivers along with the call,
+            # and with the inline cancellation listener, a coroutine handler
+            # that does not suspend has its response submitted to Core before
+            # this returns. Other RPCs first suspend receiving their request.
+            rpc_task = asyncio.Task(rpc_coro, loop=self._loop,
+                                    name="rpc_task", eager_start=True)
+        else:
+            rpc_task = self._loop.create_task(rpc_coro, name="rpc_task")
+
+        # loop.create_task only holds a weakref to the task.
+        # Maintain reference to tasks to avoid garbage collection.
+        self._rpc_tasks.add(rpc_task)
+        rpc_task.add_done_callback(self._rpc_tasks.discard)
+
+        if self._limiter is not None and not concurrency_exceeded:
+            self._limiter.decrease_once_finished(rpc_task)
 
-            # loop.create_task only holds a weakref to the task.
-            # Maintain reference to tasks to avoid garbage collection.
-            rpc_tasks.add(rpc_task)
-            rpc_task.add_done_callback(rpc_tasks.discard)
+    async def _server_main_loop(self,
+                                object server_started):
+        self._server.start(backup_queue=False)
+        server_started.set_result(True)
 
-            if self._limiter is not None and not concurrency_exceeded:
-                self._limiter.decrease_once_finished(rpc_task)
+        # Keeps several calls requested from Core at once, so that a burst of
+        # incoming RPCs does not wait on the event loop to re-arm a single
+        # request. Each call is re-armed as soon as Core accepts it. Registered
+        # methods get their own requests, which Core only matches against
+        # calls for that method.
+        self._request_calls_drained = self._loop.create_future()
+        for _ in range(self._request_call_depth):
+            for method in self._registered_method_handlers:
+                self._arm_request_call(method)
+            self._arm_request_call()
+
+        # Resolves once every outstanding request has completed, which only
+        # happens after the server stops re-arming them.
+        await self._request_calls_drained
+        if self._request_call_error is not None:
+            raise self._request_call_error
 
     def _serving_task_crash_handler(self, object task):
         """Shutdown the server immediately if unexpectedly exited."""
@@ -1049,7 +1332,7 @@ cdef class AioServer:
         # The shutdown callback won't be called until there is no live RPC.
         grpc_server_shutdown_and_notify(
             self._server.c_server,
-            global_completion_queue(),
+            loop_completion_queue(self._loop),
             self._shutdown_callback_wrapper.c_functor())
 
         # Ensures the serving task (coroutine) exits.
@@ -578,6 +578,29 @@ cdef class Channel:
       self, grpc_connectivity_state last_observed_state, object deadline):
     return _watch_connectivity_state(self._state, last_observed_state, deadline)
 
+  def watch_connectivity_state_on(
+      self, grpc_connectivity_state last_observed_state, object deadline,
+      CompletionQueue completion_queue, object tag):
+    """Starts watching the connectivity state without blocking.
+
+    A ConnectivityEvent carrying tag is posted to completion_queue once the
+    state differs from last_observed_state or the deadline passes, which lets
+    a single thread watch many channels. Closing the channel moves it to the
+    SHUTDOWN state and so completes any pending watch.
+    """
+    cdef _ConnectivityTag connectivity_tag = _ConnectivityTag(tag)
+    with self._state.condition:
+      if self._state.open:
+        cpython.Py_INCREF(connectivity_tag)
+        grpc_channel_watch_connectivity_state(
+            self._state.c_channel, last_observed_state,
+            _timespec_from_time(deadline),
+            completion_queue.c_completion_queue,
+            <cpython.PyObject *>connectivity_tag)
+      else:
+        raise ValueError(
+            'Cannot monitor channel state: %s' % self._state.closed_reason)
+
   def close(self, code, details):
     _close(self, code, details, False)
 
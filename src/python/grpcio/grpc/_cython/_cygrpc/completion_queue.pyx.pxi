@@ -63,6 +63,7 @@ cdef grpc_event _next(grpc_completion_queue *c_completion_queue, deadline) excep
 
 cdef _interpret_event(grpc_event c_event):
   cdef _Tag tag
+  _drain_released_message_buffers()
   if c_event.type == GRPC_QUEUE_TIMEOUT:
     # TODO(ericgribkoff) Do not coopt ConnectivityEvent here.
     return None, ConnectivityEvent(GRPC_QUEUE_TIMEOUT, False, None)
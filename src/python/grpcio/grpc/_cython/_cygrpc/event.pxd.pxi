@@ -29,7 +29,8 @@ cdef class RequestCallEvent(BaseEvent):
   cdef readonly object tag
   cdef readonly Call call
   cdef readonly CallDetails call_details
-  cdef readonly tuple invocation_metadata
+  cdef tuple _raw_invocation_metadata
+  cdef tuple _invocation_metadata
 
 
 cdef class BatchOperationEvent(BaseEvent):
@@ -25,13 +25,20 @@ cdef class RequestCallEvent(BaseEvent):
 
   def __cinit__(
       self, grpc_completion_type completion_type, bint success, object tag,
-      Call call, CallDetails call_details, tuple invocation_metadata):
+      Call call, CallDetails call_details, tuple raw_invocation_metadata):
     self.completion_type = completion_type
     self.success = success
     self.tag = tag
     self.call = call
     self.call_details = call_details
-    self.invocation_metadata = invocation_metadata
+    self._raw_invocation_metadata = raw_invocation_metadata
+
+  @property
+  def invocation_metadata(self):
+    if self._invocation_metadata is None:
+      self._invocation_metadata = _decode_metadata(
+          self._raw_invocation_metadata)
+    return self._invocation_metadata
 
 
 cdef class BatchOperationEvent(BaseEvent):
@@ -98,6 +98,7 @@ cdef extern from "grpc/byte_buffer_reader.h":
 cdef extern from "grpc/impl/codegen/grpc_types.h":
     ctypedef struct grpc_completion_queue_functor:
         void (*functor_run)(grpc_completion_queue_functor*, int);
+        int inlineable;
 
 
 cdef extern from "grpc/grpc.h":
@@ -113,6 +114,8 @@ cdef extern from "grpc/grpc.h":
   grpc_slice grpc_slice_new(void *p, size_t len, void (*destroy)(void *)) nogil
   grpc_slice grpc_slice_new_with_len(
       void *p, size_t len, void (*destroy)(void *, size_t)) nogil
+  grpc_slice grpc_slice_new_with_user_data(
+      void *p, size_t len, void (*destroy)(void *), void *user_data) nogil
   grpc_slice grpc_slice_malloc(size_t length) nogil
   grpc_slice grpc_slice_from_copied_string(const char *source) nogil
   grpc_slice grpc_slice_from_copied_buffer(const char *source, size_t len) nogil
@@ -168,6 +171,8 @@ cdef extern from "grpc/grpc.h":
   int grpc_byte_buffer_reader_next(grpc_byte_buffer_reader *reader,
                                    grpc_slice *slice) nogil
   void grpc_byte_buffer_reader_destroy(grpc_byte_buffer_reader *reader) nogil
+  grpc_slice grpc_byte_buffer_reader_readall(
+      grpc_byte_buffer_reader *reader) nogil
 
   ctypedef enum grpc_status_code:
     GRPC_STATUS_OK
@@ -23,4 +23,20 @@ cdef void _release_c_metadata(grpc_metadata *c_metadata, int count) except *
 cdef tuple _metadatum(grpc_slice key_slice, grpc_slice value_slice)
 
 
+cdef tuple _decode_metadatum(bytes key, bytes value)
+
+
 cdef tuple _metadata(grpc_metadata_array *c_metadata_array)
+
+
+cdef tuple _raw_metadata(grpc_metadata_array *c_metadata_array)
+
+
+cdef tuple _decode_metadata(tuple raw_metadata)
+
+
+cdef class PreparedMetadata:
+
+  cdef grpc_metadata *c_metadata
+  cdef size_t c_count
+  cdef tuple _metadata
@@ -26,9 +26,23 @@ _Metadatum = collections.namedtuple('_Metadatum', ('key', 'value',))
 
 cdef void _store_c_metadata(
     metadata, grpc_metadata **c_metadata, size_t *c_count) except *:
+  cdef PreparedMetadata prepared_metadata
   if metadata is None:
     c_count[0] = 0
     c_metadata[0] = NULL
+  elif type(metadata) is PreparedMetadata:
+    prepared_metadata = <PreparedMetadata>metadata
+    c_count[0] = prepared_metadata.c_count
+    if prepared_metadata.c_count == 0:
+      c_metadata[0] = NULL
+    else:
+      c_metadata[0] = <grpc_metadata *>gpr_malloc(
+          prepared_metadata.c_count * sizeof(grpc_metadata))
+      for index in range(prepared_metadata.c_count):
+        c_metadata[0][index].key = grpc_slice_ref(
+            prepared_metadata.c_metadata[index].key)
+        c_metadata[0][index].value = grpc_slice_ref(
+            prepared_metadata.c_metadata[index].value)
   else:
     metadatum_count = len(metadata)
     if metadatum_count == 0:
@@ -61,6 +75,10 @@ cdef void _release_c_metadata(grpc_metadata *c_metadata, int count) except *:
 cdef tuple _metadatum(grpc_slice key_slice, grpc_slice value_slice):
   cdef bytes key = _slice_bytes(key_slice)
   cdef bytes value = _slice_bytes(value_slice)
+  return _decode_metadatum(key, value)
+
+
+cdef tuple _decode_metadatum(bytes key, bytes value):
   return <tuple>_Metadatum(
       _decode(key), value if key[-4:] == b'-bin' else _decode(value))
 
@@ -71,3 +89,62 @@ cdef tuple _metadata(grpc_metadata_array *c_metadata_array):
           c_metadata_array.metadata[index].key,
           c_metadata_array.metadata[index].value)
       for index in range(c_metadata_array.count))
+
+
+cdef tuple _raw_metadata(grpc_metadata_array *c_metadata_array):
+  """Copies received metadata out of Core, leaving it undecoded."""
+  return tuple(
+      (_slice_bytes(c_metadata_array.metadata[index].key),
+       _slice_bytes(c_metadata_array.metadata[index].value))
+      for index in range(c_metadata_array.count))
+
+
+cdef tuple _decode_metadata(tuple raw_metadata):
+  """Decodes metadata copied out of Core by _raw_metadata."""
+  return tuple(_decode_metadatum(key, value) for key, value in raw_metadata)
+
+
+cdef class PreparedMetadata:
+  """Metadata encoded once for Core, to be sent on any number of calls.
+
+  Sending metadata normally encodes every key and value each time it is
+  sent. A PreparedMetadata holds them already encoded, and otherwise behaves
+  as the sequence of (key, value) pairs it was made from.
+  """
+
+  def __cinit__(self, metadata):
+    self.c_metadata = NULL
+    self.c_count = 0
+    self._metadata = tuple(tuple(metadatum) for metadatum in metadata)
+    _store_c_metadata(self._metadata, &self.c_metadata, &self.c_count)
+
+  def __len__(self):
+    return len(self._metadata)
+
+  def __iter__(self):
+    return iter(self._metadata)
+
+  def __getitem__(self, index):
+    return self._metadata[index]
+
+  def __eq__(self, other):
+    if isinstance(other, PreparedMetadata):
+      return self._metadata == (<PreparedMetadata>other)._metadata
+    if isinstance(other, tuple):
+      return self._metadata == other
+    return NotImplemented
+
+  def __hash__(self):
+    return hash(self._metadata)
+
+  def __add__(self, other):
+    return self._metadata + tuple(other)
+
+  def __radd__(self, other):
+    return tuple(other) + self._metadata
+
+  def __repr__(self):
+    return 'PreparedMetadata({!r})'.format(self._metadata)
+
+  def __dealloc__(self):
+    _release_c_metadata(self.c_metadata, self.c_count)
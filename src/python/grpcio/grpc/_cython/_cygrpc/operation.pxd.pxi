@@ -33,9 +33,15 @@ cdef class SendInitialMetadataOperation(Operation):
   cdef void un_c(self) except *
 
 
+cdef void _drain_released_message_buffers() except *
+
+
+cdef grpc_slice _message_slice(object message) except *
+
+
 cdef class SendMessageOperation(Operation):
 
-  cdef readonly bytes _message
+  cdef readonly object _message
   cdef readonly int _flags
   cdef grpc_byte_buffer *_c_message_byte_buffer
 
@@ -68,6 +74,7 @@ cdef class SendStatusFromServerOperation(Operation):
 cdef class ReceiveInitialMetadataOperation(Operation):
 
   cdef readonly int _flags
+  cdef tuple _raw_initial_metadata
   cdef tuple _initial_metadata
   cdef grpc_metadata_array _c_initial_metadata
 
@@ -75,16 +82,32 @@ cdef class ReceiveInitialMetadataOperation(Operation):
   cdef void un_c(self) except *
 
 
+cdef bytes _byte_buffer_message(grpc_byte_buffer *c_message_byte_buffer)
+
+
 cdef class ReceiveMessageOperation(Operation):
 
   cdef readonly int _flags
   cdef grpc_byte_buffer *_c_message_byte_buffer
-  cdef bytes _message
+  cdef object _message
 
   cdef void c(self) except *
   cdef void un_c(self) except *
 
 
+cdef class ReceivedMessage:
+
+  cdef grpc_slice _c_slice
+
+  @staticmethod
+  cdef ReceivedMessage from_byte_buffer(grpc_byte_buffer *c_byte_buffer)
+
+
+cdef class ReceiveMessageBufferOperation(ReceiveMessageOperation):
+
+  cdef void un_c(self) except *
+
+
 cdef class ReceiveStatusOnClientOperation(Operation):
 
   cdef readonly int _flags
@@ -92,6 +115,7 @@ cdef class ReceiveStatusOnClientOperation(Operation):
   cdef grpc_status_code _c_code
   cdef grpc_slice _c_details
   cdef const char* _c_error_string
+  cdef tuple _raw_trailing_metadata
   cdef tuple _trailing_metadata
   cdef object _code
   cdef str _details
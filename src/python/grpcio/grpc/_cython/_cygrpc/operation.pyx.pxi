@@ -46,11 +46,130 @@ cdef class SendInitialMetadataOperation(Operation):
         self._c_initial_metadata, self._c_initial_metadata_count)
 
 
+# Messages at least this large are sent straight from the memory of the object
+# they were given in. Below it, copying them into Core costs less than keeping
+# the object's buffer exported until Core releases it.
+cdef Py_ssize_t _ZERO_COPY_SEND_THRESHOLD = 16 * 1024
+
+
+cdef extern from "Python.h":
+  int Py_IsInitialized() nogil
+  int Py_AddPendingCall(int (*func)(void *) noexcept, void *arg) nogil
+
+
+# Buffers of zero-copy slices that Core has released. Core may release a slice
+# on one of its own threads, where taking the GIL to release the buffer could
+# stall Core behind Python; the buffers are instead queued here. They are
+# released by the next Python thread to send a message or to handle a
+# completion queue event and, so that a buffer is never held indefinitely when
+# no such thread comes along, by a pending call that the interpreter runs on
+# the main thread once the queue becomes non-empty.
+cdef queue[void*] g_released_message_buffers
+cdef mutex g_released_message_buffers_mu
+cdef bint g_released_message_buffers_drain_pending = False
+
+
+cdef int _drain_released_message_buffers_pending(void *unused) noexcept:
+  _drain_released_message_buffers()
+  return 0
+
+
+cdef void _release_message_buffer(void *user_data) noexcept nogil:
+  global g_released_message_buffers_drain_pending
+  cdef bint schedule_drain
+  g_released_message_buffers_mu.lock()
+  g_released_message_buffers.push(user_data)
+  schedule_drain = not g_released_message_buffers_drain_pending
+  g_released_message_buffers_drain_pending = True
+  g_released_message_buffers_mu.unlock()
+  if schedule_drain and Py_IsInitialized() and Py_AddPendingCall(
+      _drain_released_message_buffers_pending, NULL) != 0:
+    # The interpreter's pending calls are full; the buffer is left to the next
+    # drain, and the next release tries to schedule one again.
+    g_released_message_buffers_mu.lock()
+    g_released_message_buffers_drain_pending = False
+    g_released_message_buffers_mu.unlock()
+
+
+cdef void _drain_released_message_buffers() except *:
+  global g_released_message_buffers_drain_pending
+  cdef queue[void*] released
+  cdef Py_buffer *view
+  g_released_message_buffers_mu.lock()
+  if g_released_message_buffers.empty():
+    g_released_message_buffers_mu.unlock()
+    return
+  while not g_released_message_buffers.empty():
+    released.push(g_released_message_buffers.front())
+    g_released_message_buffers.pop()
+  g_released_message_buffers_drain_pending = False
+  g_released_message_buffers_mu.unlock()
+  while not released.empty():
+    view = <Py_buffer *>released.front()
+    released.pop()
+    cpython.PyBuffer_Release(view)
+    gpr_free(view)
+
+
+cdef grpc_slice _message_slice(object message) except *:
+  """Makes a slice of a message given as any object supporting the buffer
+  protocol, e.g. bytes, bytearray, memoryview or mmap.
+
+  A large message's slice references the object's memory rather than a copy
+  of it, and keeps its buffer exported until Core releases the slice and the
+  released buffers are next drained. The memory must therefore
+  not be modified until the message has been sent.
+  """
+  cdef grpc_slice message_slice
+  _drain_released_message_buffers()
+  cdef Py_buffer *view = <Py_buffer *>gpr_malloc(sizeof(Py_buffer))
+  try:
+    cpython.PyObject_GetBuffer(message, view, cpython.PyBUF_SIMPLE)
+  except:
+    gpr_free(view)
+    raise
+  if view.len < _ZERO_COPY_SEND_THRESHOLD:
+    message_slice = grpc_slice_from_copied_buffer(
+        <const char *>view.buf, view.len)
+    cpython.PyBuffer_Release(view)
+    gpr_free(view)
+    return message_slice
+  return grpc_slice_new_with_user_data(
+      view.buf, view.len, _release_message_buffer, view)
+
+
+cdef grpc_byte_buffer *_scattered_message_byte_buffer(tuple chunks) except NULL:
+  """Makes a byte buffer of one slice per chunk of a message, so that a
+  message given in several pieces is sent without first joining them.
+  """
+  cdef size_t chunk_count = len(chunks)
+  cdef size_t made_count = 0
+  cdef size_t index
+  cdef grpc_slice *message_slices
+  cdef grpc_byte_buffer *message_byte_buffer
+  if chunk_count == 0:
+    return grpc_raw_byte_buffer_create(NULL, 0)
+  message_slices = <grpc_slice *>gpr_malloc(sizeof(grpc_slice) * chunk_count)
+  try:
+    for chunk in chunks:
+      message_slices[made_count] = _message_slice(chunk)
+      made_count += 1
+    message_byte_buffer = grpc_raw_byte_buffer_create(
+        message_slices, chunk_count)
+  finally:
+    for index in range(made_count):
+      grpc_slice_unref(message_slices[index])
+    gpr_free(message_slices)
+  return message_byte_buffer
+
+
 cdef class SendMessageOperation(Operation):
 
-  def __cinit__(self, bytes message, int flags):
+  def __cinit__(self, object message, int flags):
     if message is None:
       self._message = b''
+    elif isinstance(message, list):
+      self._message = tuple(message)
     else:
       self._message = message
     self._flags = flags
@@ -61,15 +180,22 @@ cdef class SendMessageOperation(Operation):
   cdef void c(self) except *:
     self.c_op.type = GRPC_OP_SEND_MESSAGE
     self.c_op.flags = self._flags
-    cdef grpc_slice message_slice = grpc_slice_from_copied_buffer(
-        self._message, len(self._message))
-    self._c_message_byte_buffer = grpc_raw_byte_buffer_create(
-        &message_slice, 1)
-    grpc_slice_unref(message_slice)
+    cdef grpc_slice message_slice
+    if isinstance(self._message, tuple):
+      self._c_message_byte_buffer = _scattered_message_byte_buffer(
+          self._message)
+    else:
+      message_slice = _message_slice(self._message)
+      self._c_message_byte_buffer = grpc_raw_byte_buffer_create(
+          &message_slice, 1)
+      grpc_slice_unref(message_slice)
     self.c_op.data.send_message.send_message = self._c_message_byte_buffer
 
   cdef void un_c(self) except *:
     grpc_byte_buffer_destroy(self._c_message_byte_buffer)
+    # Destroying the byte buffer usually drops the last reference to its
+    # slices, so their buffers can be released right away.
+    _drain_released_message_buffers()
 
 
 cdef class SendCloseFromClientOperation(Operation):
@@ -135,13 +261,36 @@ cdef class ReceiveInitialMetadataOperation(Operation):
         &self._c_initial_metadata)
 
   cdef void un_c(self) except *:
-    self._initial_metadata = _metadata(&self._c_initial_metadata)
+    # Decoding is deferred until the metadata is first asked for, since
+    # many calls never look at it.
+    self._raw_initial_metadata = _raw_metadata(&self._c_initial_metadata)
     grpc_metadata_array_destroy(&self._c_initial_metadata)
 
   def initial_metadata(self):
+    if self._initial_metadata is None and self._raw_initial_metadata is not None:
+      self._initial_metadata = _decode_metadata(self._raw_initial_metadata)
     return self._initial_metadata
 
 
+cdef bytes _byte_buffer_message(grpc_byte_buffer *c_message_byte_buffer):
+  """Copies a received message out of its byte buffer, or returns None if the
+  buffer cannot be read. The buffer is left for the caller to destroy.
+  """
+  cdef grpc_byte_buffer_reader message_reader
+  cdef grpc_slice message_slice
+  cdef size_t message_slice_length
+  cdef list chunks = []
+  if not grpc_byte_buffer_reader_init(&message_reader, c_message_byte_buffer):
+    return None
+  while grpc_byte_buffer_reader_next(&message_reader, &message_slice):
+    message_slice_length = grpc_slice_length(message_slice)
+    if message_slice_length > 0:
+      chunks.append((<char *>grpc_slice_start_ptr(message_slice))[:message_slice_length])
+    grpc_slice_unref(message_slice)
+  grpc_byte_buffer_reader_destroy(&message_reader)
+  return b"".join(chunks)
+
+
 cdef class ReceiveMessageOperation(Operation):
 
   def __cinit__(self, flags):
@@ -157,26 +306,8 @@ cdef class ReceiveMessageOperation(Operation):
         &self._c_message_byte_buffer)
 
   cdef void un_c(self) except *:
-    cdef grpc_byte_buffer_reader message_reader
-    cdef bint message_reader_status
-    cdef grpc_slice message_slice
-    cdef size_t message_slice_length
-    cdef list chunks = []
-
     if self._c_message_byte_buffer != NULL:
-      message_reader_status = grpc_byte_buffer_reader_init(
-          &message_reader, self._c_message_byte_buffer)
-      if message_reader_status:
-        while grpc_byte_buffer_reader_next(&message_reader, &message_slice):
-          message_slice_length = grpc_slice_length(message_slice)
-          if message_slice_length > 0:
-            chunks.append((<char *>grpc_slice_start_ptr(message_slice))[:message_slice_length])
-          grpc_slice_unref(message_slice)
-
-        grpc_byte_buffer_reader_destroy(&message_reader)
-        self._message = b"".join(chunks)
-      else:
-        self._message = None
+      self._message = _byte_buffer_message(self._c_message_byte_buffer)
       grpc_byte_buffer_destroy(self._c_message_byte_buffer)
     else:
       self._message = None
@@ -185,6 +316,76 @@ cdef class ReceiveMessageOperation(Operation):
     return self._message
 
 
+cdef class ReceivedMessage:
+  """A received message, exposed through the buffer protocol without copying.
+
+  The message's bytes are owned by a Core slice which lives as long as this
+  object does. When Core delivered the message as a single slice, as it does
+  for most messages, that slice is referenced as-is; otherwise the slices are
+  coalesced into one.
+  """
+
+  def __cinit__(self):
+    self._c_slice = grpc_empty_slice()
+
+  @staticmethod
+  cdef ReceivedMessage from_byte_buffer(grpc_byte_buffer *c_byte_buffer):
+    cdef grpc_byte_buffer_reader message_reader
+    cdef grpc_slice first_slice
+    cdef grpc_slice next_slice
+    cdef ReceivedMessage received_message
+
+    if not grpc_byte_buffer_reader_init(&message_reader, c_byte_buffer):
+      return None
+    received_message = ReceivedMessage.__new__(ReceivedMessage)
+    if grpc_byte_buffer_reader_next(&message_reader, &first_slice):
+      if not grpc_byte_buffer_reader_next(&message_reader, &next_slice):
+        # The common case: the whole message is in one slice, which is
+        # referenced rather than copied.
+        grpc_slice_unref(received_message._c_slice)
+        received_message._c_slice = first_slice
+        grpc_byte_buffer_reader_destroy(&message_reader)
+        return received_message
+      grpc_slice_unref(first_slice)
+      grpc_slice_unref(next_slice)
+      grpc_byte_buffer_reader_destroy(&message_reader)
+      grpc_byte_buffer_reader_init(&message_reader, c_byte_buffer)
+      grpc_slice_unref(received_message._c_slice)
+      received_message._c_slice = grpc_byte_buffer_reader_readall(
+          &message_reader)
+    grpc_byte_buffer_reader_destroy(&message_reader)
+    return received_message
+
+  def __getbuffer__(self, Py_buffer *buffer, int flags):
+    cpython.PyBuffer_FillInfo(
+        buffer, self, grpc_slice_start_ptr(self._c_slice),
+        grpc_slice_length(self._c_slice), 1, flags)
+
+  def __releasebuffer__(self, Py_buffer *buffer):
+    pass
+
+  def __len__(self):
+    return grpc_slice_length(self._c_slice)
+
+  def __bytes__(self):
+    return _slice_bytes(self._c_slice)
+
+  def __dealloc__(self):
+    grpc_slice_unref(self._c_slice)
+
+
+cdef class ReceiveMessageBufferOperation(ReceiveMessageOperation):
+  """Receives a message as a ReceivedMessage rather than as bytes."""
+
+  cdef void un_c(self) except *:
+    if self._c_message_byte_buffer != NULL:
+      self._message = ReceivedMessage.from_byte_buffer(
+          self._c_message_byte_buffer)
+      grpc_byte_buffer_destroy(self._c_message_byte_buffer)
+    else:
+      self._message = None
+
+
 cdef class ReceiveStatusOnClientOperation(Operation):
 
   def __cinit__(self, flags):
@@ -207,7 +408,7 @@ cdef class ReceiveStatusOnClientOperation(Operation):
         &self._c_error_string)
 
   cdef void un_c(self) except *:
-    self._trailing_metadata = _metadata(&self._c_trailing_metadata)
+    self._raw_trailing_metadata = _raw_metadata(&self._c_trailing_metadata)
     grpc_metadata_array_destroy(&self._c_trailing_metadata)
     self._code = self._c_code
     self._details = _decode(_slice_bytes(self._c_details))
@@ -219,6 +420,9 @@ cdef class ReceiveStatusOnClientOperation(Operation):
       self._error_string = ""
 
   def trailing_metadata(self):
+    if (self._trailing_metadata is None and
+        self._raw_trailing_metadata is not None):
+      self._trailing_metadata = _decode_metadata(self._raw_trailing_metadata)
     return self._trailing_metadata
 
   def code(self):
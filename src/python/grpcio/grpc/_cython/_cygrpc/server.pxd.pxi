@@ -42,3 +42,4 @@ cdef class RegisteredMethod:
 
   cdef void *c_registered_method
   cdef bytes method
+  cdef readonly bint reads_initial_payload
@@ -15,17 +15,22 @@
 
 cdef class RegisteredMethod:
 
-  def __cinit__(self, bytes method, uintptr_t server):
+  def __cinit__(self, bytes method, uintptr_t server, bint read_initial_payload):
     self.method = method
     cpython.Py_INCREF(self.method)
+    self.reads_initial_payload = read_initial_payload
     cdef const char *c_method = <const char *>self.method
     cdef grpc_server *c_server = <grpc_server *>server
-    # TODO(xuanwn): Consider use GRPC_SRM_PAYLOAD_READ_INITIAL_BYTE_BUFFER for unary request
-    # as optimization.
+    # Core reads the request of a method with a unary request along with the
+    # call when asked to, and then requires a payload pointer when the call is
+    # requested.
+    cdef grpc_server_register_method_payload_handling payload_handling = (
+        GRPC_SRM_PAYLOAD_READ_INITIAL_BYTE_BUFFER if read_initial_payload
+        else GRPC_SRM_PAYLOAD_NONE)
     # Note that in stubs method is not bound to any host, thus we set host as NULL.
     with nogil:
       self.c_registered_method = grpc_server_register_method(c_server,
-      c_method, NULL, GRPC_SRM_PAYLOAD_NONE, 0)
+      c_method, NULL, payload_handling, 0)
 
   def __dealloc__(self):
     # c_registered_method should have the same lifetime as Cython Server since the method
@@ -103,7 +108,8 @@ cdef class Server:
     cpython.Py_INCREF(request_call_tag)
     cdef cpython.PyObject *c_request_call_tag = <cpython.PyObject *>request_call_tag
     cdef RegisteredMethod registered_method = self.registered_methods[method]
-    # optional_payload is set to NULL because we use GRPC_SRM_PAYLOAD_NONE for all method.
+    # optional_payload is set to NULL because the sync server registers all
+    # methods with GRPC_SRM_PAYLOAD_NONE.
     cdef grpc_call_error c_call_error = GRPC_CALL_OK
     with nogil:
       c_call_error = grpc_server_request_registered_call(
@@ -145,12 +151,23 @@ cdef class Server:
           self.c_server, queue.c_completion_queue, NULL)
     self.registered_completion_queues.append(queue)
 
-  def register_method(self, str fully_qualified_method):
+  def register_method(self, str fully_qualified_method,
+                      bint read_initial_payload=False):
+    """Registers a method with Core.
+
+    Args:
+      fully_qualified_method: The fully-qualified name of the method.
+      read_initial_payload: Whether Core should read the request of a call
+        to the method before delivering the call, which only suits methods
+        with a unary request. Calls to such a method must be requested with
+        a payload pointer to receive the request in.
+    """
     method_bytes = str_to_bytes(fully_qualified_method)
     if method_bytes in self.registered_methods.keys():
       # Ignore already registered method
       return
-    cdef RegisteredMethod registered_method = RegisteredMethod(method_bytes, <uintptr_t>self.c_server)
+    cdef RegisteredMethod registered_method = RegisteredMethod(
+        method_bytes, <uintptr_t>self.c_server, read_initial_payload)
     self.registered_methods[method_bytes] = registered_method
 
   def start(self, backup_queue=True):
@@ -41,11 +41,12 @@ cdef class _RequestCallTag(_Tag):
     grpc_metadata_array_init(&self.c_invocation_metadata)
 
   cdef RequestCallEvent event(self, grpc_event c_event):
-    cdef tuple invocation_metadata = _metadata(&self.c_invocation_metadata)
+    cdef tuple raw_invocation_metadata = _raw_metadata(
+        &self.c_invocation_metadata)
     grpc_metadata_array_destroy(&self.c_invocation_metadata)
     return RequestCallEvent(
         c_event.type, c_event.success, self._user_tag, self.call,
-        self.call_details, invocation_metadata)
+        self.call_details, raw_invocation_metadata)
 
 
 cdef class _BatchOperationTag:
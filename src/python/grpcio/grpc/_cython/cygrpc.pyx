@@ -14,7 +14,9 @@
 # distutils: language=c++
 
 cimport cpython
+cimport cython
 
+import collections
 import logging
 import os
 import sys
@@ -18,6 +18,7 @@ from __future__ import annotations
 import abc
 import collections
 from concurrent import futures
+import contextlib
 import contextvars
 import enum
 import logging
@@ -27,6 +28,7 @@ import traceback
 from typing import (
     Any,
     Callable,
+    Counter,
     Dict,
     Iterable,
     Iterator,
@@ -44,6 +46,7 @@ from grpc import _common
 from grpc import _compression
 from grpc import _interceptor
 from grpc import _observability
+from grpc import _utilities
 from grpc._cython import cygrpc
 from grpc._typing import ArityAgnosticMethodHandler
 from grpc._typing import ChannelArgumentType
@@ -54,6 +57,7 @@ from grpc._typing import ResponseType
 from grpc._typing import SerializingFunction
 from grpc._typing import ServerCallbackTag
 from grpc._typing import ServerTagCallbackType
+import grpc.experimental
 from typing_extensions import override
 
 _LOGGER = logging.getLogger(__name__)
@@ -110,17 +114,31 @@ def _details(state: _RPCState) -> bytes:
     return b"" if state.details is None else state.details
 
 
-class _HandlerCallDetails(
+class _HandlerCallDetails(grpc.HandlerCallDetails):
+    """Call details whose invocation metadata is decoded when first read."""
+
+    __slots__ = ("_rpc_event", "method")
+
+    def __init__(self, method: str, rpc_event: cygrpc.BaseEvent):
+        self.method = method
+        self._rpc_event = rpc_event
+
+    @property
+    def invocation_metadata(self) -> Optional[MetadataType]:
+        return self._rpc_event.invocation_metadata
+
+
+class _MethodDispatch(
     collections.namedtuple(
-        "_HandlerCallDetails",
+        "_MethodDispatch",
         (
-            "method",
-            "invocation_metadata",
+            "method_handler",
+            "handle",
+            "thread_pool",
         ),
-    ),
-    grpc.HandlerCallDetails,
+    )
 ):
-    pass
+    """A method handler with its arity and thread pool already resolved."""
 
 
 class _Method(abc.ABC):
@@ -134,15 +152,30 @@ class _Method(abc.ABC):
     ) -> Optional[grpc.RpcMethodHandler]:
         raise NotImplementedError()
 
+    def dispatch(
+        self,
+        method_handler: grpc.RpcMethodHandler,
+        default_thread_pool: futures.ThreadPoolExecutor,
+        zero_copy_receive: bool,
+    ) -> _MethodDispatch:
+        return _method_dispatch(
+            method_handler, default_thread_pool, zero_copy_receive
+        )
+
 
 class _RegisteredMethod(_Method):
     def __init__(
         self,
         name: str,
-        registered_handler: Optional[grpc.RpcMethodHandler],
+        registered_handler: grpc.RpcMethodHandler,
+        default_thread_pool: futures.ThreadPoolExecutor,
+        zero_copy_receive: bool,
     ):
         self._name = name
         self._registered_handler = registered_handler
+        self._dispatch = _method_dispatch(
+            registered_handler, default_thread_pool, zero_copy_receive
+        )
 
     @override
     def name(self) -> Optional[str]:
@@ -154,6 +187,20 @@ class _RegisteredMethod(_Method):
     ) -> Optional[grpc.RpcMethodHandler]:
         return self._registered_handler
 
+    @override
+    def dispatch(
+        self,
+        method_handler: grpc.RpcMethodHandler,
+        default_thread_pool: futures.ThreadPoolExecutor,
+        zero_copy_receive: bool,
+    ) -> _MethodDispatch:
+        # An interceptor may have substituted another handler for this call.
+        if method_handler is self._registered_handler:
+            return self._dispatch
+        return _method_dispatch(
+            method_handler, default_thread_pool, zero_copy_receive
+        )
+
 
 class _GenericMethod(_Method):
     def __init__(
@@ -504,7 +551,11 @@ class _RequestIterator:
             raise StopIteration()
         else:
             self._call.start_server_batch(
-                (cygrpc.ReceiveMessageOperation(_EMPTY_FLAGS),),
+                (
+                    _common.receive_message_operation(
+                        self._request_deserializer
+                    ),
+                ),
                 _receive_message(
                     self._state, self._call, self._request_deserializer
                 ),
@@ -555,7 +606,7 @@ def _unary_request(
             if not _is_rpc_state_active(state):
                 return None
             rpc_event.call.start_server_batch(
-                (cygrpc.ReceiveMessageOperation(_EMPTY_FLAGS),),
+                (_common.receive_message_operation(request_deserializer),),
                 _receive_message(state, rpc_event.call, request_deserializer),
             )
             state.due.add(_RECEIVE_MESSAGE_TOKEN)
@@ -886,14 +937,11 @@ def _handle_unary_unary(
     rpc_event: cygrpc.BaseEvent,
     state: _RPCState,
     method_handler: grpc.RpcMethodHandler,
-    default_thread_pool: futures.ThreadPoolExecutor,
+    thread_pool: futures.ThreadPoolExecutor,
 ) -> futures.Future:
     unary_request = _unary_request(
         rpc_event, state, method_handler.request_deserializer
     )
-    thread_pool = _select_thread_pool_for_behavior(
-        method_handler.unary_unary, default_thread_pool
-    )
     return thread_pool.submit(
         state.context.run,
         _unary_response_in_pool,
@@ -910,14 +958,11 @@ def _handle_unary_stream(
     rpc_event: cygrpc.BaseEvent,
     state: _RPCState,
     method_handler: grpc.RpcMethodHandler,
-    default_thread_pool: futures.ThreadPoolExecutor,
+    thread_pool: futures.ThreadPoolExecutor,
 ) -> futures.Future:
     unary_request = _unary_request(
         rpc_event, state, method_handler.request_deserializer
     )
-    thread_pool = _select_thread_pool_for_behavior(
-        method_handler.unary_stream, default_thread_pool
-    )
     return thread_pool.submit(
         state.context.run,
         _stream_response_in_pool,
@@ -934,14 +979,11 @@ def _handle_stream_unary(
     rpc_event: cygrpc.BaseEvent,
     state: _RPCState,
     method_handler: grpc.RpcMethodHandler,
-    default_thread_pool: futures.ThreadPoolExecutor,
+    thread_pool: futures.ThreadPoolExecutor,
 ) -> futures.Future:
     request_iterator = _RequestIterator(
         state, rpc_event.call, method_handler.request_deserializer
     )
-    thread_pool = _select_thread_pool_for_behavior(
-        method_handler.stream_unary, default_thread_pool
-    )
     return thread_pool.submit(
         state.context.run,
         _unary_response_in_pool,
@@ -958,14 +1000,11 @@ def _handle_stream_stream(
     rpc_event: cygrpc.BaseEvent,
     state: _RPCState,
     method_handler: grpc.RpcMethodHandler,
-    default_thread_pool: futures.ThreadPoolExecutor,
+    thread_pool: futures.ThreadPoolExecutor,
 ) -> futures.Future:
     request_iterator = _RequestIterator(
         state, rpc_event.call, method_handler.request_deserializer
     )
-    thread_pool = _select_thread_pool_for_behavior(
-        method_handler.stream_stream, default_thread_pool
-    )
     return thread_pool.submit(
         state.context.run,
         _stream_response_in_pool,
@@ -978,6 +1017,42 @@ def _handle_stream_stream(
     )
 
 
+def _method_dispatch(
+    method_handler: grpc.RpcMethodHandler,
+    default_thread_pool: futures.ThreadPoolExecutor,
+    zero_copy_receive: bool,
+) -> _MethodDispatch:
+    if zero_copy_receive:
+        method_handler = _utilities.RpcMethodHandler(
+            method_handler.request_streaming,
+            method_handler.response_streaming,
+            _common.zero_copy_deserializer(method_handler.request_deserializer),
+            method_handler.response_serializer,
+            method_handler.unary_unary,
+            method_handler.unary_stream,
+            method_handler.stream_unary,
+            method_handler.stream_stream,
+        )
+    if method_handler.request_streaming:
+        if method_handler.response_streaming:
+            handle = _handle_stream_stream
+            behavior = method_handler.stream_stream
+        else:
+            handle = _handle_stream_unary
+            behavior = method_handler.stream_unary
+    elif method_handler.response_streaming:
+        handle = _handle_unary_stream
+        behavior = method_handler.unary_stream
+    else:
+        handle = _handle_unary_unary
+        behavior = method_handler.unary_unary
+    return _MethodDispatch(
+        method_handler,
+        handle,
+        _select_thread_pool_for_behavior(behavior, default_thread_pool),
+    )
+
+
 def _find_method_handler(
     rpc_event: cygrpc.BaseEvent,
     state: _RPCState,
@@ -990,13 +1065,14 @@ def _find_method_handler(
         return method_with_handler.handler(handler_call_details)
 
     method_name = method_with_handler.name()
+    if method_name and interceptor_pipeline is None:
+        # Registered handlers neither depend on the call details nor run
+        # application code, so there is nothing to build or run them under.
+        return method_with_handler.handler(None)
     if not method_name:
         method_name = _common.decode(rpc_event.call_details.method)
 
-    handler_call_details = _HandlerCallDetails(
-        method_name,
-        rpc_event.invocation_metadata,
-    )
+    handler_call_details = _HandlerCallDetails(method_name, rpc_event)
 
     if interceptor_pipeline is not None:
         return state.context.run(
@@ -1030,8 +1106,7 @@ def _reject_rpc(
 def _handle_with_method_handler(
     rpc_event: cygrpc.BaseEvent,
     state: _RPCState,
-    method_handler: grpc.RpcMethodHandler,
-    thread_pool: futures.ThreadPoolExecutor,
+    method_dispatch: _MethodDispatch,
 ) -> futures.Future:
     with state.condition:
         rpc_event.call.start_server_batch(
@@ -1039,20 +1114,11 @@ def _handle_with_method_handler(
             _receive_close_on_server(state),
         )
         state.due.add(_RECEIVE_CLOSE_ON_SERVER_TOKEN)
-        if method_handler.request_streaming:
-            if method_handler.response_streaming:
-                return _handle_stream_stream(
-                    rpc_event, state, method_handler, thread_pool
-                )
-            return _handle_stream_unary(
-                rpc_event, state, method_handler, thread_pool
-            )
-        if method_handler.response_streaming:
-            return _handle_unary_stream(
-                rpc_event, state, method_handler, thread_pool
-            )
-        return _handle_unary_unary(
-            rpc_event, state, method_handler, thread_pool
+        return method_dispatch.handle(
+            rpc_event,
+            state,
+            method_dispatch.method_handler,
+            method_dispatch.thread_pool,
         )
 
 
@@ -1061,6 +1127,7 @@ def _handle_call(
     method_with_handler: _Method,
     interceptor_pipeline: Optional[_interceptor._ServicePipeline],
     thread_pool: futures.ThreadPoolExecutor,
+    zero_copy_receive: bool,
     concurrency_exceeded: bool,
 ) -> Tuple[Optional[_RPCState], Optional[futures.Future]]:
     """Handles RPC based on provided handlers.
@@ -1114,7 +1181,11 @@ def _handle_call(
         return (
             rpc_state,
             _handle_with_method_handler(
-                rpc_event, rpc_state, method_handler, thread_pool
+                rpc_event,
+                rpc_state,
+                method_with_handler.dispatch(
+                    method_handler, thread_pool, zero_copy_receive
+                ),
             ),
         )
     return None, None
@@ -1127,12 +1198,46 @@ class _ServerStage(enum.Enum):
     GRACE = "grace"
 
 
-class _ServerState:
+class _ServingShard:
+    """Bookkeeping for one completion queue and the thread draining it.
+
+    Each shard accepts RPCs on, and receives the per-RPC events of, its own
+    completion queue. Its members are guarded by its own lock so that shards
+    never contend with one another on the serving path.
+    """
+
     lock: threading.RLock
     completion_queue: cygrpc.CompletionQueue
+    rpc_states: Set[_RPCState]
+    due: Counter[str]
+
+    def __init__(self, completion_queue: cygrpc.CompletionQueue):
+        self.lock = threading.RLock()
+        self.completion_queue = completion_queue
+
+        # TODO(https://github.com/grpc/grpc/issues/6597): eliminate these fields.
+        self.rpc_states = set()
+        # Several request calls may be outstanding for the same tag, so the
+        # number of outstanding operations is counted per tag. Tags whose
+        # count drops to zero are removed.
+        self.due = collections.Counter()
+
+    def post(self, tag: str) -> None:
+        self.due[tag] += 1
+
+    def complete(self, tag: str) -> None:
+        self.due[tag] -= 1
+        if not self.due[tag]:
+            del self.due[tag]
+
+
+class _ServerState:
+    lock: threading.RLock
+    shards: Sequence[_ServingShard]
     server: cygrpc.Server
     generic_handlers: List[grpc.GenericRpcHandler]
     registered_method_handlers: Dict[str, grpc.RpcMethodHandler]
+    dispatch_table: Mapping[Any, _Method]
     interceptor_pipeline: Optional[_interceptor._ServicePipeline]
     thread_pool: futures.ThreadPoolExecutor
     stage: _ServerStage
@@ -1140,22 +1245,32 @@ class _ServerState:
     shutdown_events: List[threading.Event]
     maximum_concurrent_rpcs: Optional[int]
     active_rpc_count: int
-    rpc_states: Set[_RPCState]
-    due: Set[str]
+    request_call_depth: int
+    zero_copy_receive: bool
+    serving_shard_count: int
     server_deallocated: bool
 
     # pylint: disable=too-many-arguments
     def __init__(
         self,
-        completion_queue: cygrpc.CompletionQueue,
+        completion_queues: Sequence[cygrpc.CompletionQueue],
         server: cygrpc.Server,
         generic_handlers: Sequence[grpc.GenericRpcHandler],
         interceptor_pipeline: Optional[_interceptor._ServicePipeline],
         thread_pool: futures.ThreadPoolExecutor,
         maximum_concurrent_rpcs: Optional[int],
+        request_call_depth: int = 1,
+        zero_copy_receive: bool = False,
     ):
+        # `lock` guards the server-wide members below. It is always acquired
+        # before, never while holding, any shard's lock. `stage` is only ever
+        # changed while holding every shard's lock as well, so that a shard
+        # holding just its own lock observes a consistent value.
         self.lock = threading.RLock()
-        self.completion_queue = completion_queue
+        self.shards = tuple(
+            _ServingShard(completion_queue)
+            for completion_queue in completion_queues
+        )
         self.server = server
         self.generic_handlers = list(generic_handlers)
         self.interceptor_pipeline = interceptor_pipeline
@@ -1165,13 +1280,15 @@ class _ServerState:
         self.shutdown_events = [self.termination_event]
         self.maximum_concurrent_rpcs = maximum_concurrent_rpcs
         self.active_rpc_count = 0
+        self.request_call_depth = request_call_depth
+        self.zero_copy_receive = zero_copy_receive
+        self.serving_shard_count = 0
         self.registered_method_handlers = {}
+        # Maps each request-call tag to the method it accepts. Built once at
+        # start and never mutated afterwards, so it is read without locking.
+        self.dispatch_table = {}
 
-        # TODO(https://github.com/grpc/grpc/issues/6597): eliminate these fields.
-        self.rpc_states = set()
-        self.due = set()
-
-        # A "volatile" flag to interrupt the daemon serving thread
+        # A "volatile" flag to interrupt the daemon serving threads
         self.server_deallocated = False
 
 
@@ -1205,94 +1322,99 @@ def _add_secure_port(
         )
 
 
-def _request_call(state: _ServerState) -> None:
+def _request_call(state: _ServerState, shard: _ServingShard) -> None:
     state.server.request_call(
-        state.completion_queue, state.completion_queue, _REQUEST_CALL_TAG
+        shard.completion_queue, shard.completion_queue, _REQUEST_CALL_TAG
     )
-    state.due.add(_REQUEST_CALL_TAG)
+    shard.post(_REQUEST_CALL_TAG)
 
 
-def _request_registered_call(state: _ServerState, method: str) -> None:
+def _request_registered_call(
+    state: _ServerState, shard: _ServingShard, method: str
+) -> None:
     registered_call_tag = method
     state.server.request_registered_call(
-        state.completion_queue,
-        state.completion_queue,
+        shard.completion_queue,
+        shard.completion_queue,
         method,
         registered_call_tag,
     )
-    state.due.add(registered_call_tag)
+    shard.post(registered_call_tag)
 
 
 # TODO(https://github.com/grpc/grpc/issues/6597): delete this function.
-def _stop_serving(state: _ServerState) -> bool:
-    if not state.rpc_states and not state.due:
-        state.server.destroy()
-        for shutdown_event in state.shutdown_events:
-            shutdown_event.set()
-        state.stage = _ServerStage.STOPPED
+def _stop_serving(shard: _ServingShard) -> bool:
+    """Determines whether a shard has drained. Called holding shard.lock."""
+    return not shard.rpc_states and not shard.due
+
+
+def _retire_shard(state: _ServerState) -> None:
+    with state.lock:
+        state.serving_shard_count -= 1
+        if state.serving_shard_count == 0:
+            state.server.destroy()
+            for shutdown_event in state.shutdown_events:
+                shutdown_event.set()
+            state.stage = _ServerStage.STOPPED
+
+
+def _acquire_rpc_slot(state: _ServerState) -> bool:
+    if state.maximum_concurrent_rpcs is None:
+        return True
+    with state.lock:
+        if state.active_rpc_count >= state.maximum_concurrent_rpcs:
+            return False
+        state.active_rpc_count += 1
         return True
-    return False
 
 
 def _on_call_completed(state: _ServerState) -> None:
+    if state.maximum_concurrent_rpcs is None:
+        return
     with state.lock:
         state.active_rpc_count -= 1
 
 
 # pylint: disable=too-many-branches
 def _process_event_and_continue(
-    state: _ServerState, event: cygrpc.BaseEvent
+    state: _ServerState, shard: _ServingShard, event: cygrpc.BaseEvent
 ) -> bool:
-    should_continue = True
+    stopped = False
+    method_with_handler = state.dispatch_table.get(event.tag)
     if event.tag is _SHUTDOWN_TAG:
-        with state.lock:
-            state.due.remove(_SHUTDOWN_TAG)
-            if _stop_serving(state):
-                should_continue = False
-    elif (
-        event.tag is _REQUEST_CALL_TAG
-        or event.tag in state.registered_method_handlers
-    ):
-        registered_method_name = None
-        if event.tag in state.registered_method_handlers:
-            registered_method_name = event.tag
-            method_with_handler = _RegisteredMethod(
-                registered_method_name,
-                state.registered_method_handlers.get(
-                    registered_method_name, None
-                ),
-            )
-        else:
-            method_with_handler = _GenericMethod(
-                state.generic_handlers,
-            )
-        with state.lock:
-            state.due.remove(event.tag)
-            concurrency_exceeded = (
-                state.maximum_concurrent_rpcs is not None
-                and state.active_rpc_count >= state.maximum_concurrent_rpcs
-            )
+        with shard.lock:
+            shard.complete(_SHUTDOWN_TAG)
+            stopped = _stop_serving(shard)
+    elif method_with_handler is not None:
+        slot_acquired = _acquire_rpc_slot(state)
+        with shard.lock:
+            shard.complete(event.tag)
             rpc_state, rpc_future = _handle_call(
                 event,
                 method_with_handler,
                 state.interceptor_pipeline,
                 state.thread_pool,
-                concurrency_exceeded,
+                state.zero_copy_receive,
+                not slot_acquired,
             )
             if rpc_state is not None:
-                state.rpc_states.add(rpc_state)
-            if rpc_future is not None:
-                state.active_rpc_count += 1
-                rpc_future.add_done_callback(
-                    lambda _unused_future: _on_call_completed(state)
-                )
+                shard.rpc_states.add(rpc_state)
             if state.stage is _ServerStage.STARTED:
-                if registered_method_name in state.registered_method_handlers:
-                    _request_registered_call(state, registered_method_name)
+                registered_method_name = method_with_handler.name()
+                if registered_method_name is None:
+                    _request_call(state, shard)
                 else:
-                    _request_call(state)
-            elif _stop_serving(state):
-                should_continue = False
+                    _request_registered_call(
+                        state, shard, registered_method_name
+                    )
+            else:
+                stopped = _stop_serving(shard)
+        if rpc_future is not None:
+            rpc_future.add_done_callback(
+                lambda _unused_future: _on_call_completed(state)
+            )
+        elif slot_acquired:
+            _on_call_completed(state)
     else:
         rpc_state, callbacks = event.tag(event)
         for callback in callbacks:
@@ -1301,23 +1423,26 @@ def _process_event_and_continue(
             except Exception:  # pylint: disable=broad-except
                 _LOGGER.exception("Exception calling callback!")
         if rpc_state is not None:
-            with state.lock:
-                state.rpc_states.remove(rpc_state)
-                if _stop_serving(state):
-                    should_continue = False
-    return should_continue
+            with shard.lock:
+                shard.rpc_states.remove(rpc_state)
+                stopped = _stop_serving(shard)
+    if stopped:
+        _retire_shard(state)
+    return not stopped
 
 
-def _serve(state: _ServerState) -> None:
+def _serve(state: _ServerState, shard: _ServingShard) -> None:
     while True:
         timeout = time.time() + _DEALLOCATED_SERVER_CHECK_PERIOD_S
-        event = state.completion_queue.poll(timeout)
+        event = shard.completion_queue.poll(timeout)
         if state.server_deallocated:
             _begin_shutdown_once(state)
         is_timeout = (
             event.completion_type == cygrpc.CompletionType.queue_timeout
         )
-        if not is_timeout and not _process_event_and_continue(state, event):
+        if not is_timeout and not _process_event_and_continue(
+            state, shard, event
+        ):
             return
         # We want to force the deletion of the previous event
         # ~before~ we poll again; if the event has a reference
@@ -1328,9 +1453,15 @@ def _serve(state: _ServerState) -> None:
 def _begin_shutdown_once(state: _ServerState) -> None:
     with state.lock:
         if state.stage is _ServerStage.STARTED:
-            state.server.shutdown(state.completion_queue, _SHUTDOWN_TAG)
-            state.stage = _ServerStage.GRACE
-            state.due.add(_SHUTDOWN_TAG)
+            with contextlib.ExitStack() as stack:
+                for shard in state.shards:
+                    stack.enter_context(shard.lock)
+                shutdown_shard = state.shards[0]
+                state.server.shutdown(
+                    shutdown_shard.completion_queue, _SHUTDOWN_TAG
+                )
+                state.stage = _ServerStage.GRACE
+                shutdown_shard.post(_SHUTDOWN_TAG)
 
 
 def _stop(state: _ServerState, grace: Optional[float]) -> threading.Event:
@@ -1358,6 +1489,15 @@ def _stop(state: _ServerState, grace: Optional[float]) -> threading.Event:
     return shutdown_event
 
 
+def _build_dispatch_table(state: _ServerState) -> Dict[Any, _Method]:
+    dispatch_table = {_REQUEST_CALL_TAG: _GenericMethod(state.generic_handlers)}
+    for method, method_handler in state.registered_method_handlers.items():
+        dispatch_table[method] = _RegisteredMethod(
+            method, method_handler, state.thread_pool, state.zero_copy_receive
+        )
+    return dispatch_table
+
+
 def _start(state: _ServerState) -> None:
     with state.lock:
         if state.stage is not _ServerStage.STOPPED:
@@ -1365,14 +1505,21 @@ def _start(state: _ServerState) -> None:
             raise ValueError(error_msg)
         state.server.start()
         state.stage = _ServerStage.STARTED
-        # Request a call for each registered method so we can handle any of them.
-        for method in state.registered_method_handlers:
-            _request_registered_call(state, method)
-        # Also request a call for non-registered method.
-        _request_call(state)
-        thread = threading.Thread(target=_serve, args=(state,))
-        thread.daemon = True
-        thread.start()
+        state.dispatch_table = _build_dispatch_table(state)
+        state.serving_shard_count = len(state.shards)
+        for shard in state.shards:
+            # Keep request_call_depth calls outstanding for each registered
+            # method and for non-registered methods, so that a burst of
+            # incoming RPCs does not wait on the serving thread re-arming a
+            # single accept. Each accepted call re-arms exactly one request.
+            for _ in range(state.request_call_depth):
+                for method in state.registered_method_handlers:
+                    _request_registered_call(state, shard, method)
+                _request_call(state, shard)
+        for shard in state.shards:
+            thread = threading.Thread(target=_serve, args=(state, shard))
+            thread.daemon = True
+            thread.start()
 
 
 def _validate_generic_rpc_handlers(
@@ -1388,6 +1535,45 @@ def _validate_generic_rpc_handlers(
             raise AttributeError(error_msg)
 
 
+_PYTHON_SERVER_OPTIONS = (
+    grpc.experimental.ServerOptions.CompletionQueueCount,
+    grpc.experimental.ServerOptions.RequestCallDepth,
+    grpc.experimental.ServerOptions.ZeroCopyReceive,
+)
+
+
+def _separate_server_options(
+    options: Sequence[ChannelArgumentType],
+) -> Tuple[Sequence[ChannelArgumentType], Sequence[ChannelArgumentType]]:
+    """Separates core server options from Python server options."""
+    core_options = []
+    python_options = []
+    for pair in options:
+        if pair[0] in _PYTHON_SERVER_OPTIONS:
+            python_options.append(pair)
+        else:
+            core_options.append(pair)
+    return python_options, core_options
+
+
+def _positive_int_option(
+    python_options: Sequence[ChannelArgumentType], option: str, default: int
+) -> int:
+    result = default
+    for key, value in python_options:
+        if key == option:
+            result = _common.validate_positive_int_option(key, value)
+    return result
+
+
+def _zero_copy_receive(python_options: Sequence[ChannelArgumentType]) -> bool:
+    zero_copy_receive = False
+    for key, value in python_options:
+        if key == grpc.experimental.ServerOptions.ZeroCopyReceive:
+            zero_copy_receive = bool(value)
+    return zero_copy_receive
+
+
 def _augment_options(
     base_options: Sequence[ChannelArgumentType],
     compression: Optional[grpc.Compression],
@@ -1418,16 +1604,35 @@ class _Server(grpc.Server):
         compression: Optional[grpc.Compression],
         xds: bool,
     ):
-        completion_queue = cygrpc.CompletionQueue()
-        server = cygrpc.Server(_augment_options(options, compression, xds), xds)
-        server.register_completion_queue(completion_queue)
+        python_options, core_options = _separate_server_options(options)
+        completion_queues = tuple(
+            cygrpc.CompletionQueue()
+            for _ in range(
+                _positive_int_option(
+                    python_options,
+                    grpc.experimental.ServerOptions.CompletionQueueCount,
+                    1,
+                )
+            )
+        )
+        server = cygrpc.Server(
+            _augment_options(core_options, compression, xds), xds
+        )
+        for completion_queue in completion_queues:
+            server.register_completion_queue(completion_queue)
         self._state = _ServerState(
-            completion_queue,
+            completion_queues,
             server,
             generic_handlers,
             _interceptor.service_pipeline(interceptors),
             thread_pool,
             maximum_concurrent_rpcs,
+            _positive_int_option(
+                python_options,
+                grpc.experimental.ServerOptions.RequestCallDepth,
+                1,
+            ),
+            _zero_copy_receive(python_options),
         )
         self._cy_server = server
 
@@ -13,17 +13,17 @@
 # limitations under the License.
 """Functions that obviate explicit stubs and explicit channels."""
 
-import collections
-import datetime
 import logging
 import os
 import threading
+import time
 from typing import (
     Any,
     AnyStr,
     Callable,
     Dict,
     Iterator,
+    List,
     Optional,
     Sequence,
     Tuple,
@@ -49,14 +49,13 @@ _LOGGER = logging.getLogger(__name__)
 
 _EVICTION_PERIOD_KEY = "GRPC_PYTHON_MANAGED_CHANNEL_EVICTION_SECONDS"
 if _EVICTION_PERIOD_KEY in os.environ:
-    _EVICTION_PERIOD = datetime.timedelta(
-        seconds=float(os.environ[_EVICTION_PERIOD_KEY])
-    )
+    _EVICTION_PERIOD = float(os.environ[_EVICTION_PERIOD_KEY])
     _LOGGER.debug(
-        "Setting managed channel eviction period to %s", _EVICTION_PERIOD
+        "Setting managed channel eviction period to %f seconds",
+        _EVICTION_PERIOD,
     )
 else:
-    _EVICTION_PERIOD = datetime.timedelta(minutes=10)
+    _EVICTION_PERIOD = 600.0
 
 _MAXIMUM_CHANNELS_KEY = "GRPC_PYTHON_MANAGED_CHANNEL_MAXIMUM"
 if _MAXIMUM_CHANNELS_KEY in os.environ:
@@ -65,6 +64,9 @@ if _MAXIMUM_CHANNELS_KEY in os.environ:
 else:
     _MAXIMUM_CHANNELS = 2**8
 
+# The number of independently locked shards of the channel cache.
+_CHANNEL_CACHE_SHARDS = 16
+
 _DEFAULT_TIMEOUT_KEY = "GRPC_PYTHON_DEFAULT_TIMEOUT_SECONDS"
 if _DEFAULT_TIMEOUT_KEY in os.environ:
     _DEFAULT_TIMEOUT = float(os.environ[_DEFAULT_TIMEOUT_KEY])
@@ -92,65 +94,240 @@ def _create_channel(
     )
 
 
+class _ChannelCacheEntry:
+    """A cached channel and the bookkeeping used to evict it."""
+
+    __slots__ = (
+        "call_handles",
+        "channel",
+        "evicted",
+        "key",
+        "key_hash",
+        "last_used",
+        "referenced",
+    )
+
+    key: CacheKey
+    key_hash: int
+    channel: grpc.Channel
+    call_handles: Dict[str, int]
+    last_used: float
+    referenced: bool
+    evicted: bool
+
+    def __init__(self, key: CacheKey, key_hash: int, channel: grpc.Channel):
+        self.key = key
+        self.key_hash = key_hash
+        self.channel = channel
+        self.call_handles = {}
+        self.last_used = time.monotonic()
+        self.referenced = True
+        self.evicted = False
+
+
+class _ChannelCacheShard:
+    """A slice of the channel cache guarded by its own lock.
+
+    Entries are bucketed by the hash of their key. Buckets are tuples that
+    are replaced, never mutated, so readers may look them up without the
+    lock; only insertions and evictions take it.
+    """
+
+    __slots__ = ("buckets", "lock", "size")
+
+    lock: threading.Lock
+    buckets: Dict[int, Tuple[_ChannelCacheEntry, ...]]
+    size: int
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.buckets = {}
+        self.size = 0
+
+    def find(
+        self, key_hash: int, key: CacheKey
+    ) -> Optional[_ChannelCacheEntry]:
+        for entry in self.buckets.get(key_hash, ()):
+            if entry.key == key:
+                return entry
+        return None
+
+    def entries(self) -> Iterator[_ChannelCacheEntry]:
+        for bucket in tuple(self.buckets.values()):
+            yield from bucket
+
+    def add_locked(self, entry: _ChannelCacheEntry) -> None:
+        self.buckets[entry.key_hash] = self.buckets.get(entry.key_hash, ()) + (
+            entry,
+        )
+        self.size += 1
+
+    def evict_locked(self, entry: _ChannelCacheEntry) -> None:
+        bucket = tuple(
+            other
+            for other in self.buckets[entry.key_hash]
+            if other is not entry
+        )
+        if bucket:
+            self.buckets[entry.key_hash] = bucket
+        else:
+            del self.buckets[entry.key_hash]
+        self.size -= 1
+        entry.evicted = True
+        _LOGGER.debug(
+            "Evicting channel %s with configuration %s.",
+            entry.channel,
+            entry.key,
+        )
+        entry.channel.close()
+
+
 class ChannelCache:
+    """A per-process cache of channels keyed by their configuration.
+
+    The cache is split into shards with a lock each. Lookups of a cached
+    channel take no lock at all: they find the entry in the bucket of the
+    precomputed key hash, then mark it as recently used. A single thread
+    evicts channels that have been unused for longer than the eviction
+    period and, when there are more than the maximum number of channels,
+    approximates LRU with the CLOCK algorithm: a hand that persists across
+    evictions sweeps the shards, giving a channel used since it last passed
+    a second chance, and the oldest used of the channels without one are
+    evicted. Channels used since an eviction began are never evicted by it,
+    as they may just have been handed to a caller.
+    """
+
     # NOTE(rbellevi): Untyped due to reference cycle.
     _singleton = None
-    _lock: threading.RLock = threading.RLock()
-    _condition: threading.Condition = threading.Condition(lock=_lock)
-    _eviction_ready: threading.Event = threading.Event()
+    _lock: threading.Lock = threading.Lock()
 
-    _mapping: Dict[CacheKey, Tuple[grpc.Channel, datetime.datetime]]
+    _shards: Tuple[_ChannelCacheShard, ...]
+    _eviction_wakeup: threading.Event
     _eviction_thread: threading.Thread
+    _clock_hand: int
 
     def __init__(self):
-        self._mapping = collections.OrderedDict()
+        self._shards = tuple(
+            _ChannelCacheShard() for _ in range(_CHANNEL_CACHE_SHARDS)
+        )
+        self._clock_hand = 0
+        self._eviction_wakeup = threading.Event()
         self._eviction_thread = threading.Thread(
-            target=ChannelCache._perform_evictions, daemon=True
+            target=self._perform_evictions, daemon=True
         )
         self._eviction_thread.start()
 
     @staticmethod
     def get():
-        with ChannelCache._lock:
-            if ChannelCache._singleton is None:
-                ChannelCache._singleton = ChannelCache()
-        ChannelCache._eviction_ready.wait()
-        return ChannelCache._singleton
-
-    def _evict_locked(self, key: CacheKey):
-        channel, _ = self._mapping.pop(key)
-        _LOGGER.debug(
-            "Evicting channel %s with configuration %s.", channel, key
-        )
-        channel.close()
-        del channel
+        singleton = ChannelCache._singleton
+        if singleton is None:
+            with ChannelCache._lock:
+                if ChannelCache._singleton is None:
+                    ChannelCache._singleton = ChannelCache()
+                singleton = ChannelCache._singleton
+        return singleton
 
-    @staticmethod
-    def _perform_evictions():
+    def _channel_count(self) -> int:
+        return sum(shard.size for shard in self._shards)
+
+    def _evict_expired(self, now: float) -> Optional[float]:
+        """Evicts the expired channels.
+
+        Returns:
+          The time at which the next channel expires, or None if the cache is
+            empty.
+        """
+        next_expiry = None
+        for shard in self._shards:
+            with shard.lock:
+                for entry in shard.entries():
+                    expiry = entry.last_used + _EVICTION_PERIOD
+                    if expiry <= now:
+                        shard.evict_locked(entry)
+                    elif next_expiry is None or expiry < next_expiry:
+                        next_expiry = expiry
+        return next_expiry
+
+    def _sweep(
+        self, excess: int, start: float
+    ) -> List[Tuple[float, int, _ChannelCacheEntry]]:
+        """Advances the clock hand until it has passed enough channels
+        without a second chance, or has gone once around the shards.
+
+        Returns:
+          The last used time, shard index and entry of each channel passed
+            that may be evicted.
+        """
+        candidates = []
+        for _ in range(len(self._shards)):
+            shard_index = self._clock_hand
+            self._clock_hand = (shard_index + 1) % len(self._shards)
+            shard = self._shards[shard_index]
+            with shard.lock:
+                for entry in shard.entries():
+                    if entry.last_used >= start:
+                        continue
+                    if entry.referenced:
+                        entry.referenced = False
+                    else:
+                        candidates.append((entry.last_used, shard_index, entry))
+            if len(candidates) >= excess:
+                break
+        return candidates
+
+    def _evict_excess(self) -> None:
+        excess = self._channel_count() - _MAXIMUM_CHANNELS
+        if excess <= 0:
+            return
+        start = time.monotonic()
+        # NOTE: A second time around, the channels whose second chance was
+        # spent on the first are evicted too.
+        for _ in range(2):
+            candidates = self._sweep(excess, start)
+            candidates.sort(key=lambda candidate: candidate[0])
+            for _, shard_index, entry in candidates:
+                if excess <= 0:
+                    return
+                shard = self._shards[shard_index]
+                with shard.lock:
+                    if (
+                        not entry.evicted
+                        and not entry.referenced
+                        and entry.last_used < start
+                    ):
+                        shard.evict_locked(entry)
+                        excess -= 1
+            if excess <= 0:
+                return
+
+    def _perform_evictions(self):
+        timeout = None
         while True:
-            with ChannelCache._lock:
-                ChannelCache._eviction_ready.set()
-                if not ChannelCache._singleton._mapping:
-                    ChannelCache._condition.wait()
-                elif len(ChannelCache._singleton._mapping) > _MAXIMUM_CHANNELS:
-                    key = next(iter(ChannelCache._singleton._mapping.keys()))
-                    ChannelCache._singleton._evict_locked(key)
-                    # And immediately reevaluate.
-                else:
-                    key, (_, eviction_time) = next(
-                        iter(ChannelCache._singleton._mapping.items())
+            self._eviction_wakeup.wait(timeout=timeout)
+            self._eviction_wakeup.clear()
+            now = time.monotonic()
+            next_expiry = self._evict_expired(now)
+            self._evict_excess()
+            # NOTE: We aim to *eventually* coalesce to a state in which no
+            # overdue channels are in the cache and the length of the cache
+            # is not longer than _MAXIMUM_CHANNELS. We tolerate momentary
+            # states in which these two criteria are not met.
+            timeout = None if next_expiry is None else next_expiry - now
+
+    def _get_call_handle(
+        self, shard: _ChannelCacheShard, entry: _ChannelCacheEntry, method: str
+    ) -> int:
+        call_handle = entry.call_handles.get(method)
+        if call_handle is None:
+            # Channel._get_registered_call_handle is not thread-safe.
+            with shard.lock:
+                call_handle = entry.call_handles.get(method)
+                if call_handle is None:
+                    call_handle = entry.channel._get_registered_call_handle(
+                        method
                     )
-                    now = datetime.datetime.now()
-                    if eviction_time <= now:
-                        ChannelCache._singleton._evict_locked(key)
-                        continue
-                    time_to_eviction = (eviction_time - now).total_seconds()
-                    # NOTE: We aim to *eventually* coalesce to a state in
-                    # which no overdue channels are in the cache and the
-                    # length of the cache is longer than _MAXIMUM_CHANNELS.
-                    # We tolerate momentary states in which these two
-                    # criteria are not met.
-                    ChannelCache._condition.wait(timeout=time_to_eviction)
+                    entry.call_handles[method] = call_handle
+        return call_handle
 
     def get_channel(
         self,
@@ -186,40 +363,37 @@ class ChannelCache:
             _LOGGER.debug("Defaulting to SSL channel credentials.")
             channel_credentials = grpc.ssl_channel_credentials()
         key = (target, options, channel_credentials, compression)
-        with self._lock:
-            channel_data = self._mapping.get(key, None)
-            call_handle = None
-            if channel_data is not None:
-                channel = channel_data[0]
-                # Register a new call handle if we're calling a registered method for an
-                # existing channel and this method is not registered.
-                if _registered_method:
-                    call_handle = channel._get_registered_call_handle(method)
-                self._mapping.pop(key)
-                self._mapping[key] = (
-                    channel,
-                    datetime.datetime.now() + _EVICTION_PERIOD,
-                )
-                return channel, call_handle
-            channel = _create_channel(
-                target, options, channel_credentials, compression
-            )
-            if _registered_method:
-                call_handle = channel._get_registered_call_handle(method)
-            self._mapping[key] = (
-                channel,
-                datetime.datetime.now() + _EVICTION_PERIOD,
-            )
-            if (
-                len(self._mapping) == 1
-                or len(self._mapping) >= _MAXIMUM_CHANNELS
-            ):
-                self._condition.notify()
-            return channel, call_handle
+        key_hash = hash(key)
+        shard = self._shards[key_hash % _CHANNEL_CACHE_SHARDS]
+        entry = shard.find(key_hash, key)
+        if entry is not None:
+            entry.last_used = time.monotonic()
+            entry.referenced = True
+        if entry is None or entry.evicted:
+            with shard.lock:
+                entry = shard.find(key_hash, key)
+                if entry is None:
+                    entry = _ChannelCacheEntry(
+                        key,
+                        key_hash,
+                        _create_channel(
+                            target, options, channel_credentials, compression
+                        ),
+                    )
+                    shard.add_locked(entry)
+                    channel_count = self._channel_count()
+                    if channel_count == 1 or channel_count > _MAXIMUM_CHANNELS:
+                        self._eviction_wakeup.set()
+                else:
+                    entry.last_used = time.monotonic()
+                    entry.referenced = True
+        call_handle = None
+        if _registered_method:
+            call_handle = self._get_call_handle(shard, entry, method)
+        return entry.channel, call_handle
 
     def _test_only_channel_count(self) -> int:
-        with self._lock:
-            return len(self._mapping)
+        return self._channel_count()
 
 
 @experimental_api
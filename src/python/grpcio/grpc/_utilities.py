@@ -14,10 +14,11 @@
 """Internal utilities for gRPC Python."""
 
 import collections
+import functools
 import logging
 import threading
 import time
-from typing import Callable, Dict, Optional, Sequence
+from typing import Callable, Dict, List, Optional, Sequence
 
 import grpc
 from grpc import _common
@@ -74,16 +75,34 @@ class DictionaryGenericHandler(grpc.ServiceRpcHandler):
         )  # pytype: disable=attribute-error
 
 
+def _ready_channels(channel: grpc.Channel) -> Sequence[grpc.Channel]:
+    """Returns the channels that must all be ready for channel to be.
+
+    A channel backed by several channels, such as a ChannelPool, lists them
+    in its channels attribute.
+    """
+    return getattr(channel, "channels", (channel,))
+
+
 class _ChannelReadyFuture(grpc.Future):
     _condition: threading.Condition
-    _channel: grpc.Channel
+    _channels: Sequence[grpc.Channel]
+    _updates: Sequence[Callable[[grpc.ChannelConnectivity], None]]
+    _ready: List[bool]
+    _unready_count: int
     _matured: bool
     _cancelled: bool
     _done_callbacks: Sequence[Callable]
 
     def __init__(self, channel: grpc.Channel):
         self._condition = threading.Condition()
-        self._channel = channel
+        self._channels = _ready_channels(channel)
+        self._updates = tuple(
+            functools.partial(self._update, index)
+            for index in range(len(self._channels))
+        )
+        self._ready = [False] * len(self._channels)
+        self._unready_count = len(self._channels)
 
         self._matured = False
         self._cancelled = False
@@ -105,14 +124,28 @@ class _ChannelReadyFuture(grpc.Future):
                         raise grpc.FutureTimeoutError()
                     self._condition.wait(timeout=remaining)
 
-    def _update(self, connectivity: Optional[grpc.ChannelConnectivity]) -> None:
+    def _unsubscribe_unready(self) -> None:
+        for channel, update, ready in zip(
+            self._channels, self._updates, self._ready
+        ):
+            if not ready:
+                channel.unsubscribe(update)
+
+    def _update(
+        self, index: int, connectivity: Optional[grpc.ChannelConnectivity]
+    ) -> None:
         with self._condition:
             if (
                 not self._cancelled
+                and not self._ready[index]
                 and connectivity is grpc.ChannelConnectivity.READY
             ):
+                self._ready[index] = True
+                self._channels[index].unsubscribe(self._updates[index])
+                self._unready_count -= 1
+                if self._unready_count:
+                    return
                 self._matured = True
-                self._channel.unsubscribe(self._update)
                 self._condition.notify_all()
                 done_callbacks = tuple(self._done_callbacks)
                 self._done_callbacks = None
@@ -129,7 +162,7 @@ class _ChannelReadyFuture(grpc.Future):
         with self._condition:
             if not self._matured:
                 self._cancelled = True
-                self._channel.unsubscribe(self._update)
+                self._unsubscribe_unready()
                 self._condition.notify_all()
                 done_callbacks = tuple(self._done_callbacks)
                 self._done_callbacks = None
@@ -175,12 +208,13 @@ class _ChannelReadyFuture(grpc.Future):
 
     def start(self):
         with self._condition:
-            self._channel.subscribe(self._update, try_to_connect=True)
+            for channel, update in zip(self._channels, self._updates):
+                channel.subscribe(update, try_to_connect=True)
 
     def __del__(self):
         with self._condition:
             if not self._cancelled and not self._matured:
-                self._channel.unsubscribe(self._update)
+                self._unsubscribe_unready()
 
 
 def channel_ready_future(channel: grpc.Channel) -> _ChannelReadyFuture:
@@ -189,6 +223,21 @@ def channel_ready_future(channel: grpc.Channel) -> _ChannelReadyFuture:
     return ready_future
 
 
+def channels_ready(
+    channels: Sequence[grpc.Channel], timeout: Optional[float]
+) -> None:
+    until = None if timeout is None else time.time() + timeout
+    ready_futures = [channel_ready_future(channel) for channel in channels]
+    try:
+        for ready_future in ready_futures:
+            ready_future.result(
+                timeout=None if until is None else until - time.time()
+            )
+    finally:
+        for ready_future in ready_futures:
+            ready_future.cancel()
+
+
 def first_version_is_lower(version1: str, version2: str) -> bool:
     """
     Compares two versions in the format '1.60.1' or '1.60.1.dev0'.
@@ -42,10 +42,13 @@ from ._base_channel import UnaryUnaryMultiCallable
 from ._base_server import Server
 from ._base_server import ServicerContext
 from ._call import AioRpcError
+from ._channel import channels_ready
 from ._channel import insecure_channel
 from ._channel import secure_channel
+from ._channel_pool import channel_pool
 from ._interceptor import ClientCallDetails
 from ._interceptor import ClientInterceptor
+from ._interceptor import FastClientInterceptor
 from ._interceptor import InterceptedUnaryUnaryCall
 from ._interceptor import ServerInterceptor
 from ._interceptor import StreamStreamClientInterceptor
@@ -67,6 +70,7 @@ __all__ = (
     "Channel",
     "ClientCallDetails",
     "ClientInterceptor",
+    "FastClientInterceptor",
     "InterceptedUnaryUnaryCall",
     "InternalError",
     "Metadata",
@@ -87,6 +91,8 @@ __all__ = (
     "UnaryUnaryClientInterceptor",
     "UnaryUnaryMultiCallable",
     "UsageError",
+    "channel_pool",
+    "channels_ready",
     "init_grpc_aio",
     "insecure_channel",
     "secure_channel",
@@ -20,7 +20,15 @@ RPC, e.g. cancellation.
 
 from abc import ABCMeta
 from abc import abstractmethod
-from typing import Any, AsyncIterator, Generator, Generic, Optional, Union
+from typing import (
+    Any,
+    AsyncIterator,
+    Generator,
+    Generic,
+    Iterable,
+    Optional,
+    Union,
+)
 
 import grpc
 
@@ -192,6 +200,32 @@ class StreamUnaryCall(
           An RpcError exception if the write failed.
         """
 
+    async def write_many(self, requests: Iterable[RequestType]) -> None:
+        """Writes several messages to the stream.
+
+        The messages are submitted back-to-back, so that they can be
+        coalesced into fewer writes to the transport.
+
+        Raises:
+          An RpcError exception if a write failed.
+        """
+        for request in requests:
+            await self.write(request)
+
+    def cork(self) -> None:
+        """Buffers the messages of later writes until uncork is called.
+
+        Calling done_writing also writes the buffered messages. Corking is a
+        hint, which implementations may ignore by writing immediately.
+        """
+
+    async def uncork(self) -> None:
+        """Writes the messages buffered since cork was called.
+
+        Raises:
+          An RpcError exception if a write failed.
+        """
+
     @abstractmethod
     async def done_writing(self) -> None:
         """Notifies server that the client is done sending messages.
@@ -248,6 +282,32 @@ class StreamStreamCall(
           An RpcError exception if the write failed.
         """
 
+    async def write_many(self, requests: Iterable[RequestType]) -> None:
+        """Writes several messages to the stream.
+
+        The messages are submitted back-to-back, so that they can be
+        coalesced into fewer writes to the transport.
+
+        Raises:
+          An RpcError exception if a write failed.
+        """
+        for request in requests:
+            await self.write(request)
+
+    def cork(self) -> None:
+        """Buffers the messages of later writes until uncork is called.
+
+        Calling done_writing also writes the buffered messages. Corking is a
+        hint, which implementations may ignore by writing immediately.
+        """
+
+    async def uncork(self) -> None:
+        """Writes the messages buffered since cork was called.
+
+        Raises:
+          An RpcError exception if a write failed.
+        """
+
     @abstractmethod
     async def done_writing(self) -> None:
         """Notifies server that the client is done sending messages.
@@ -177,6 +177,33 @@ class ServicerContext(Generic[RequestType, ResponseType], abc.ABC):
           An RpcError exception if the write failed.
         """
 
+    async def write_many(self, messages: Iterable[ResponseType]) -> None:
+        """Writes several messages to the RPC.
+
+        The messages are submitted back-to-back, so that they can be
+        coalesced into fewer writes to the transport.
+
+        Raises:
+          An RpcError exception if a write failed.
+        """
+        for message in messages:
+            await self.write(message)
+
+    def cork(self) -> None:
+        """Buffers the messages of later writes until uncork is called.
+
+        Messages still buffered when a reader/writer handler returns are
+        written before the status. Corking is a hint, which implementations
+        may ignore by writing immediately.
+        """
+
+    async def uncork(self) -> None:
+        """Writes the messages buffered since cork was called.
+
+        Raises:
+          An RpcError exception if a write failed.
+        """
+
     @abc.abstractmethod
     async def send_initial_metadata(
         self, initial_metadata: MetadataType
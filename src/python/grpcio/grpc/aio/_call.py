@@ -24,6 +24,7 @@ from typing import (
     AsyncIterator,
     Generator,
     Generic,
+    List,
     Optional,
     Tuple,
     Union,
@@ -183,7 +184,7 @@ def _create_rpc_error(
     return AioRpcError(
         _common.CYGRPC_STATUS_CODE_TO_STATUS_CODE[status.code()],
         Metadata._create(initial_metadata),
-        Metadata.from_tuple(status.trailing_metadata()),
+        Metadata._from_metadatum_tuple(status.trailing_metadata()),
         details=status.details(),
         debug_error_string=status.debug_error_string(),
     )
@@ -212,7 +213,11 @@ class Call:
     ) -> None:
         self._loop = loop
         self._cython_call = cython_call
-        self._metadata = tuple(metadata)
+        if isinstance(metadata, Metadata):
+            # Metadata that was never mutated hands its tuple over as is.
+            self._metadata = metadata._as_tuple()
+        else:
+            self._metadata = tuple(metadata)
         self._request_serializer = request_serializer
         self._response_deserializer = response_deserializer
 
@@ -246,7 +251,7 @@ class Call:
 
     async def initial_metadata(self) -> Metadata:
         raw_metadata_tuple = await self._cython_call.initial_metadata()
-        return Metadata.from_tuple(raw_metadata_tuple)
+        return Metadata._from_metadatum_tuple(raw_metadata_tuple)
 
     async def trailing_metadata(self) -> Metadata:
         raw_metadata_tuple = (
@@ -254,7 +259,7 @@ class Call:
         ).trailing_metadata()
         if not raw_metadata_tuple:
             return Metadata()
-        return Metadata.from_tuple(raw_metadata_tuple)
+        return Metadata._from_metadatum_tuple(raw_metadata_tuple)
 
     async def code(self) -> grpc.StatusCode:
         cygrpc_code = (await self._cython_call.status()).code()
@@ -327,7 +332,7 @@ class _UnaryResponseMixin(Call, Generic[ResponseType]):
                 raise asyncio.CancelledError()
             else:
                 raise _create_rpc_error(
-                    self._cython_call._initial_metadata,
+                    self._cython_call.received_initial_metadata(),
                     self._cython_call._status,
                 )
         else:
@@ -406,12 +411,14 @@ class _StreamRequestMixin(Call, Generic[RequestType]):
     _done_writing_flag: bool
     _async_request_poller: Optional[asyncio.Task]
     _request_style: _APIStyle
+    _corked_requests: Optional[List[bytes]]
 
     def _init_stream_request_mixin(
         self, request_iterator: Optional[RequestIterableType]
     ):
         self._metadata_sent = asyncio.Event()
         self._done_writing_flag = False
+        self._corked_requests = None
 
         # If user passes in an async iterator, create a consumer Task.
         if request_iterator is not None:
@@ -490,14 +497,18 @@ class _StreamRequestMixin(Call, Generic[RequestType]):
             raise asyncio.InvalidStateError(_RPC_ALREADY_FINISHED_DETAILS)
         if self._done_writing_flag:
             raise asyncio.InvalidStateError(_RPC_HALF_CLOSED_DETAILS)
+
+        serialized_request = _common.serialize(
+            request, self._request_serializer
+        )
+        if self._corked_requests is not None:
+            self._corked_requests.append(serialized_request)
+            return
         if not self._metadata_sent.is_set():
             await self._metadata_sent.wait()
             if self.done():
                 await self._raise_for_status()
 
-        serialized_request = _common.serialize(
-            request, self._request_serializer
-        )
         try:
             await self._cython_call.send_serialized_message(serialized_request)
         except cygrpc.InternalError as err:
@@ -508,10 +519,60 @@ class _StreamRequestMixin(Call, Generic[RequestType]):
                 self.cancel()
             raise
 
+    async def _write_many(self, requests: Iterable[RequestType]) -> None:
+        if self.done():
+            raise asyncio.InvalidStateError(_RPC_ALREADY_FINISHED_DETAILS)
+        if self._done_writing_flag:
+            raise asyncio.InvalidStateError(_RPC_HALF_CLOSED_DETAILS)
+
+        serialized_requests = [
+            _common.serialize(request, self._request_serializer)
+            for request in requests
+        ]
+        if self._corked_requests is not None:
+            self._corked_requests.extend(serialized_requests)
+        else:
+            await self._send_serialized_requests(serialized_requests)
+
+    async def _uncork(self) -> None:
+        serialized_requests = self._corked_requests
+        self._corked_requests = None
+        if serialized_requests:
+            await self._send_serialized_requests(serialized_requests)
+
+    async def _send_serialized_requests(
+        self, serialized_requests: List[bytes]
+    ) -> None:
+        if not serialized_requests:
+            return
+        if not self._metadata_sent.is_set():
+            await self._metadata_sent.wait()
+            if self.done():
+                await self._raise_for_status()
+
+        try:
+            if len(serialized_requests) == 1:
+                await self._cython_call.send_serialized_message(
+                    serialized_requests[0]
+                )
+            else:
+                await self._cython_call.send_serialized_messages(
+                    serialized_requests
+                )
+        except cygrpc.InternalError as err:
+            self._cython_call.set_internal_error(str(err))
+            await self._raise_for_status()
+        except asyncio.CancelledError:
+            if not self.cancelled():
+                self.cancel()
+            raise
+
     async def _done_writing(self) -> None:
         if self.done():
             # If the RPC is finished, do nothing.
             return
+        if self._corked_requests is not None:
+            await self._uncork()
         if not self._done_writing_flag:
             # If the done writing is not sent before, try to send it.
             self._done_writing_flag = True
@@ -526,6 +587,19 @@ class _StreamRequestMixin(Call, Generic[RequestType]):
         self._raise_for_different_style(_APIStyle.READER_WRITER)
         await self._write(request)
 
+    async def write_many(self, requests: Iterable[RequestType]) -> None:
+        self._raise_for_different_style(_APIStyle.READER_WRITER)
+        await self._write_many(requests)
+
+    def cork(self) -> None:
+        self._raise_for_different_style(_APIStyle.READER_WRITER)
+        if self._corked_requests is None:
+            self._corked_requests = []
+
+    async def uncork(self) -> None:
+        self._raise_for_different_style(_APIStyle.READER_WRITER)
+        await self._uncork()
+
     async def done_writing(self) -> None:
         """Signal peer that client is done writing.
 
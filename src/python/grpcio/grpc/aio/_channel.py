@@ -14,7 +14,8 @@
 """Invocation-side implementation of gRPC Asyncio Python."""
 
 import asyncio
-from typing import Any, List, Optional, Sequence
+import functools
+from typing import Any, List, Optional, Sequence, Tuple
 import weakref
 
 import grpc
@@ -29,7 +30,9 @@ from ._call import StreamStreamCall
 from ._call import StreamUnaryCall
 from ._call import UnaryStreamCall
 from ._call import UnaryUnaryCall
+from ._interceptor import ClientCallDetails
 from ._interceptor import ClientInterceptor
+from ._interceptor import FastClientInterceptor
 from ._interceptor import InterceptedStreamStreamCall
 from ._interceptor import InterceptedStreamUnaryCall
 from ._interceptor import InterceptedUnaryStreamCall
@@ -38,6 +41,7 @@ from ._interceptor import StreamStreamClientInterceptor
 from ._interceptor import StreamUnaryClientInterceptor
 from ._interceptor import UnaryStreamClientInterceptor
 from ._interceptor import UnaryUnaryClientInterceptor
+from ._interceptor import _run_fast_interceptors_done
 from ._metadata import Metadata
 from ._typing import ChannelArgumentType
 from ._typing import DeserializingFunction
@@ -50,6 +54,15 @@ from ._utils import _timeout_to_deadline
 
 _USER_AGENT = "grpc-python-asyncio/{}".format(_grpcio_metadata.__version__)
 
+# The method, timeout, metadata, credentials and wait_for_ready of a call.
+_CallDetailsType = Tuple[
+    bytes,
+    Optional[float],
+    Metadata,
+    Optional[grpc.CallCredentials],
+    Optional[bool],
+]
+
 
 def _augment_channel_arguments(
     base_options: ChannelArgumentType, compression: Optional[grpc.Compression]
@@ -82,6 +95,7 @@ class _BaseMultiCallable:
     _request_serializer: Optional[SerializingFunction]
     _response_deserializer: Optional[DeserializingFunction]
     _interceptors: Optional[Sequence[ClientInterceptor]]
+    _fast_interceptors: Sequence[FastClientInterceptor]
     _references: List[Any]
     _loop: asyncio.AbstractEventLoop
 
@@ -95,6 +109,7 @@ class _BaseMultiCallable:
         interceptors: Optional[Sequence[ClientInterceptor]],
         references: List[Any],
         loop: asyncio.AbstractEventLoop,
+        fast_interceptors: Sequence[FastClientInterceptor] = (),
     ) -> None:
         self._loop = loop
         self._channel = channel
@@ -102,6 +117,7 @@ class _BaseMultiCallable:
         self._request_serializer = request_serializer
         self._response_deserializer = response_deserializer
         self._interceptors = interceptors
+        self._fast_interceptors = fast_interceptors
         self._references = references
 
         if not self._references:
@@ -133,11 +149,53 @@ class _BaseMultiCallable:
         ):
             metadata = Metadata.from_tuple(tuple(metadata))
         if compression:
-            metadata = Metadata(
-                *_compression.augment_metadata(metadata, compression)
+            metadata = metadata + (
+                _compression.compression_algorithm_to_metadata(compression),
             )
         return metadata
 
+    def _call_details(
+        self,
+        timeout: Optional[float],
+        metadata: Metadata,
+        credentials: Optional[grpc.CallCredentials],
+        wait_for_ready: Optional[bool],
+    ) -> _CallDetailsType:
+        """Returns the method, timeout, metadata, credentials and
+        wait_for_ready of a call, as adjusted by the fast interceptors.
+
+        The fast interceptors' pre-call hooks run inline. When there are any,
+        the result is the ClientCallDetails they produced.
+        """
+        if not self._fast_interceptors:
+            return self._method, timeout, metadata, credentials, wait_for_ready
+        client_call_details = ClientCallDetails(
+            self._method, timeout, metadata, credentials, wait_for_ready
+        )
+        for interceptor in self._fast_interceptors:
+            client_call_details = interceptor.intercept_call_details(
+                client_call_details
+            )
+        return client_call_details
+
+    def _register_call(
+        self,
+        call: _base_call.Call,
+        call_details: _CallDetailsType,
+    ) -> None:
+        """Registers a call with the channel, and has the fast interceptors'
+        done hooks run once it ends.
+        """
+        if self._fast_interceptors:
+            call.add_done_callback(
+                functools.partial(
+                    _run_fast_interceptors_done,
+                    self._fast_interceptors,
+                    call_details,
+                )
+            )
+        self._python_channel._register_call(call)
+
 
 class UnaryUnaryMultiCallable(
     _BaseMultiCallable, _base_channel.UnaryUnaryMultiCallable
@@ -153,6 +211,10 @@ class UnaryUnaryMultiCallable(
         compression: Optional[grpc.Compression] = None,
     ) -> _base_call.UnaryUnaryCall[RequestType, ResponseType]:
         metadata = self._init_metadata(metadata, compression)
+        call_details = self._call_details(
+            timeout, metadata, credentials, wait_for_ready
+        )
+        method, timeout, metadata, credentials, wait_for_ready = call_details
         if not self._interceptors:
             call = UnaryUnaryCall(
                 request,
@@ -161,7 +223,7 @@ class UnaryUnaryMultiCallable(
                 credentials,
                 wait_for_ready,
                 self._channel,
-                self._method,
+                method,
                 self._request_serializer,
                 self._response_deserializer,
                 self._loop,
@@ -175,13 +237,13 @@ class UnaryUnaryMultiCallable(
                 credentials,
                 wait_for_ready,
                 self._channel,
-                self._method,
+                method,
                 self._request_serializer,
                 self._response_deserializer,
                 self._loop,
             )
 
-        self._python_channel._register_call(call)
+        self._register_call(call, call_details)
 
         return call
 
@@ -200,6 +262,10 @@ class UnaryStreamMultiCallable(
         compression: Optional[grpc.Compression] = None,
     ) -> _base_call.UnaryStreamCall[RequestType, ResponseType]:
         metadata = self._init_metadata(metadata, compression)
+        call_details = self._call_details(
+            timeout, metadata, credentials, wait_for_ready
+        )
+        method, timeout, metadata, credentials, wait_for_ready = call_details
 
         if not self._interceptors:
             call = UnaryStreamCall(
@@ -209,7 +275,7 @@ class UnaryStreamMultiCallable(
                 credentials,
                 wait_for_ready,
                 self._channel,
-                self._method,
+                method,
                 self._request_serializer,
                 self._response_deserializer,
                 self._loop,
@@ -223,13 +289,13 @@ class UnaryStreamMultiCallable(
                 credentials,
                 wait_for_ready,
                 self._channel,
-                self._method,
+                method,
                 self._request_serializer,
                 self._response_deserializer,
                 self._loop,
             )
 
-        self._python_channel._register_call(call)
+        self._register_call(call, call_details)
 
         return call
 
@@ -247,6 +313,10 @@ class StreamUnaryMultiCallable(
         compression: Optional[grpc.Compression] = None,
     ) -> _base_call.StreamUnaryCall:
         metadata = self._init_metadata(metadata, compression)
+        call_details = self._call_details(
+            timeout, metadata, credentials, wait_for_ready
+        )
+        method, timeout, metadata, credentials, wait_for_ready = call_details
 
         if not self._interceptors:
             call = StreamUnaryCall(
@@ -256,7 +326,7 @@ class StreamUnaryMultiCallable(
                 credentials,
                 wait_for_ready,
                 self._channel,
-                self._method,
+                method,
                 self._request_serializer,
                 self._response_deserializer,
                 self._loop,
@@ -270,13 +340,13 @@ class StreamUnaryMultiCallable(
                 credentials,
                 wait_for_ready,
                 self._channel,
-                self._method,
+                method,
                 self._request_serializer,
                 self._response_deserializer,
                 self._loop,
             )
 
-        self._python_channel._register_call(call)
+        self._register_call(call, call_details)
 
         return call
 
@@ -294,6 +364,10 @@ class StreamStreamMultiCallable(
         compression: Optional[grpc.Compression] = None,
     ) -> _base_call.StreamStreamCall:
         metadata = self._init_metadata(metadata, compression)
+        call_details = self._call_details(
+            timeout, metadata, credentials, wait_for_ready
+        )
+        method, timeout, metadata, credentials, wait_for_ready = call_details
 
         if not self._interceptors:
             call = StreamStreamCall(
@@ -303,7 +377,7 @@ class StreamStreamMultiCallable(
                 credentials,
                 wait_for_ready,
                 self._channel,
-                self._method,
+                method,
                 self._request_serializer,
                 self._response_deserializer,
                 self._loop,
@@ -317,13 +391,13 @@ class StreamStreamMultiCallable(
                 credentials,
                 wait_for_ready,
                 self._channel,
-                self._method,
+                method,
                 self._request_serializer,
                 self._response_deserializer,
                 self._loop,
             )
 
-        self._python_channel._register_call(call)
+        self._register_call(call, call_details)
 
         return call
 
@@ -335,6 +409,7 @@ class Channel(_base_channel.Channel):
     _unary_stream_interceptors: List[UnaryStreamClientInterceptor]
     _stream_unary_interceptors: List[StreamUnaryClientInterceptor]
     _stream_stream_interceptors: List[StreamStreamClientInterceptor]
+    _fast_interceptors: List[FastClientInterceptor]
 
     def __init__(
         self,
@@ -359,10 +434,13 @@ class Channel(_base_channel.Channel):
         self._unary_stream_interceptors = []
         self._stream_unary_interceptors = []
         self._stream_stream_interceptors = []
+        self._fast_interceptors = []
 
         if interceptors is not None:
             for interceptor in interceptors:
-                if isinstance(interceptor, UnaryUnaryClientInterceptor):
+                if isinstance(interceptor, FastClientInterceptor):
+                    self._fast_interceptors.append(interceptor)
+                elif isinstance(interceptor, UnaryUnaryClientInterceptor):
                     self._unary_unary_interceptors.append(interceptor)
                 elif isinstance(interceptor, UnaryStreamClientInterceptor):
                     self._unary_stream_interceptors.append(interceptor)
@@ -376,7 +454,10 @@ class Channel(_base_channel.Channel):
                         + "{} or ".format(UnaryUnaryClientInterceptor.__name__)
                         + "{} or ".format(UnaryStreamClientInterceptor.__name__)
                         + "{} or ".format(StreamUnaryClientInterceptor.__name__)
-                        + "{}. ".format(StreamStreamClientInterceptor.__name__)
+                        + "{} or ".format(
+                            StreamStreamClientInterceptor.__name__
+                        )
+                        + "{}. ".format(FastClientInterceptor.__name__)
                     )
 
         self._loop = cygrpc.get_working_loop()
@@ -506,6 +587,7 @@ class Channel(_base_channel.Channel):
             self._unary_unary_interceptors,
             [self],
             self._loop,
+            self._fast_interceptors,
         )
 
     # TODO(xuanwn): Implement _registered_method after we have
@@ -526,6 +608,7 @@ class Channel(_base_channel.Channel):
             self._unary_stream_interceptors,
             [self],
             self._loop,
+            self._fast_interceptors,
         )
 
     # TODO(xuanwn): Implement _registered_method after we have
@@ -546,6 +629,7 @@ class Channel(_base_channel.Channel):
             self._stream_unary_interceptors,
             [self],
             self._loop,
+            self._fast_interceptors,
         )
 
     # TODO(xuanwn): Implement _registered_method after we have
@@ -566,6 +650,7 @@ class Channel(_base_channel.Channel):
             self._stream_stream_interceptors,
             [self],
             self._loop,
+            self._fast_interceptors,
         )
 
 
@@ -627,3 +712,30 @@ def secure_channel(
         compression,
         interceptors,
     )
+
+
+async def channels_ready(
+    channels: Sequence[_base_channel.Channel],
+    timeout: Optional[float] = None,
+) -> None:
+    """Waits until all the given channels are ready.
+
+    This is an EXPERIMENTAL API.
+
+    Every channel is asked to connect and the connectivity of all of them is
+    watched concurrently, so warming up many channels takes about as long as
+    the slowest one.
+
+    Args:
+      channels: The channels to wait for.
+      timeout: An optional duration of time in seconds to wait for. None means
+        waiting indefinitely.
+
+    Raises:
+      asyncio.TimeoutError: If some of the channels are not ready before the
+        timeout.
+    """
+    await asyncio.wait_for(
+        asyncio.gather(*(channel.channel_ready() for channel in channels)),
+        timeout,
+    )
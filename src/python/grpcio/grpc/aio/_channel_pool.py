@@ -0,0 +1,377 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""An asyncio Channel spreading RPCs over several channels."""
+
+import asyncio
+import functools
+from typing import Any, Callable, List, Optional, Sequence
+
+import grpc
+from grpc._channel_pool import _CONNECTIVITY_PRECEDENCE
+from grpc._channel_pool import _LOCAL_SUBCHANNEL_POOL_OPTION
+from grpc._channel_pool import _OutstandingCalls
+
+from . import _base_call
+from . import _base_channel
+from ._channel import Channel
+from ._interceptor import ClientInterceptor
+from ._typing import ChannelArgumentType
+from ._typing import DeserializingFunction
+from ._typing import MetadataType
+from ._typing import RequestIterableType
+from ._typing import RequestType
+from ._typing import SerializingFunction
+
+
+class _PooledMultiCallable:
+    _multi_callables: Sequence[Any]
+    _outstanding_calls: _OutstandingCalls
+
+    def __init__(
+        self,
+        multi_callables: Sequence[Any],
+        outstanding_calls: _OutstandingCalls,
+    ):
+        self._multi_callables = multi_callables
+        self._outstanding_calls = outstanding_calls
+
+    def _invoke(
+        self, invoker: Callable[[Any], _base_call.Call]
+    ) -> _base_call.Call:
+        index = self._outstanding_calls.acquire()
+        try:
+            call = invoker(self._multi_callables[index])
+        except BaseException:
+            self._outstanding_calls.release(index)
+            raise
+        call.add_done_callback(
+            functools.partial(self._outstanding_calls.release_when_done, index)
+        )
+        return call
+
+
+class _UnaryUnaryMultiCallable(
+    _PooledMultiCallable, _base_channel.UnaryUnaryMultiCallable
+):
+    def __call__(
+        self,
+        request: RequestType,
+        *,
+        timeout: Optional[float] = None,
+        metadata: Optional[MetadataType] = None,
+        credentials: Optional[grpc.CallCredentials] = None,
+        wait_for_ready: Optional[bool] = None,
+        compression: Optional[grpc.Compression] = None,
+    ) -> _base_call.UnaryUnaryCall:
+        return self._invoke(
+            lambda multi_callable: multi_callable(
+                request,
+                timeout=timeout,
+                metadata=metadata,
+                credentials=credentials,
+                wait_for_ready=wait_for_ready,
+                compression=compression,
+            )
+        )
+
+
+class _UnaryStreamMultiCallable(
+    _PooledMultiCallable, _base_channel.UnaryStreamMultiCallable
+):
+    def __call__(
+        self,
+        request: RequestType,
+        *,
+        timeout: Optional[float] = None,
+        metadata: Optional[MetadataType] = None,
+        credentials: Optional[grpc.CallCredentials] = None,
+        wait_for_ready: Optional[bool] = None,
+        compression: Optional[grpc.Compression] = None,
+    ) -> _base_call.UnaryStreamCall:
+        return self._invoke(
+            lambda multi_callable: multi_callable(
+                request,
+                timeout=timeout,
+                metadata=metadata,
+                credentials=credentials,
+                wait_for_ready=wait_for_ready,
+                compression=compression,
+            )
+        )
+
+
+class _StreamUnaryMultiCallable(
+    _PooledMultiCallable, _base_channel.StreamUnaryMultiCallable
+):
+    def __call__(
+        self,
+        request_iterator: Optional[RequestIterableType] = None,
+        timeout: Optional[float] = None,
+        metadata: Optional[MetadataType] = None,
+        credentials: Optional[grpc.CallCredentials] = None,
+        wait_for_ready: Optional[bool] = None,
+        compression: Optional[grpc.Compression] = None,
+    ) -> _base_call.StreamUnaryCall:
+        return self._invoke(
+            lambda multi_callable: multi_callable(
+                request_iterator,
+                timeout=timeout,
+                metadata=metadata,
+                credentials=credentials,
+                wait_for_ready=wait_for_ready,
+                compression=compression,
+            )
+        )
+
+
+class _StreamStreamMultiCallable(
+    _PooledMultiCallable, _base_channel.StreamStreamMultiCallable
+):
+    def __call__(
+        self,
+        request_iterator: Optional[RequestIterableType] = None,
+        timeout: Optional[float] = None,
+        metadata: Optional[MetadataType] = None,
+        credentials: Optional[grpc.CallCredentials] = None,
+        wait_for_ready: Optional[bool] = None,
+        compression: Optional[grpc.Compression] = None,
+    ) -> _base_call.StreamStreamCall:
+        return self._invoke(
+            lambda multi_callable: multi_callable(
+                request_iterator,
+                timeout=timeout,
+                metadata=metadata,
+                credentials=credentials,
+                wait_for_ready=wait_for_ready,
+                compression=compression,
+            )
+        )
+
+
+class ChannelPool(_base_channel.Channel):
+    """An asyncio Channel backed by several channels to the same target.
+
+    Each RPC is started on the channel with the fewest outstanding RPCs.
+    """
+
+    _channels: Sequence[Channel]
+    _outstanding_calls: _OutstandingCalls
+
+    def __init__(
+        self,
+        target: str,
+        size: int,
+        credentials: Optional[grpc.ChannelCredentials],
+        options: Optional[ChannelArgumentType],
+        compression: Optional[grpc.Compression],
+        interceptors: Optional[Sequence[ClientInterceptor]],
+    ):
+        """Constructor.
+
+        Args:
+          target: The target to which to connect.
+          size: The number of channels in the pool.
+          credentials: A grpc.ChannelCredentials or None for insecure
+            channels.
+          options: Configuration options for the channels.
+          compression: An optional value indicating the compression method to
+            be used over the lifetime of the channels.
+          interceptors: An optional list of interceptors that would be used
+            for intercepting any RPC executed with the channels.
+        """
+        if size < 1:
+            error_msg = f"size must be positive, got {size}."
+            raise ValueError(error_msg)
+        options = (
+            *(() if options is None else options),
+            _LOCAL_SUBCHANNEL_POOL_OPTION,
+        )
+        self._channels = tuple(
+            Channel(
+                target,
+                options,
+                None if credentials is None else credentials._credentials,
+                compression,
+                interceptors,
+            )
+            for _ in range(size)
+        )
+        self._outstanding_calls = _OutstandingCalls(size)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close(None)
+
+    async def close(self, grace: Optional[float] = None):
+        await asyncio.gather(
+            *(channel.close(grace) for channel in self._channels)
+        )
+
+    def get_state(
+        self, try_to_connect: bool = False
+    ) -> grpc.ChannelConnectivity:
+        states = {
+            channel.get_state(try_to_connect) for channel in self._channels
+        }
+        for state in _CONNECTIVITY_PRECEDENCE:
+            if state in states:
+                return state
+        return grpc.ChannelConnectivity.SHUTDOWN
+
+    async def wait_for_state_change(
+        self,
+        last_observed_state: grpc.ChannelConnectivity,
+    ) -> None:
+        while self.get_state() == last_observed_state:
+            watchers = [
+                asyncio.ensure_future(
+                    channel.wait_for_state_change(channel.get_state())
+                )
+                for channel in self._channels
+            ]
+            try:
+                await asyncio.wait(
+                    watchers, return_when=asyncio.FIRST_COMPLETED
+                )
+            finally:
+                for watcher in watchers:
+                    watcher.cancel()
+
+    async def channel_ready(self) -> None:
+        await asyncio.gather(
+            *(channel.channel_ready() for channel in self._channels)
+        )
+
+    # pylint: disable=arguments-differ
+    def unary_unary(
+        self,
+        method: str,
+        request_serializer: Optional[SerializingFunction] = None,
+        response_deserializer: Optional[DeserializingFunction] = None,
+        _registered_method: Optional[bool] = False,
+    ) -> _UnaryUnaryMultiCallable:
+        return _UnaryUnaryMultiCallable(
+            [
+                channel.unary_unary(
+                    method,
+                    request_serializer,
+                    response_deserializer,
+                    _registered_method,
+                )
+                for channel in self._channels
+            ],
+            self._outstanding_calls,
+        )
+
+    # pylint: disable=arguments-differ
+    def unary_stream(
+        self,
+        method: str,
+        request_serializer: Optional[SerializingFunction] = None,
+        response_deserializer: Optional[DeserializingFunction] = None,
+        _registered_method: Optional[bool] = False,
+    ) -> _UnaryStreamMultiCallable:
+        return _UnaryStreamMultiCallable(
+            [
+                channel.unary_stream(
+                    method,
+                    request_serializer,
+                    response_deserializer,
+                    _registered_method,
+                )
+                for channel in self._channels
+            ],
+            self._outstanding_calls,
+        )
+
+    # pylint: disable=arguments-differ
+    def stream_unary(
+        self,
+        method: str,
+        request_serializer: Optional[SerializingFunction] = None,
+        response_deserializer: Optional[DeserializingFunction] = None,
+        _registered_method: Optional[bool] = False,
+    ) -> _StreamUnaryMultiCallable:
+        return _StreamUnaryMultiCallable(
+            [
+                channel.stream_unary(
+                    method,
+                    request_serializer,
+                    response_deserializer,
+                    _registered_method,
+                )
+                for channel in self._channels
+            ],
+            self._outstanding_calls,
+        )
+
+    # pylint: disable=arguments-differ
+    def stream_stream(
+        self,
+        method: str,
+        request_serializer: Optional[SerializingFunction] = None,
+        response_deserializer: Optional[DeserializingFunction] = None,
+        _registered_method: Optional[bool] = False,
+    ) -> _StreamStreamMultiCallable:
+        return _StreamStreamMultiCallable(
+            [
+                channel.stream_stream(
+                    method,
+                    request_serializer,
+                    response_deserializer,
+                    _registered_method,
+                )
+                for channel in self._channels
+            ],
+            self._outstanding_calls,
+        )
+
+
+def channel_pool(
+    target: str,
+    size: int,
+    credentials: Optional[grpc.ChannelCredentials] = None,
+    options: Optional[ChannelArgumentType] = None,
+    compression: Optional[grpc.Compression] = None,
+    interceptors: Optional[Sequence[ClientInterceptor]] = None,
+):
+    """Creates an asynchronous Channel that spreads RPCs over several channels.
+
+    This is an EXPERIMENTAL API.
+
+    The returned Channel owns `size` channels to the same target, each with
+    its own connections, and starts every RPC on the one with the fewest
+    outstanding RPCs. It affords the same multicallables as any other
+    Channel, so stubs can be created on it unchanged.
+
+    Args:
+      target: The server address.
+      size: The number of channels in the pool.
+      credentials: An optional ChannelCredentials instance. The channels are
+        insecure if None is passed.
+      options: An optional list of key-value pairs (:term:`channel_arguments`
+        in gRPC Core runtime) to configure the channels.
+      compression: An optional value indicating the compression method to be
+        used over the lifetime of the channels.
+      interceptors: An optional sequence of interceptors that will be executed
+        for any call executed with the channels.
+
+    Returns:
+      A Channel.
+    """
+    return ChannelPool(
+        target, size, credentials, options, compression, interceptors
+    )
@@ -19,7 +19,9 @@ from abc import abstractmethod
 import asyncio
 import collections
 import functools
+import logging
 from typing import (
+    Any,
     AsyncIterable,
     AsyncIterator,
     Awaitable,
@@ -31,10 +33,12 @@ from typing import (
 )
 
 import grpc
+from grpc import _common
 from grpc._cython import cygrpc
 
 from . import _base_call
 from ._call import AioRpcError
+from ._call import Call
 from ._call import StreamStreamCall
 from ._call import StreamUnaryCall
 from ._call import UnaryStreamCall
@@ -55,6 +59,8 @@ from ._utils import _timeout_to_deadline
 
 _LOCAL_CANCELLATION_DETAILS = "Locally cancelled by application!"
 
+_LOGGER = logging.getLogger(__name__)
+
 
 class ServerInterceptor(metaclass=ABCMeta):
     """Affords intercepting incoming RPCs on the service-side.
@@ -288,6 +294,45 @@ class StreamStreamClientInterceptor(ClientInterceptor, metaclass=ABCMeta):
         """
 
 
+class FastClientInterceptor(ClientInterceptor):
+    """Affords intercepting invocations of any arity with synchronous hooks.
+
+    This is an EXPERIMENTAL API.
+
+    Unlike the other client interceptors, a fast interceptor neither wraps
+    the call nor gets a continuation. Its hooks are run inline by the
+    multicallable, before the call is started and once it is done, so no
+    task or future is created on its behalf. The hooks must not block.
+
+    Fast interceptors run before any other interceptor of the channel.
+    """
+
+    def intercept_call_details(
+        self, client_call_details: ClientCallDetails
+    ) -> ClientCallDetails:
+        """Intercepts the details of an RPC before it is started.
+
+        Args:
+          client_call_details: A ClientCallDetails object describing the
+            outgoing RPC.
+
+        Returns:
+          The ClientCallDetails the RPC will be started with. The default
+          implementation returns `client_call_details` unchanged.
+        """
+        return client_call_details
+
+    def intercept_done(
+        self, client_call_details: ClientCallDetails, code: grpc.StatusCode
+    ) -> None:
+        """Intercepts the termination of an RPC.
+
+        Args:
+          client_call_details: The ClientCallDetails the RPC was started with.
+          code: The StatusCode the RPC terminated with.
+        """
+
+
 class InterceptedCall:
     """Base implementation for all intercepted call arities.
 
@@ -1186,3 +1231,41 @@ class StreamStreamCallResponseIterator(
     @property
     def _done_writing_flag(self) -> bool:
         return self._call._done_writing_flag
+
+
+def _done_call_code(call: Any) -> grpc.StatusCode:
+    """Returns the status code of a call that is known to be done."""
+    # Unwraps the calls made by interceptors down to the one that finished.
+    while isinstance(call, (InterceptedCall, _StreamCallResponseIterator)):
+        if isinstance(call, _StreamCallResponseIterator):
+            call = call._call
+            continue
+        interceptors_task = call._interceptors_task
+        if interceptors_task.cancelled():
+            return grpc.StatusCode.CANCELLED
+        exception = interceptors_task.exception()
+        if exception is not None:
+            if isinstance(exception, AioRpcError):
+                return exception.code()
+            return grpc.StatusCode.UNKNOWN
+        call = interceptors_task.result()
+    if isinstance(call, UnaryUnaryCallResponse):
+        return grpc.StatusCode.OK
+    if isinstance(call, Call):
+        return _common.CYGRPC_STATUS_CODE_TO_STATUS_CODE[
+            call._cython_call._status.code()
+        ]
+    return grpc.StatusCode.UNKNOWN
+
+
+def _run_fast_interceptors_done(
+    interceptors: Sequence[FastClientInterceptor],
+    client_call_details: ClientCallDetails,
+    call: _base_call.Call,
+) -> None:
+    code = _done_call_code(call)
+    for interceptor in reversed(interceptors):
+        try:
+            interceptor.intercept_done(client_call_details, code)
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Exception in intercept_done of %s", interceptor)
@@ -24,7 +24,7 @@ from collections.abc import (
     Sequence,
     ValuesView,
 )
-from typing import Any, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from typing_extensions import Self
 
@@ -34,6 +34,52 @@ MetadatumType = Tuple[MetadataKey, MetadataValue]
 MetadataType = Union["Metadata", Sequence[MetadatumType]]
 
 
+def _as_metadatum_tuple(
+    raw_metadata: Iterable[MetadatumType],
+) -> Tuple[MetadatumType, ...]:
+    """Returns <raw_metadata> as a tuple of key/value pairs.
+
+    A tuple that already holds only key/value tuples is returned as is;
+    anything else is unpacked, raising the usual errors for entries that are
+    not key/value pairs.
+    """
+    if type(raw_metadata) is tuple and all(
+        type(metadatum) is tuple and len(metadatum) == 2
+        for metadatum in raw_metadata
+    ):
+        return raw_metadata
+    return tuple((md_key, md_value) for md_key, md_value in raw_metadata)
+
+
+def _group_by_key(
+    metadata: Tuple[MetadatumType, ...],
+) -> Tuple[MetadatumType, ...]:
+    """Returns <metadata> with the values of each key next to each other,
+    keys in order of first appearance.
+
+    Metadata whose keys are already grouped, the common case, is returned as
+    is.
+    """
+    seen_keys = set()
+    previous_key = None
+    for md_key, _ in metadata:
+        if md_key != previous_key:
+            if md_key in seen_keys:
+                break
+            seen_keys.add(md_key)
+            previous_key = md_key
+    else:
+        return metadata
+    index = OrderedDict()
+    for md_key, md_value in metadata:
+        index.setdefault(md_key, []).append(md_value)
+    return tuple(
+        (md_key, md_value)
+        for md_key, md_values in index.items()
+        for md_value in md_values
+    )
+
+
 class Metadata(Collection):  # noqa: PLW1641
     """Metadata abstraction for the asynchronous calls and interceptors.
 
@@ -45,19 +91,29 @@ class Metadata(Collection):  # noqa: PLW1641
         * Getting by an element by key, retrieves the first mapped value
         * Supports an immutable view of the data
         * Allows partial mutation on the data without recreating the new object from scratch.
+
+    Metadata starts out as a tuple of key/value pairs grouped by key, the
+    form exchanged with the Core, so that passing it through a call copies
+    nothing. The first mutation, or request for a live view such as
+    get_all() or items(), moves it into a mapping from key to list of values,
+    which then backs it for good.
     """
 
+    __slots__ = ("_index", "_metadata")
+
+    _metadata: Optional[Tuple[MetadatumType, ...]]
+    _index: Optional[Dict[MetadataKey, List[MetadataValue]]]
+
     def __init__(self, *args: MetadatumType) -> None:
-        self._metadata = OrderedDict()
-        for md_key, md_value in args:
-            self.add(md_key, md_value)
+        self._metadata = _group_by_key(_as_metadatum_tuple(args))
+        self._index = None
 
     @classmethod
     def from_tuple(cls, raw_metadata: tuple):
         # Note: We unintentionally support non-tuple arguments here. We plan
         # to emit a DeprecationWarning when a non-tuple type is used.
         if raw_metadata:
-            return cls(*raw_metadata)
+            return cls._from_metadatum_tuple(_as_metadatum_tuple(raw_metadata))
         return cls()
 
     @classmethod
@@ -72,26 +128,69 @@ class Metadata(Collection):  # noqa: PLW1641
         if isinstance(raw_metadata, cls):
             return raw_metadata
         if raw_metadata:
-            return cls(*raw_metadata)
+            return cls._from_metadatum_tuple(_as_metadatum_tuple(raw_metadata))
         return cls()
 
+    @classmethod
+    def _from_metadatum_tuple(cls, metadata: Tuple[MetadatumType, ...]) -> Self:
+        """Wraps a tuple of key/value pairs, without copying it if its keys
+        are already grouped.
+        """
+        instance = cls.__new__(cls)
+        instance._metadata = _group_by_key(metadata)
+        instance._index = None
+        return instance
+
+    def _get_index(self) -> Dict[MetadataKey, List[MetadataValue]]:
+        if self._index is None:
+            index = OrderedDict()
+            for md_key, md_value in self._metadata:
+                index.setdefault(md_key, []).append(md_value)
+            self._index = index
+            self._metadata = None
+        return self._index
+
+    def _as_tuple(self) -> Tuple[MetadatumType, ...]:
+        """Returns the key/value pairs, grouped by key."""
+        if self._metadata is not None:
+            return self._metadata
+        return tuple(
+            (md_key, md_value)
+            for md_key, md_values in self._index.items()
+            for md_value in md_values
+        )
+
     def add(self, key: MetadataKey, value: MetadataValue) -> None:
-        self._metadata.setdefault(key, [])
-        self._metadata[key].append(value)
+        metadata = self._metadata
+        if metadata is not None and (
+            not metadata
+            or metadata[-1][0] == key
+            or all(md_key != key for md_key, _ in metadata)
+        ):
+            self._metadata = (*metadata, (key, value))
+            return
+        self._get_index().setdefault(key, []).append(value)
 
     def __len__(self) -> int:
         """Return the total number of elements that there are in the metadata,
         including multiple values for the same key.
         """
-        return sum(map(len, self._metadata.values()))
+        if self._metadata is not None:
+            return len(self._metadata)
+        return sum(map(len, self._index.values()))
 
     def __getitem__(self, key: MetadataKey) -> MetadataValue:
         """When calling <metadata>[<key>], the first element of all those
         mapped for <key> is returned.
         """
+        if self._metadata is not None:
+            for md_key, md_value in self._metadata:
+                if md_key == key:
+                    return md_value
+            raise KeyError(repr(key))
         try:
-            return self._metadata[key][0]
-        except (ValueError, IndexError) as e:
+            return self._index[key][0]
+        except (KeyError, IndexError) as e:
             error_msg = f"{key!r}"
             raise KeyError(error_msg) from e
 
@@ -100,35 +199,33 @@ class Metadata(Collection):  # noqa: PLW1641
         Maps <value> to the first instance of <key>.
         """
         if key not in self:
-            self._metadata[key] = [value]
+            self._get_index()[key] = [value]
         else:
             current_values = self.get_all(key)
-            self._metadata[key] = [value, *current_values[1:]]
+            self._index[key] = [value, *current_values[1:]]
 
     def __delitem__(self, key: MetadataKey) -> None:
         """``del metadata[<key>]`` deletes the first mapping for <key>."""
         current_values = self.get_all(key)
         if not current_values:
             raise KeyError(repr(key))
-        self._metadata[key] = current_values[1:]
+        self._index[key] = current_values[1:]
 
     def delete_all(self, key: MetadataKey) -> None:
         """Delete all mappings for <key>."""
-        del self._metadata[key]
+        del self._get_index()[key]
 
     def __iter__(self) -> Iterator[Tuple[MetadataKey, MetadataValue]]:
-        for key, values in self._metadata.items():
-            for value in values:
-                yield (key, value)
+        return iter(self._as_tuple())
 
     def keys(self) -> KeysView:
-        return KeysView(self._metadata)
+        return KeysView(self._get_index())
 
     def values(self) -> ValuesView:
-        return ValuesView(self._metadata)
+        return ValuesView(self._get_index())
 
     def items(self) -> ItemsView:
-        return ItemsView(self._metadata)
+        return ItemsView(self._get_index())
 
     def get(
         self, key: MetadataKey, default: Optional[MetadataValue] = None
@@ -142,28 +239,38 @@ class Metadata(Collection):  # noqa: PLW1641
         """For compatibility with other Metadata abstraction objects (like in Java),
         this would return all items under the desired <key>.
         """
-        return self._metadata.get(key, [])
+        return self._get_index().get(key, [])
 
     def set_all(self, key: MetadataKey, values: List[MetadataValue]) -> None:
-        self._metadata[key] = values
+        self._get_index()[key] = values
 
     def __contains__(self, key: MetadataKey) -> bool:
-        return key in self._metadata
+        if self._metadata is not None:
+            return any(md_key == key for md_key, _ in self._metadata)
+        return key in self._index
 
     def __eq__(self, other: object) -> bool:
         if isinstance(other, self.__class__):
-            return self._metadata == other._metadata
+            if self._metadata is not None and other._metadata is not None:
+                return self._metadata == other._metadata
+            return self._get_index() == other._get_index()
         if isinstance(other, tuple):
-            return tuple(self) == other
+            return self._as_tuple() == other
         return NotImplemented  # pytype: disable=bad-return-type
 
     def __add__(self, other: Any) -> "Metadata":
         if isinstance(other, self.__class__):
-            return Metadata(*(tuple(self) + tuple(other)))
+            return Metadata._from_metadatum_tuple(
+                self._as_tuple() + other._as_tuple()
+            )
         if isinstance(other, tuple):
-            return Metadata(*(tuple(self) + other))
+            return Metadata._from_metadatum_tuple(
+                self._as_tuple() + _as_metadatum_tuple(other)
+            )
         return NotImplemented  # pytype: disable=bad-return-type
 
+    def __reduce__(self):
+        return (self.__class__, self._as_tuple())
+
     def __repr__(self) -> str:
-        view = tuple(self)
-        return "{0}({1!r})".format(self.__class__.__name__, view)
+        return "{0}({1!r})".format(self.__class__.__name__, self._as_tuple())
@@ -14,13 +14,14 @@
 """Server-side implementation of gRPC Asyncio Python."""
 
 from concurrent.futures import Executor
-from typing import Any, Dict, Optional, Sequence
+from typing import Any, Dict, Optional, Sequence, Tuple
 
 import grpc
 from grpc import _common
 from grpc import _compression
 from grpc import _observability
 from grpc._cython import cygrpc
+import grpc.experimental
 
 from . import _base_server
 from ._interceptor import ServerInterceptor
@@ -41,6 +42,33 @@ def _augment_channel_arguments(
     )
 
 
+def _separate_server_options(
+    options: ChannelArgumentType,
+) -> Tuple[int, bool, bool, ChannelArgumentType]:
+    """Extracts the Python-only options from the server options."""
+    request_call_depth = 1
+    inline_cancellation_listener = False
+    eager_task_execution = False
+    core_options = []
+    for key, value in options:
+        if key == grpc.experimental.ServerOptions.RequestCallDepth:
+            request_call_depth = _common.validate_positive_int_option(
+                key, value
+            )
+        elif key == grpc.experimental.ServerOptions.InlineCancellationListener:
+            inline_cancellation_listener = bool(value)
+        elif key == grpc.experimental.ServerOptions.EagerTaskExecution:
+            eager_task_execution = bool(value)
+        else:
+            core_options.append((key, value))
+    return (
+        request_call_depth,
+        inline_cancellation_listener,
+        eager_task_execution,
+        core_options,
+    )
+
+
 class Server(_base_server.Server):
     """Serves RPCs."""
 
@@ -68,13 +96,22 @@ class Server(_base_server.Server):
                 # TODO(asheshvidyut): fix the value error below
                 # not caught by ruff.
                 raise ValueError(error_msg)
+        (
+            request_call_depth,
+            inline_cancellation_listener,
+            eager_task_execution,
+            core_options,
+        ) = _separate_server_options(options)
         self._server = cygrpc.AioServer(
             self._loop,
             thread_pool,
             generic_handlers,
             interceptors,
-            _augment_channel_arguments(options, compression),
+            _augment_channel_arguments(core_options, compression),
             maximum_concurrent_rpcs,
+            request_call_depth,
+            inline_cancellation_listener,
+            eager_task_execution,
         )
 
     def add_generic_rpc_handlers(
@@ -95,8 +132,28 @@ class Server(_base_server.Server):
         service_name: str,
         method_handlers: Dict[str, grpc.RpcMethodHandler],
     ) -> None:
-        # TODO(xuanwn): Implement this for AsyncIO.
-        pass
+        """Registers method handlers for a service with this Server.
+
+        Calls to these methods are matched by gRPC Core and dispatched to
+        their handler directly, rather than through the generic handlers.
+        If the same method has both a generic and a registered handler, the
+        registered handler takes precedence.
+
+        This method is only safe to call before the server is started.
+
+        Args:
+          service_name: The service name.
+          method_handlers: A dictionary that maps method names to corresponding
+            RpcMethodHandler.
+        """
+        self._server.add_registered_method_handlers(
+            {
+                _common.fully_qualified_method(
+                    service_name, method
+                ): method_handler
+                for method, method_handler in method_handlers.items()
+            }
+        )
 
     def add_insecure_port(self, address: str) -> int:
         """Opens an insecure port for accepting RPCs.
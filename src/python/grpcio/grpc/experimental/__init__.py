@@ -24,6 +24,7 @@ from typing import Callable, Optional, Union
 import warnings
 
 import grpc
+from grpc import _common
 from grpc._cython import cygrpc as _cygrpc
 
 _EXPERIMENTAL_APIS_USED = set()
@@ -36,9 +37,74 @@ class ChannelOptions:
 
     Attributes:
       SingleThreadedUnaryStream: Perform unary-stream RPCs on a single thread.
+      ZeroCopyReceive: Hand received responses to every method's deserializer
+        as read-only buffers rather than as bytes. See zero_copy_deserializer.
+      CallPollerLinger: The number of seconds the thread polling for the
+        channel's RPCs keeps running once no RPCs remain, so that the next RPC
+        does not have to start a new thread. Defaults to 1.0. Ignored when fork
+        support is enabled.
+      RequestConsumptionThreads: The maximum number of threads shared by the
+        channel's client-streaming RPCs to consume their request iterators.
+        By default, each such RPC consumes its request iterator on a thread of
+        its own. A request iterator that blocks waiting for its next request
+        holds one of the shared threads while it waits, so as many blocked
+        iterators as there are threads stall the request streams of every
+        other RPC on the channel. Ignored when fork support is enabled.
+      StreamWriteWindow: The number of requests of a client-streaming RPC that
+        may be pulled from its request iterator and serialized before the
+        earliest of them has been sent. Requests are still handed to gRPC Core
+        one at a time, subject to flow control. Defaults to 1.
     """
 
     SingleThreadedUnaryStream = "SingleThreadedUnaryStream"
+    ZeroCopyReceive = "ZeroCopyReceive"
+    CallPollerLinger = "CallPollerLinger"
+    RequestConsumptionThreads = "RequestConsumptionThreads"
+    StreamWriteWindow = "StreamWriteWindow"
+
+
+class ServerOptions:
+    """Indicates a server option unique to gRPC Python.
+
+    This enumeration is part of an EXPERIMENTAL API.
+
+    Attributes:
+      CompletionQueueCount: The number of completion queues the server polls,
+        each drained by its own serving thread. Defaults to 1.
+      EagerTaskExecution: Start running the task of each RPC of an AsyncIO
+        server as soon as the RPC is accepted, up to its first suspension,
+        rather than on a later iteration of the event loop. Most RPCs first
+        suspend receiving their request. The exception is a registered method
+        with a unary request on a server without interceptors, whose request
+        arrives along with the call: combined with InlineCancellationListener,
+        a coroutine handler of such a method that does not suspend has its
+        response handed to gRPC Core before the event loop runs anything
+        else. Requires Python 3.12 or later, and has no effect on earlier
+        versions. Defaults to False.
+      InlineCancellationListener: Run each RPC of an AsyncIO server in a
+        single task, listening for cancellation from the client with a
+        callback instead of a dedicated task. Defaults to False.
+      RequestCallDepth: The number of calls the server keeps requested from
+        gRPC Core for each method, on each completion queue. Higher values let
+        bursts of incoming RPCs be accepted without waiting on the server to
+        re-arm a single request. Defaults to 1.
+      ZeroCopyReceive: Hand received requests to every method's deserializer
+        as read-only buffers rather than as bytes. See zero_copy_deserializer.
+    """
+
+    CompletionQueueCount = "CompletionQueueCount"
+    EagerTaskExecution = "EagerTaskExecution"
+    InlineCancellationListener = "InlineCancellationListener"
+    RequestCallDepth = "RequestCallDepth"
+    ZeroCopyReceive = "ZeroCopyReceive"
+
+
+# Metadata encoded once, to be sent on any number of RPCs. It may be passed
+# as the metadata of an RPC or as a server's initial or trailing metadata, and
+# otherwise behaves as the immutable sequence of (key, value) pairs it was
+# constructed from. Combined with other metadata, or sent on an RPC using
+# compression, it is encoded as usual.
+PreparedMetadata = _cygrpc.PreparedMetadata
 
 
 class UsageError(Exception):
@@ -114,6 +180,29 @@ def wrap_server_method_handler(wrapper, handler):
     return handler._replace(stream_stream=wrapper(handler.stream_stream))
 
 
+def zero_copy_deserializer(deserializer):
+    """Marks a deserializer as accepting received messages as buffers.
+
+    Messages received for a method using the returned deserializer are not
+    copied into bytes. They are instead passed to the deserializer as
+    read-only memoryviews, which reference the memory gRPC received them
+    into and are accepted by protobuf's FromString. A received message stays
+    valid for as long as a reference to it is held.
+
+    This is an EXPERIMENTAL API.
+
+    Args:
+      deserializer: A function accepting a bytes-like object and returning
+        the deserialized message, or None to have the received buffer
+        object itself be the message.
+
+    Returns:
+      A deserializer to use in place of the given one, on either a channel's
+      multi-callables or a server's RpcMethodHandlers.
+    """
+    return _common.zero_copy_deserializer(deserializer)
+
+
 # A Callable to return in the async case
 # See the `ssl_channel_credentials_with_custom_signer` docstring for more detail on usage.
 PrivateKeySignCancel = Callable[[], None]
@@ -172,10 +261,13 @@ def ssl_channel_credentials_with_custom_signer(
 __all__ = (
     "ChannelOptions",
     "ExperimentalApiWarning",
+    "PreparedMetadata",
+    "ServerOptions",
     "UsageError",
     "insecure_channel_credentials",
     "ssl_channel_credentials_with_custom_signer",
     "wrap_server_method_handler",
+    "zero_copy_deserializer",
 )
 
 if sys.version_info > (3, 6):
@@ -24,7 +24,6 @@ import grpc
 from src.proto.grpc.testing import benchmark_service_pb2_grpc
 from src.proto.grpc.testing import messages_pb2
 from tests.unit import resources
-from tests.unit import test_common
 
 _TIMEOUT = 60 * 60 * 24
 
@@ -43,6 +42,10 @@ class GenericStub:
             "/grpc.testing.BenchmarkService/StreamingCall",
             _registered_method=True,
         )
+        self.StreamingFromClient = channel.stream_unary(
+            "/grpc.testing.BenchmarkService/StreamingFromClient",
+            _registered_method=True,
+        )
 
 
 class BenchmarkClient:
@@ -51,16 +54,35 @@ class BenchmarkClient:
     __metaclass__ = abc.ABCMeta
 
     def __init__(self, server, config, hist):
+        # Parses the channel arguments, which may include Python-only options
+        # such as grpc.experimental.ChannelOptions.StreamWriteWindow.
+        channel_args = tuple(
+            (
+                (arg.name, arg.str_value)
+                if arg.HasField("str_value")
+                else (arg.name, int(arg.int_value))
+            )
+            for arg in config.channel_args
+        )
+
         # Create the stub
         if config.HasField("security_params"):
             creds = grpc.ssl_channel_credentials(
                 resources.test_root_certificates()
             )
-            channel = test_common.test_secure_channel(
-                server, creds, config.security_params.server_host_override
+            channel = grpc.secure_channel(
+                server,
+                creds,
+                channel_args
+                + (
+                    (
+                        "grpc.ssl_target_name_override",
+                        config.security_params.server_host_override,
+                    ),
+                ),
             )
         else:
-            channel = grpc.insecure_channel(server)
+            channel = grpc.insecure_channel(server, channel_args)
 
         # waits for the channel to be ready before we start sending messages
         grpc.channel_ready_future(channel).result()
@@ -215,6 +237,51 @@ class StreamingSyncBenchmarkClient(BenchmarkClient):
         self._stub = None
 
 
+class ClientStreamingSyncBenchmarkClient(BenchmarkClient):
+    """Streams requests to the server as fast as they can be sent.
+
+    The time taken to pull each request from a stream's request iterator is
+    recorded as a query, so the latency reported is that of handing one
+    request to gRPC. Set grpc.experimental.ChannelOptions.StreamWriteWindow
+    in the client's channel arguments to compare write window sizes.
+    """
+
+    def __init__(self, server, config, hist):
+        super(ClientStreamingSyncBenchmarkClient, self).__init__(
+            server, config, hist
+        )
+        self._pool = futures.ThreadPoolExecutor(
+            max_workers=config.outstanding_rpcs_per_channel
+        )
+        self._rpc_count = config.outstanding_rpcs_per_channel
+        self._is_streaming = False
+
+    def send_request(self):
+        # Requests are streamed continuously once the client starts.
+        pass
+
+    def start(self):
+        self._is_streaming = True
+        for _ in range(self._rpc_count):
+            self._pool.submit(self._one_stream_streaming_rpc)
+
+    def _request_generator(self):
+        start_time = time.time()
+        while self._is_streaming:
+            yield self._request
+            end_time = time.time()
+            self._handle_response(self, end_time - start_time)
+            start_time = end_time
+
+    def _one_stream_streaming_rpc(self):
+        self._stub.StreamingFromClient(self._request_generator(), _TIMEOUT)
+
+    def stop(self):
+        self._is_streaming = False
+        self._pool.shutdown(wait=True)
+        self._stub = None
+
+
 class ServerStreamingSyncBenchmarkClient(BenchmarkClient):
     def __init__(self, server, config, hist):
         super(ServerStreamingSyncBenchmarkClient, self).__init__(
@@ -28,6 +28,13 @@ class BenchmarkServer(benchmark_service_pb2_grpc.BenchmarkServiceServicer):
             payload = messages_pb2.Payload(body=b"\0" * request.response_size)
             yield messages_pb2.SimpleResponse(payload=payload)
 
+    def StreamingFromClient(self, request_iterator, context):
+        response_size = 0
+        for request in request_iterator:
+            response_size = request.response_size
+        payload = messages_pb2.Payload(body=b"\0" * response_size)
+        return messages_pb2.SimpleResponse(payload=payload)
+
 
 class GenericBenchmarkServer(
     benchmark_service_pb2_grpc.BenchmarkServiceServicer
@@ -43,3 +50,8 @@ class GenericBenchmarkServer(
     def StreamingCall(self, request_iterator, context):
         for request in request_iterator:
             yield self._response
+
+    def StreamingFromClient(self, request_iterator, context):
+        for _ in request_iterator:
+            pass
+        return self._response
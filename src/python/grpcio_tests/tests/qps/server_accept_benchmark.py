@@ -0,0 +1,184 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Microbenchmark of the rate at which the sync server accepts RPCs.
+
+Trivial unary-unary RPCs are issued from a fixed number of outstanding client
+futures, so that the measured rate is bound by the server's accept and
+dispatch path rather than by the handler. The same method is served either
+through a generic handler or as a registered method.
+"""
+
+import argparse
+from concurrent import futures
+import logging
+import threading
+import time
+
+import grpc
+
+_SERVICE_NAME = "grpc.testing.AcceptBenchmark"
+_METHOD_NAME = "Accept"
+_FULLY_QUALIFIED_METHOD = "/{}/{}".format(_SERVICE_NAME, _METHOD_NAME)
+
+_REQUEST = b""
+_RESPONSE = b""
+
+_MODES = ("generic", "registered")
+
+
+def _accept(unused_request, unused_context):
+    return _RESPONSE
+
+
+def _create_server(mode, workers, completion_queues):
+    options = (("grpc.so_reuseport", 0),)
+    if completion_queues > 1:
+        options += (
+            (
+                grpc.experimental.ServerOptions.CompletionQueueCount,
+                completion_queues,
+            ),
+        )
+    server = grpc.server(
+        futures.ThreadPoolExecutor(max_workers=workers), options=options
+    )
+    method_handlers = {
+        _METHOD_NAME: grpc.unary_unary_rpc_method_handler(_accept),
+    }
+    if mode == "registered":
+        server.add_registered_method_handlers(_SERVICE_NAME, method_handlers)
+    else:
+        server.add_generic_rpc_handlers(
+            (
+                grpc.method_handlers_generic_handler(
+                    _SERVICE_NAME, method_handlers
+                ),
+            )
+        )
+    port = server.add_insecure_port("[::]:0")
+    return server, port
+
+
+class _Driver:
+    """Keeps a fixed number of RPCs outstanding until told to stop."""
+
+    def __init__(self, multi_callable, outstanding):
+        self._multi_callable = multi_callable
+        self._outstanding = outstanding
+        self._lock = threading.Lock()
+        self._running = True
+        self._completed = 0
+        self._drained = threading.Event()
+        self._in_flight = 0
+
+    def _issue(self):
+        future = self._multi_callable.future(_REQUEST)
+        future.add_done_callback(self._on_done)
+
+    def _on_done(self, unused_future):
+        with self._lock:
+            self._completed += 1
+            if not self._running:
+                self._in_flight -= 1
+                if not self._in_flight:
+                    self._drained.set()
+                return
+        self._issue()
+
+    def start(self):
+        with self._lock:
+            self._in_flight = self._outstanding
+        for _ in range(self._outstanding):
+            self._issue()
+
+    def completed(self):
+        with self._lock:
+            return self._completed
+
+    def stop(self):
+        with self._lock:
+            self._running = False
+            if not self._in_flight:
+                self._drained.set()
+        self._drained.wait()
+
+
+def run(mode, duration, warmup, outstanding, workers, completion_queues):
+    server, port = _create_server(mode, workers, completion_queues)
+    server.start()
+    with grpc.insecure_channel("localhost:{}".format(port)) as channel:
+        multi_callable = channel.unary_unary(
+            _FULLY_QUALIFIED_METHOD, _registered_method=True
+        )
+        multi_callable(_REQUEST, wait_for_ready=True)
+        driver = _Driver(multi_callable, outstanding)
+        driver.start()
+        time.sleep(warmup)
+        start_count = driver.completed()
+        start_time = time.monotonic()
+        time.sleep(duration)
+        accepted = driver.completed() - start_count
+        elapsed = time.monotonic() - start_time
+        driver.stop()
+    server.stop(None)
+    return accepted / elapsed
+
+
+if __name__ == "__main__":
+    logging.basicConfig()
+    parser = argparse.ArgumentParser(
+        description="Measures RPCs accepted per second by the sync server"
+    )
+    parser.add_argument(
+        "--mode",
+        choices=_MODES + ("all",),
+        default="all",
+        help="How the benchmarked method is served",
+    )
+    parser.add_argument(
+        "--duration", type=float, default=10.0, help="Seconds to measure for"
+    )
+    parser.add_argument(
+        "--warmup", type=float, default=2.0, help="Seconds to warm up for"
+    )
+    parser.add_argument(
+        "--outstanding",
+        type=int,
+        default=64,
+        help="Number of RPCs the client keeps in flight",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=16,
+        help="Size of the server's handler thread pool",
+    )
+    parser.add_argument(
+        "--completion_queues",
+        type=int,
+        default=1,
+        help="Number of completion queues the server polls",
+    )
+    args = parser.parse_args()
+    modes = _MODES if args.mode == "all" else (args.mode,)
+    for benchmark_mode in modes:
+        rate = run(
+            benchmark_mode,
+            args.duration,
+            args.warmup,
+            args.outstanding,
+            args.workers,
+            args.completion_queues,
+        )
+        print("{}: {:.1f} accepts/s".format(benchmark_mode, rate))
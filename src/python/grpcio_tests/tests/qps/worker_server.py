@@ -128,6 +128,9 @@ class WorkerServer(worker_service_pb2_grpc.WorkerServiceServicer):
                 "StreamingCall": grpc.stream_stream_rpc_method_handler(
                     servicer.StreamingCall
                 ),
+                "StreamingFromClient": grpc.stream_unary_rpc_method_handler(
+                    servicer.StreamingFromClient
+                ),
                 "UnaryCall": grpc.unary_unary_rpc_method_handler(
                     servicer.UnaryCall
                 ),
@@ -211,6 +214,11 @@ class WorkerServer(worker_service_pb2_grpc.WorkerServiceServicer):
                 client = benchmark_client.StreamingSyncBenchmarkClient(
                     server, config, qps_data
                 )
+            elif config.rpc_type == control_pb2.STREAMING_FROM_CLIENT:
+                no_ping_pong = True
+                client = benchmark_client.ClientStreamingSyncBenchmarkClient(
+                    server, config, qps_data
+                )
             elif config.rpc_type == control_pb2.STREAMING_FROM_SERVER:
                 no_ping_pong = True
                 client = benchmark_client.ServerStreamingSyncBenchmarkClient(
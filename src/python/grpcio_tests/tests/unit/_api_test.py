@@ -80,6 +80,8 @@ class AllTest(unittest.TestCase):
             "ssl_server_certificate_configuration",
             "dynamic_ssl_server_credentials",
             "channel_ready_future",
+            "channel_pool",
+            "channels_ready",
             "insecure_channel",
             "secure_channel",
             "intercept_channel",
@@ -0,0 +1,151 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests sending messages given as objects supporting the buffer protocol."""
+
+import logging
+import mmap
+import unittest
+
+import grpc
+
+from tests.unit import test_common
+from tests.unit.framework.common import test_constants
+
+_SERVICE_NAME = "test"
+_ECHO = "Echo"
+_MAPPED = "Mapped"
+_ECHO_STREAM = "EchoStream"
+_SCATTERED = "Scattered"
+
+_SMALL_MESSAGE = b"\x07" * 16
+# Large enough to be sent without being copied.
+_LARGE_MESSAGE = bytes(range(256)) * 16 * 1024
+
+
+def _handle_echo(request, servicer_context):
+    return bytearray(request)
+
+
+def _handle_mapped(request, servicer_context):
+    mapped = mmap.mmap(-1, len(_LARGE_MESSAGE))
+    mapped.write(_LARGE_MESSAGE)
+    return memoryview(mapped)
+
+
+def _handle_echo_stream(request_iterator, servicer_context):
+    for request in request_iterator:
+        yield memoryview(request)
+
+
+def _scatter(message):
+    header = len(message).to_bytes(4, "big")
+    return (header, memoryview(message)[:-1], message[-1:])
+
+
+def _handle_scattered(request, servicer_context):
+    return request
+
+
+_METHOD_HANDLERS = {
+    _ECHO: grpc.unary_unary_rpc_method_handler(_handle_echo),
+    _MAPPED: grpc.unary_unary_rpc_method_handler(_handle_mapped),
+    _ECHO_STREAM: grpc.stream_stream_rpc_method_handler(_handle_echo_stream),
+    _SCATTERED: grpc.unary_unary_rpc_method_handler(
+        _handle_scattered, response_serializer=_scatter
+    ),
+}
+
+
+def _method(name):
+    return grpc._common.fully_qualified_method(_SERVICE_NAME, name)
+
+
+class BufferMessageTest(unittest.TestCase):
+    def setUp(self):
+        self._server = test_common.test_server()
+        self._server.add_registered_method_handlers(
+            _SERVICE_NAME, _METHOD_HANDLERS
+        )
+        port = self._server.add_insecure_port("[::]:0")
+        self._server.start()
+        self._channel = grpc.insecure_channel("localhost:%d" % port)
+        self._echo = self._channel.unary_unary(
+            _method(_ECHO), _registered_method=True
+        )
+
+    def tearDown(self):
+        self._server.stop(None)
+        self._channel.close()
+
+    def testBytes(self):
+        self.assertEqual(_SMALL_MESSAGE, self._echo(_SMALL_MESSAGE))
+        self.assertEqual(_LARGE_MESSAGE, self._echo(_LARGE_MESSAGE))
+
+    def testBytearray(self):
+        self.assertEqual(_SMALL_MESSAGE, self._echo(bytearray(_SMALL_MESSAGE)))
+        self.assertEqual(_LARGE_MESSAGE, self._echo(bytearray(_LARGE_MESSAGE)))
+
+    def testMemoryview(self):
+        self.assertEqual(
+            _LARGE_MESSAGE[1:-1], self._echo(memoryview(_LARGE_MESSAGE)[1:-1])
+        )
+
+    def testMmap(self):
+        mapped = mmap.mmap(-1, len(_LARGE_MESSAGE))
+        mapped.write(_LARGE_MESSAGE)
+        self.assertEqual(_LARGE_MESSAGE, self._echo(mapped))
+
+    def testMappedResponse(self):
+        response = self._channel.unary_unary(
+            _method(_MAPPED), _registered_method=True
+        )(b"")
+        self.assertEqual(_LARGE_MESSAGE, response)
+
+    def testStreamedMemoryviews(self):
+        requests = [
+            memoryview(_LARGE_MESSAGE)
+            for _ in range(test_constants.STREAM_LENGTH)
+        ]
+        response_iterator = self._channel.stream_stream(
+            _method(_ECHO_STREAM), _registered_method=True
+        )(iter(requests))
+        self.assertSequenceEqual(
+            [_LARGE_MESSAGE] * test_constants.STREAM_LENGTH,
+            list(response_iterator),
+        )
+
+    def testScatteredMessages(self):
+        response = self._channel.unary_unary(
+            _method(_SCATTERED),
+            request_serializer=lambda message: [message[:3], message[3:]],
+            _registered_method=True,
+        )(_LARGE_MESSAGE)
+        self.assertEqual(
+            len(_LARGE_MESSAGE).to_bytes(4, "big") + _LARGE_MESSAGE, response
+        )
+
+    def testEmptyScatteredMessage(self):
+        self.assertEqual(
+            b"",
+            self._channel.unary_unary(
+                _method(_ECHO),
+                request_serializer=lambda unused_message: (),
+                _registered_method=True,
+            )(None),
+        )
+
+
+if __name__ == "__main__":
+    logging.basicConfig()
+    unittest.main(verbosity=2)
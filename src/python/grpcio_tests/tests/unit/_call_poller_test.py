@@ -0,0 +1,103 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests the lifetime of the thread polling for a channel's RPCs."""
+
+import logging
+import threading
+import time
+import unittest
+
+import grpc
+from grpc._cython import cygrpc
+
+from tests.unit import test_common
+
+_SERVICE_NAME = "test"
+_UNARY_UNARY = "UnaryUnary"
+_REQUEST = b"\x00\x00\x00"
+
+_method_handlers = {
+    _UNARY_UNARY: grpc.unary_unary_rpc_method_handler(
+        lambda request, unused_context: request
+    ),
+}
+
+
+@unittest.skipIf(
+    cygrpc.is_fork_support_enabled(),
+    "The call poller does not linger with fork support enabled.",
+)
+class CallPollerTest(unittest.TestCase):
+    def setUp(self):
+        self._server = test_common.test_server()
+        self._server.add_registered_method_handlers(
+            _SERVICE_NAME, _method_handlers
+        )
+        self._port = self._server.add_insecure_port("[::]:0")
+        self._server.start()
+
+    def tearDown(self):
+        self._server.stop(None)
+
+    def _channel(self, linger):
+        return grpc.insecure_channel(
+            "localhost:%d" % self._port,
+            options=(
+                (grpc.experimental.ChannelOptions.CallPollerLinger, linger),
+            ),
+        )
+
+    def _unary_unary(self, channel):
+        return channel.unary_unary(
+            grpc._common.fully_qualified_method(_SERVICE_NAME, _UNARY_UNARY),
+            _registered_method=True,
+        )
+
+    def testPollerReusedAcrossSequentialCalls(self):
+        with self._channel(60.0) as channel:
+            multi_callable = self._unary_unary(channel)
+            for _ in range(10):
+                self.assertEqual(
+                    _REQUEST, multi_callable.future(_REQUEST).result()
+                )
+            self.assertEqual(1, channel._call_state.poller_starts)
+
+    def testPollerExitsAfterLinger(self):
+        with self._channel(0.1) as channel:
+            multi_callable = self._unary_unary(channel)
+            self.assertEqual(_REQUEST, multi_callable.future(_REQUEST).result())
+            time.sleep(1.0)
+            self.assertFalse(channel._call_state.polling)
+            self.assertEqual(_REQUEST, multi_callable.future(_REQUEST).result())
+            self.assertEqual(2, channel._call_state.poller_starts)
+
+    def testCloseStopsLingeringPoller(self):
+        channel = self._channel(60.0)
+        self.assertEqual(
+            _REQUEST, self._unary_unary(channel).future(_REQUEST).result()
+        )
+        thread_count = threading.active_count()
+        channel.close()
+        deadline = time.time() + 10.0
+        while (
+            thread_count <= threading.active_count() and time.time() < deadline
+        ):
+            time.sleep(0.01)
+        self.assertFalse(channel._call_state.polling)
+        self.assertLess(threading.active_count(), thread_count)
+
+
+if __name__ == "__main__":
+    logging.basicConfig()
+    unittest.main(verbosity=2)
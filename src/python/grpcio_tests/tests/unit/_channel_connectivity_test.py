@@ -13,16 +13,21 @@
 # limitations under the License.
 """Tests of grpc._channel.Channel connectivity."""
 
+import gc
 import logging
 import threading
 import time
 import unittest
+import weakref
 
 import grpc
+from grpc import _channel
 
 from tests.unit import thread_pool
 from tests.unit.framework.common import test_constants
 
+_CHANNEL_COUNT = 20
+
 
 def _ready_in_connectivities(connectivities):
     return grpc.ChannelConnectivity.READY in connectivities
@@ -168,6 +173,44 @@ class ChannelConnectivityTest(unittest.TestCase):
         channel.close()
         self.assertFalse(recording_thread_pool.was_used())
 
+    def test_many_channels_share_watching_threads(self):
+        initial_thread_count = threading.active_count()
+        callbacks = [_Callback() for _ in range(_CHANNEL_COUNT)]
+        channels = [
+            grpc.insecure_channel("localhost:12345")
+            for _ in range(_CHANNEL_COUNT)
+        ]
+        for channel, callback in zip(channels, callbacks):
+            channel.subscribe(callback.update, try_to_connect=True)
+        for callback in callbacks:
+            callback.block_until_connectivities_satisfy(
+                lambda connectivities: 2 <= len(connectivities)
+            )
+        thread_count = threading.active_count()
+        for channel in channels:
+            channel.close()
+
+        # The connectivity reactor may have been started by earlier tests.
+        self.assertLessEqual(
+            thread_count - initial_thread_count,
+            1 + _channel._CONNECTIVITY_DELIVERY_THREADS,
+        )
+
+    def test_unsubscribed_channel_is_released(self):
+        callback = _Callback()
+        channel = grpc.insecure_channel("localhost:12345")
+        # Without trying to connect, the channel stays IDLE, so its watch
+        # stays pending.
+        channel.subscribe(callback.update, try_to_connect=False)
+        callback.block_until_connectivities_satisfy(bool)
+        channel.unsubscribe(callback.update)
+        connectivity_state = weakref.ref(channel._connectivity_state)
+
+        del channel
+        gc.collect()
+
+        self.assertIsNone(connectivity_state())
+
 
 if __name__ == "__main__":
     logging.basicConfig()
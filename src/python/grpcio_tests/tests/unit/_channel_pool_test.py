@@ -0,0 +1,204 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests of grpc.channel_pool."""
+
+import logging
+import threading
+import time
+import unittest
+
+import grpc
+from grpc import _common
+
+from tests.unit import test_common
+from tests.unit.framework.common import test_constants
+
+_REQUEST = b"\x00\x00\x00"
+_RESPONSE = b"\x01\x01\x01"
+
+_SERVICE_NAME = "test"
+_UNARY_UNARY = "UnaryUnary"
+_UNARY_STREAM = "UnaryStream"
+_STREAM_UNARY = "StreamUnary"
+_STREAM_STREAM = "StreamStream"
+_BLOCKING = "Blocking"
+
+_POOL_SIZE = 3
+
+
+class _Handlers:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.peers = set()
+        self.release = threading.Event()
+
+    def _record_peer(self, context):
+        with self._lock:
+            self.peers.add(context.peer())
+
+    def unary_unary(self, request, context):
+        self._record_peer(context)
+        return _RESPONSE
+
+    def unary_stream(self, request, context):
+        for _ in range(test_constants.STREAM_LENGTH):
+            yield _RESPONSE
+
+    def stream_unary(self, request_iterator, context):
+        for _ in request_iterator:
+            pass
+        return _RESPONSE
+
+    def stream_stream(self, request_iterator, context):
+        for _ in request_iterator:
+            yield _RESPONSE
+
+    def blocking(self, request, context):
+        self._record_peer(context)
+        self.release.wait()
+        return _RESPONSE
+
+
+class ChannelPoolTest(unittest.TestCase):
+    def setUp(self):
+        self._handlers = _Handlers()
+        self._server = test_common.test_server()
+        self._server.add_generic_rpc_handlers(
+            (
+                grpc.method_handlers_generic_handler(
+                    _SERVICE_NAME,
+                    {
+                        _UNARY_UNARY: grpc.unary_unary_rpc_method_handler(
+                            self._handlers.unary_unary
+                        ),
+                        _UNARY_STREAM: grpc.unary_stream_rpc_method_handler(
+                            self._handlers.unary_stream
+                        ),
+                        _STREAM_UNARY: grpc.stream_unary_rpc_method_handler(
+                            self._handlers.stream_unary
+                        ),
+                        _STREAM_STREAM: grpc.stream_stream_rpc_method_handler(
+                            self._handlers.stream_stream
+                        ),
+                        _BLOCKING: grpc.unary_unary_rpc_method_handler(
+                            self._handlers.blocking
+                        ),
+                    },
+                ),
+            )
+        )
+        port = self._server.add_insecure_port("[::]:0")
+        self._server.start()
+        self._channel = grpc.channel_pool("localhost:%d" % port, _POOL_SIZE)
+
+    def tearDown(self):
+        self._handlers.release.set()
+        self._channel.close()
+        self._server.stop(None)
+
+    def _method(self, name):
+        return "/%s/%s" % (_SERVICE_NAME, name)
+
+    def test_all_arities(self):
+        self.assertEqual(
+            _RESPONSE,
+            self._channel.unary_unary(
+                self._method(_UNARY_UNARY), _registered_method=True
+            )(_REQUEST),
+        )
+        responses = self._channel.unary_stream(
+            self._method(_UNARY_STREAM), _registered_method=True
+        )(_REQUEST)
+        self.assertEqual(test_constants.STREAM_LENGTH, len(list(responses)))
+        self.assertEqual(
+            _RESPONSE,
+            self._channel.stream_unary(
+                self._method(_STREAM_UNARY), _registered_method=True
+            )(iter([_REQUEST] * test_constants.STREAM_LENGTH)),
+        )
+        responses = self._channel.stream_stream(
+            self._method(_STREAM_STREAM), _registered_method=True
+        )(iter([_REQUEST] * test_constants.STREAM_LENGTH))
+        self.assertEqual(test_constants.STREAM_LENGTH, len(list(responses)))
+
+    def test_future(self):
+        future = self._channel.unary_unary(
+            self._method(_UNARY_UNARY), _registered_method=True
+        ).future(_REQUEST)
+        self.assertEqual(_RESPONSE, future.result())
+
+    def test_outstanding_calls_spread_over_connections(self):
+        multi_callable = self._channel.unary_unary(
+            self._method(_BLOCKING), _registered_method=True
+        )
+        futures = [
+            multi_callable.future(_REQUEST, wait_for_ready=True)
+            for _ in range(_POOL_SIZE)
+        ]
+        deadline = time.monotonic() + test_constants.SHORT_TIMEOUT
+        while (
+            len(self._handlers.peers) < _POOL_SIZE
+            and time.monotonic() < deadline
+        ):
+            time.sleep(0.01)
+        self.assertEqual(_POOL_SIZE, len(self._handlers.peers))
+        self._handlers.release.set()
+        for future in futures:
+            self.assertEqual(_RESPONSE, future.result())
+
+    def test_subscribe_reports_pool_state(self):
+        condition = threading.Condition()
+        connectivities = []
+
+        def record(connectivity):
+            with condition:
+                connectivities.append(connectivity)
+                condition.notify_all()
+
+        self._channel.subscribe(record, try_to_connect=True)
+        with condition:
+            self.assertTrue(
+                condition.wait_for(
+                    lambda: grpc.ChannelConnectivity.READY in connectivities,
+                    timeout=test_constants.SHORT_TIMEOUT,
+                )
+            )
+        self._channel.unsubscribe(record)
+
+        # One state for the pool, delivered only when it changes, rather than
+        # one per channel.
+        for previous, current in zip(connectivities, connectivities[1:]):
+            self.assertIsNot(previous, current)
+
+    def test_channel_ready_future_waits_for_all_channels(self):
+        grpc.channel_ready_future(self._channel).result(
+            timeout=test_constants.SHORT_TIMEOUT
+        )
+        # pylint: disable=protected-access
+        for channel in self._channel.channels:
+            self.assertIs(
+                grpc.ChannelConnectivity.READY,
+                _common.CYGRPC_CONNECTIVITY_STATE_TO_CHANNEL_CONNECTIVITY[
+                    channel._channel.check_connectivity_state(False)
+                ],
+            )
+
+    def test_invalid_size(self):
+        with self.assertRaises(ValueError):
+            grpc.channel_pool("localhost:0", 0)
+
+
+if __name__ == "__main__":
+    logging.basicConfig()
+    unittest.main(verbosity=2)
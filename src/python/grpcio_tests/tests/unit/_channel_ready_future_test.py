@@ -22,6 +22,8 @@ import grpc
 from tests.unit import thread_pool
 from tests.unit.framework.common import test_constants
 
+_CHANNEL_COUNT = 10
+
 
 class _Callback:
     def __init__(self):
@@ -93,6 +95,48 @@ class ChannelReadyFutureTest(unittest.TestCase):
         channel.close()
         server.stop(None)
 
+    def test_channels_ready(self):
+        server = grpc.server(
+            thread_pool.RecordingThreadPool(max_workers=None),
+            options=(("grpc.so_reuseport", 0),),
+        )
+        port = server.add_insecure_port("[::]:0")
+        server.start()
+        channels = [
+            grpc.insecure_channel(
+                "localhost:{}".format(port),
+                options=(("grpc.use_local_subchannel_pool", 1),),
+            )
+            for _ in range(_CHANNEL_COUNT)
+        ]
+
+        self.assertIsNone(
+            grpc.channels_ready(channels, timeout=test_constants.LONG_TIMEOUT)
+        )
+
+        for channel in channels:
+            channel.close()
+        server.stop(None)
+
+    def test_channels_ready_timeout(self):
+        server = grpc.server(
+            thread_pool.RecordingThreadPool(max_workers=None),
+            options=(("grpc.so_reuseport", 0),),
+        )
+        port = server.add_insecure_port("[::]:0")
+        server.start()
+        channels = [
+            grpc.insecure_channel("localhost:{}".format(port)),
+            grpc.insecure_channel("localhost:12345"),
+        ]
+
+        with self.assertRaises(grpc.FutureTimeoutError):
+            grpc.channels_ready(channels, timeout=test_constants.SHORT_TIMEOUT)
+
+        for channel in channels:
+            channel.close()
+        server.stop(None)
+
 
 if __name__ == "__main__":
     logging.basicConfig()
@@ -268,6 +268,79 @@ class MetadataTest(unittest.TestCase):
         )
 
 
+class PreparedMetadataTest(unittest.TestCase):
+    def setUp(self):
+        self._server = test_common.test_server()
+        self._server.add_registered_method_handlers(
+            _SERVICE_NAME, get_method_handlers(weakref.proxy(self))
+        )
+        port = self._server.add_insecure_port("[::]:0")
+        self._server.start()
+        self._channel = grpc.insecure_channel(
+            "localhost:%d" % port, options=_CHANNEL_ARGS
+        )
+        self._metadata = grpc.experimental.PreparedMetadata(
+            _INVOCATION_METADATA
+        )
+
+    def tearDown(self):
+        self._server.stop(0)
+        self._channel.close()
+
+    def testSequence(self):
+        self.assertEqual(len(_INVOCATION_METADATA), len(self._metadata))
+        self.assertEqual(_INVOCATION_METADATA, self._metadata)
+        self.assertEqual(_INVOCATION_METADATA[1], self._metadata[1])
+        self.assertEqual(
+            _INVOCATION_METADATA + _INITIAL_METADATA,
+            self._metadata + _INITIAL_METADATA,
+        )
+
+    def testReusedAcrossCalls(self):
+        multi_callable = self._channel.unary_unary(
+            grpc._common.fully_qualified_method(_SERVICE_NAME, _UNARY_UNARY),
+            _registered_method=True,
+        )
+        for _ in range(test_constants.STREAM_LENGTH):
+            unused_response, call = multi_callable.with_call(
+                _REQUEST, metadata=self._metadata
+            )
+            self.assertTrue(
+                test_common.metadata_transmitted(
+                    _EXPECTED_INITIAL_METADATA, call.initial_metadata()
+                )
+            )
+
+    def testStreamStream(self):
+        multi_callable = self._channel.stream_stream(
+            grpc._common.fully_qualified_method(_SERVICE_NAME, _STREAM_STREAM),
+            _registered_method=True,
+        )
+        call = multi_callable(
+            iter([_REQUEST] * test_constants.STREAM_LENGTH),
+            metadata=self._metadata,
+        )
+        for _ in call:
+            pass
+        self.assertTrue(
+            test_common.metadata_transmitted(
+                _EXPECTED_TRAILING_METADATA, call.trailing_metadata()
+            )
+        )
+
+    def testCompressedCall(self):
+        multi_callable = self._channel.unary_unary(
+            grpc._common.fully_qualified_method(_SERVICE_NAME, _UNARY_UNARY),
+            _registered_method=True,
+        )
+        unused_response, call = multi_callable.with_call(
+            _REQUEST,
+            metadata=self._metadata,
+            compression=grpc.Compression.Gzip,
+        )
+        self.assertIs(grpc.StatusCode.OK, call.code())
+
+
 if __name__ == "__main__":
     logging.basicConfig()
     unittest.main(verbosity=2)
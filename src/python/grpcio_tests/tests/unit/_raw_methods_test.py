@@ -0,0 +1,128 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests of methods without serializers, which send and receive raw bytes."""
+
+import logging
+import unittest
+
+import grpc
+
+from tests.unit import test_common
+from tests.unit.framework.common import test_constants
+
+_REQUEST = b"\x00\x00\x00"
+
+_SERVICE_NAME = "test"
+_UNARY_UNARY = "UnaryUnary"
+_UNARY_STREAM = "UnaryStream"
+_STREAM_UNARY = "StreamUnary"
+_STREAM_STREAM = "StreamStream"
+
+
+def _unary_unary(request, context):
+    return request[::-1]
+
+
+def _unary_stream(request, context):
+    for _ in range(test_constants.STREAM_LENGTH):
+        yield request[::-1]
+
+
+def _stream_unary(request_iterator, context):
+    return b"".join(request_iterator)
+
+
+def _stream_stream(request_iterator, context):
+    for request in request_iterator:
+        yield request[::-1]
+
+
+def _method(name):
+    return "/%s/%s" % (_SERVICE_NAME, name)
+
+
+class RawMethodsTest(unittest.TestCase):
+    def setUp(self):
+        self._server = test_common.test_server()
+        self._server.add_generic_rpc_handlers(
+            (
+                grpc.method_handlers_generic_handler(
+                    _SERVICE_NAME,
+                    {
+                        _UNARY_UNARY: grpc.unary_unary_rpc_method_handler(
+                            _unary_unary
+                        ),
+                        _UNARY_STREAM: grpc.unary_stream_rpc_method_handler(
+                            _unary_stream
+                        ),
+                        _STREAM_UNARY: grpc.stream_unary_rpc_method_handler(
+                            _stream_unary
+                        ),
+                        _STREAM_STREAM: grpc.stream_stream_rpc_method_handler(
+                            _stream_stream
+                        ),
+                    },
+                ),
+            )
+        )
+        port = self._server.add_insecure_port("[::]:0")
+        self._server.start()
+        self._channel = grpc.insecure_channel("localhost:%d" % port)
+
+    def tearDown(self):
+        self._channel.close()
+        self._server.stop(None)
+
+    def test_unary_unary(self):
+        multi_callable = self._channel.unary_unary(_method(_UNARY_UNARY))
+        self.assertEqual(_REQUEST[::-1], multi_callable(_REQUEST))
+        response, call = multi_callable.with_call(_REQUEST)
+        self.assertEqual(_REQUEST[::-1], response)
+        self.assertIs(grpc.StatusCode.OK, call.code())
+        self.assertEqual(
+            _REQUEST[::-1], multi_callable.future(_REQUEST).result()
+        )
+
+    def test_unary_stream(self):
+        responses = self._channel.unary_stream(_method(_UNARY_STREAM))(_REQUEST)
+        self.assertEqual(
+            [_REQUEST[::-1]] * test_constants.STREAM_LENGTH, list(responses)
+        )
+
+    def test_stream_unary(self):
+        response = self._channel.stream_unary(_method(_STREAM_UNARY))(
+            iter([_REQUEST] * test_constants.STREAM_LENGTH)
+        )
+        self.assertEqual(_REQUEST * test_constants.STREAM_LENGTH, response)
+
+    def test_stream_stream(self):
+        responses = self._channel.stream_stream(_method(_STREAM_STREAM))(
+            iter([_REQUEST] * test_constants.STREAM_LENGTH)
+        )
+        self.assertEqual(
+            [_REQUEST[::-1]] * test_constants.STREAM_LENGTH, list(responses)
+        )
+
+    def test_none_request(self):
+        multi_callable = self._channel.unary_unary(_method(_UNARY_UNARY))
+        with self.assertRaises(grpc.RpcError) as exception_context:
+            multi_callable(None)
+        self.assertIs(
+            grpc.StatusCode.INTERNAL, exception_context.exception.code()
+        )
+
+
+if __name__ == "__main__":
+    logging.basicConfig()
+    unittest.main(verbosity=2)
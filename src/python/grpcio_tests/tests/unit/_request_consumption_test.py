@@ -0,0 +1,152 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests consuming request iterators on a channel's bounded thread pool."""
+
+import logging
+import unittest
+
+import grpc
+from grpc._cython import cygrpc
+
+from tests.unit import test_common
+from tests.unit.framework.common import test_constants
+
+_SERVICE_NAME = "test"
+_STREAM_UNARY = "StreamUnary"
+_STREAM_STREAM = "StreamStream"
+
+_THREADS = 2
+_RPC_COUNT = 50
+_REQUEST = b"\x00\x00\x00"
+
+
+def _handle_stream_unary(request_iterator, servicer_context):
+    return b"".join(request_iterator)
+
+
+def _handle_stream_stream(request_iterator, servicer_context):
+    for request in request_iterator:
+        yield request
+
+
+_METHOD_HANDLERS = {
+    _STREAM_UNARY: grpc.stream_unary_rpc_method_handler(_handle_stream_unary),
+    _STREAM_STREAM: grpc.stream_stream_rpc_method_handler(
+        _handle_stream_stream
+    ),
+}
+
+
+def _method(name):
+    return grpc._common.fully_qualified_method(_SERVICE_NAME, name)
+
+
+def _failing_request_iterator():
+    yield _REQUEST
+    raise ValueError("Failing request iterator!")
+
+
+@unittest.skipIf(
+    cygrpc.is_fork_support_enabled(),
+    "Request iterators are not pooled with fork support enabled.",
+)
+class RequestConsumptionTest(unittest.TestCase):
+    def setUp(self):
+        self._server = test_common.test_server(max_workers=_RPC_COUNT)
+        self._server.add_registered_method_handlers(
+            _SERVICE_NAME, _METHOD_HANDLERS
+        )
+        port = self._server.add_insecure_port("[::]:0")
+        self._server.start()
+        self._channel = grpc.insecure_channel(
+            "localhost:%d" % port,
+            options=(
+                (
+                    grpc.experimental.ChannelOptions.RequestConsumptionThreads,
+                    _THREADS,
+                ),
+            ),
+        )
+        self._stream_unary = self._channel.stream_unary(
+            _method(_STREAM_UNARY), _registered_method=True
+        )
+
+    def tearDown(self):
+        self._server.stop(None)
+        self._channel.close()
+
+    def _requests(self):
+        return iter([_REQUEST] * test_constants.STREAM_LENGTH)
+
+    def testBlockingStreamUnary(self):
+        self.assertEqual(
+            _REQUEST * test_constants.STREAM_LENGTH,
+            self._stream_unary(self._requests()),
+        )
+
+    def testConcurrentStreamUnary(self):
+        response_futures = [
+            self._stream_unary.future(self._requests())
+            for _ in range(_RPC_COUNT)
+        ]
+        for response_future in response_futures:
+            self.assertEqual(
+                _REQUEST * test_constants.STREAM_LENGTH,
+                response_future.result(),
+            )
+        self.assertLessEqual(
+            self._channel._request_consumption_pool.thread_starts, _THREADS
+        )
+
+    def testConcurrentStreamStream(self):
+        stream_stream = self._channel.stream_stream(
+            _method(_STREAM_STREAM), _registered_method=True
+        )
+        response_iterators = [
+            stream_stream(self._requests()) for _ in range(_RPC_COUNT)
+        ]
+        for response_iterator in response_iterators:
+            self.assertSequenceEqual(
+                [_REQUEST] * test_constants.STREAM_LENGTH,
+                list(response_iterator),
+            )
+        self.assertLessEqual(
+            self._channel._request_consumption_pool.thread_starts, _THREADS
+        )
+
+    def testFailingRequestIterator(self):
+        with self.assertRaises(grpc.RpcError) as exception_context:
+            self._stream_unary(_failing_request_iterator())
+        self.assertIs(
+            grpc.StatusCode.UNKNOWN, exception_context.exception.code()
+        )
+
+    def testInvalidThreadCount(self):
+        for thread_count in (0, -1, True, 1.5, "2"):
+            with self.subTest(thread_count=thread_count):
+                with self.assertRaises(ValueError):
+                    grpc.insecure_channel(
+                        "localhost:1",
+                        options=(
+                            (
+                                grpc.experimental.ChannelOptions.RequestConsumptionThreads,
+                                thread_count,
+                            ),
+                        ),
+                    )
+
+
+if __name__ == "__main__":
+    logging.basicConfig()
+    unittest.main(verbosity=2)
@@ -0,0 +1,262 @@
+# Copyright 2024 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests of how the server dispatches RPCs to method handlers."""
+
+import collections
+from concurrent import futures
+import logging
+import unittest
+
+import grpc
+from grpc import _common
+from grpc import _interceptor
+from grpc import _server
+
+_REQUEST = b"\x00\x00\x00"
+_REGISTERED_RESPONSE = b"registered"
+_GENERIC_RESPONSE = b"generic"
+_INTERCEPTED_RESPONSE = b"intercepted"
+
+_SERVICE_NAME = "test.Dispatch"
+_REGISTERED = "Registered"
+_GENERIC = "Generic"
+_UNKNOWN = "Unknown"
+
+_REGISTERED_METHOD = _common.fully_qualified_method(_SERVICE_NAME, _REGISTERED)
+_GENERIC_METHOD = _common.fully_qualified_method(_SERVICE_NAME, _GENERIC)
+_UNKNOWN_METHOD = _common.fully_qualified_method(_SERVICE_NAME, _UNKNOWN)
+
+_CallDetails = collections.namedtuple("_CallDetails", ("method",))
+_RpcEvent = collections.namedtuple(
+    "_RpcEvent", ("call_details", "invocation_metadata")
+)
+
+
+def _registered_unary_unary(request, servicer_context):
+    return _REGISTERED_RESPONSE
+
+
+def _generic_unary_unary(request, servicer_context):
+    return _GENERIC_RESPONSE
+
+
+def _intercepted_unary_unary(request, servicer_context):
+    return _INTERCEPTED_RESPONSE
+
+
+def _generic_stream_stream(request_iterator, servicer_context):
+    for _ in request_iterator:
+        yield _GENERIC_RESPONSE
+
+
+_REGISTERED_HANDLER = grpc.unary_unary_rpc_method_handler(
+    _registered_unary_unary
+)
+_GENERIC_HANDLER = grpc.unary_unary_rpc_method_handler(_generic_unary_unary)
+_INTERCEPTED_HANDLER = grpc.unary_unary_rpc_method_handler(
+    _intercepted_unary_unary
+)
+
+
+class _GenericHandler(grpc.GenericRpcHandler):
+    def __init__(self, methods):
+        self._methods = methods
+        self.queried = []
+
+    def service(self, handler_call_details):
+        self.queried.append(handler_call_details.method)
+        if handler_call_details.method in self._methods:
+            return _GENERIC_HANDLER
+        return None
+
+
+class _RecordingInterceptor(grpc.ServerInterceptor):
+    def __init__(self, substitute=None):
+        self._substitute = substitute
+        self.intercepted = []
+
+    def intercept_service(self, continuation, handler_call_details):
+        self.intercepted.append(handler_call_details.method)
+        if self._substitute is not None:
+            return self._substitute
+        return continuation(handler_call_details)
+
+
+def _rpc_event(method):
+    return _RpcEvent(_CallDetails(method.encode("ascii")), ())
+
+
+class MethodTest(unittest.TestCase):
+    def setUp(self):
+        self._thread_pool = futures.ThreadPoolExecutor(max_workers=1)
+
+    def tearDown(self):
+        self._thread_pool.shutdown(wait=True)
+
+    def test_method_dispatch_resolves_arity_and_thread_pool(self):
+        dispatch = _server._method_dispatch(
+            grpc.stream_stream_rpc_method_handler(_generic_stream_stream),
+            self._thread_pool,
+            False,
+        )
+
+        self.assertIs(_server._handle_stream_stream, dispatch.handle)
+        self.assertIs(self._thread_pool, dispatch.thread_pool)
+
+    def test_registered_method_reuses_its_dispatch(self):
+        method = _server._RegisteredMethod(
+            _REGISTERED_METHOD, _REGISTERED_HANDLER, self._thread_pool, False
+        )
+
+        first = method.dispatch(_REGISTERED_HANDLER, self._thread_pool, False)
+        second = method.dispatch(_REGISTERED_HANDLER, self._thread_pool, False)
+
+        self.assertIs(first, second)
+        self.assertIs(_REGISTERED_HANDLER, first.method_handler)
+        self.assertIs(_server._handle_unary_unary, first.handle)
+
+    def test_registered_method_dispatches_substituted_handler(self):
+        method = _server._RegisteredMethod(
+            _REGISTERED_METHOD, _REGISTERED_HANDLER, self._thread_pool, False
+        )
+
+        dispatch = method.dispatch(
+            _INTERCEPTED_HANDLER, self._thread_pool, False
+        )
+
+        self.assertIs(_INTERCEPTED_HANDLER, dispatch.method_handler)
+
+    def test_registered_method_without_interceptors(self):
+        method = _server._RegisteredMethod(
+            _REGISTERED_METHOD, _REGISTERED_HANDLER, self._thread_pool, False
+        )
+
+        method_handler = _server._find_method_handler(
+            _rpc_event(_REGISTERED_METHOD), _server._RPCState(), method, None
+        )
+
+        self.assertIs(_REGISTERED_HANDLER, method_handler)
+
+    def test_registered_method_with_interceptors(self):
+        method = _server._RegisteredMethod(
+            _REGISTERED_METHOD, _REGISTERED_HANDLER, self._thread_pool, False
+        )
+        interceptor = _RecordingInterceptor()
+
+        method_handler = _server._find_method_handler(
+            _rpc_event(_REGISTERED_METHOD),
+            _server._RPCState(),
+            method,
+            _interceptor.service_pipeline((interceptor,)),
+        )
+
+        self.assertIs(_REGISTERED_HANDLER, method_handler)
+        self.assertEqual([_REGISTERED_METHOD], interceptor.intercepted)
+
+    def test_generic_method_queries_handlers_in_order(self):
+        first = _GenericHandler(())
+        second = _GenericHandler((_GENERIC_METHOD,))
+        method = _server._GenericMethod([first, second])
+
+        method_handler = _server._find_method_handler(
+            _rpc_event(_GENERIC_METHOD), _server._RPCState(), method, None
+        )
+
+        self.assertIs(_GENERIC_HANDLER, method_handler)
+        self.assertEqual([_GENERIC_METHOD], first.queried)
+        self.assertEqual([_GENERIC_METHOD], second.queried)
+
+    def test_generic_method_without_match(self):
+        method = _server._GenericMethod([_GenericHandler((_GENERIC_METHOD,))])
+
+        method_handler = _server._find_method_handler(
+            _rpc_event(_UNKNOWN_METHOD), _server._RPCState(), method, None
+        )
+
+        self.assertIsNone(method_handler)
+
+
+class ServerDispatchTest(unittest.TestCase):
+    def _start_server(self, generic_methods, interceptors=None):
+        self._generic_handler = _GenericHandler(generic_methods)
+        self._server = grpc.server(
+            futures.ThreadPoolExecutor(max_workers=2),
+            handlers=(self._generic_handler,),
+            interceptors=interceptors,
+            options=(("grpc.so_reuseport", 0),),
+        )
+        self._server.add_registered_method_handlers(
+            _SERVICE_NAME, {_REGISTERED: _REGISTERED_HANDLER}
+        )
+        port = self._server.add_insecure_port("[::]:0")
+        self._server.start()
+        self._channel = grpc.insecure_channel("localhost:%d" % port)
+
+    def tearDown(self):
+        self._channel.close()
+        self._server.stop(None)
+
+    def _call(self, method):
+        return self._channel.unary_unary(method, _registered_method=True)(
+            _REQUEST
+        )
+
+    def test_registered_method(self):
+        self._start_server(())
+
+        self.assertEqual(_REGISTERED_RESPONSE, self._call(_REGISTERED_METHOD))
+        self.assertEqual([], self._generic_handler.queried)
+
+    def test_registered_method_with_interceptor(self):
+        interceptor = _RecordingInterceptor()
+        self._start_server((), interceptors=(interceptor,))
+
+        self.assertEqual(_REGISTERED_RESPONSE, self._call(_REGISTERED_METHOD))
+        self.assertEqual(_REGISTERED_RESPONSE, self._call(_REGISTERED_METHOD))
+        self.assertEqual(
+            [_REGISTERED_METHOD, _REGISTERED_METHOD], interceptor.intercepted
+        )
+
+    def test_registered_method_with_substituting_interceptor(self):
+        interceptor = _RecordingInterceptor(substitute=_INTERCEPTED_HANDLER)
+        self._start_server((), interceptors=(interceptor,))
+
+        self.assertEqual(_INTERCEPTED_RESPONSE, self._call(_REGISTERED_METHOD))
+
+    def test_generic_fallback(self):
+        self._start_server((_GENERIC_METHOD,))
+
+        self.assertEqual(_GENERIC_RESPONSE, self._call(_GENERIC_METHOD))
+        self.assertEqual([_GENERIC_METHOD], self._generic_handler.queried)
+
+    def test_registered_method_takes_precedence_over_generic(self):
+        self._start_server((_REGISTERED_METHOD,))
+
+        self.assertEqual(_REGISTERED_RESPONSE, self._call(_REGISTERED_METHOD))
+        self.assertEqual([], self._generic_handler.queried)
+
+    def test_unknown_method(self):
+        self._start_server((_GENERIC_METHOD,))
+
+        with self.assertRaises(grpc.RpcError) as exception_context:
+            self._call(_UNKNOWN_METHOD)
+
+        self.assertIs(
+            grpc.StatusCode.UNIMPLEMENTED, exception_context.exception.code()
+        )
+
+
+if __name__ == "__main__":
+    logging.basicConfig()
+    unittest.main(verbosity=2)
@@ -33,6 +33,9 @@ _UNARY_STREAM = "UnaryStream"
 _STREAM_UNARY = "StreamUnary"
 _STREAM_STREAM = "StreamStream"
 
+_COMPLETION_QUEUE_COUNT = 4
+_REQUEST_CALL_DEPTH = 8
+
 
 class _ActualGenericRpcHandler(grpc.GenericRpcHandler):
     def service(self, handler_call_details):
@@ -301,6 +304,170 @@ class ServerHandlerTest(unittest.TestCase):
         self.assertEqual(_REGISTERED_RESPONSE, registered_response)
 
 
+class ShardedServerTest(unittest.TestCase):
+    def setUp(self):
+        self._server = grpc.server(
+            futures.ThreadPoolExecutor(max_workers=10),
+            handlers=(_GenericHandler(),),
+            options=(
+                ("grpc.so_reuseport", 0),
+                (
+                    grpc.experimental.ServerOptions.CompletionQueueCount,
+                    _COMPLETION_QUEUE_COUNT,
+                ),
+            ),
+        )
+        self._server.add_registered_method_handlers(
+            _SERVICE_NAME, _REGISTERED_METHOD_HANDLERS
+        )
+        port = self._server.add_insecure_port("[::]:0")
+        self._server.start()
+        self._channel = grpc.insecure_channel("localhost:%d" % port)
+
+    def tearDown(self):
+        self._server.stop(None)
+        self._channel.close()
+
+    def test_concurrent_calls_across_completion_queues(self):
+        generic_multi_callable = self._channel.unary_unary(
+            _UNARY_UNARY,
+            _registered_method=True,
+        )
+        registered_multi_callable = self._channel.unary_unary(
+            grpc._common.fully_qualified_method(
+                _SERVICE_NAME, _UNARY_UNARY_REGISTERED
+            ),
+            _registered_method=True,
+        )
+        generic_futures = [
+            generic_multi_callable.future(_REQUEST)
+            for _ in range(test_constants.THREAD_CONCURRENCY)
+        ]
+        registered_futures = [
+            registered_multi_callable.future(_REQUEST)
+            for _ in range(test_constants.THREAD_CONCURRENCY)
+        ]
+        for future in generic_futures:
+            self.assertEqual(_RESPONSE, future.result())
+        for future in registered_futures:
+            self.assertEqual(_REGISTERED_RESPONSE, future.result())
+
+    def test_streaming_calls_across_completion_queues(self):
+        response_iterator = self._channel.stream_stream(
+            _STREAM_STREAM,
+            _registered_method=True,
+        )(iter([_REQUEST] * test_constants.STREAM_LENGTH))
+        self.assertSequenceEqual(
+            [_RESPONSE] * test_constants.STREAM_LENGTH, list(response_iterator)
+        )
+
+    def test_graceful_stop(self):
+        response = self._channel.unary_unary(
+            _UNARY_UNARY,
+            _registered_method=True,
+        )(_REQUEST)
+        self.assertEqual(_RESPONSE, response)
+        self.assertTrue(
+            self._server.stop(test_constants.SHORT_TIMEOUT).wait(
+                test_constants.LONG_TIMEOUT
+            )
+        )
+
+    def test_invalid_completion_queue_count(self):
+        for value in (0, True):
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    grpc.server(
+                        futures.ThreadPoolExecutor(max_workers=1),
+                        options=(
+                            (
+                                grpc.experimental.ServerOptions.CompletionQueueCount,
+                                value,
+                            ),
+                        ),
+                    )
+
+
+class RequestCallDepthTest(unittest.TestCase):
+    def setUp(self):
+        self._server = grpc.server(
+            futures.ThreadPoolExecutor(max_workers=10),
+            handlers=(_GenericHandler(),),
+            options=(
+                ("grpc.so_reuseport", 0),
+                (
+                    grpc.experimental.ServerOptions.CompletionQueueCount,
+                    _COMPLETION_QUEUE_COUNT,
+                ),
+                (
+                    grpc.experimental.ServerOptions.RequestCallDepth,
+                    _REQUEST_CALL_DEPTH,
+                ),
+            ),
+        )
+        self._server.add_registered_method_handlers(
+            _SERVICE_NAME, _REGISTERED_METHOD_HANDLERS
+        )
+        port = self._server.add_insecure_port("[::]:0")
+        self._server.start()
+        self._channel = grpc.insecure_channel("localhost:%d" % port)
+
+    def tearDown(self):
+        self._server.stop(None)
+        self._channel.close()
+
+    def test_concurrent_calls(self):
+        generic_multi_callable = self._channel.unary_unary(
+            _UNARY_UNARY,
+            _registered_method=True,
+        )
+        registered_multi_callable = self._channel.unary_unary(
+            grpc._common.fully_qualified_method(
+                _SERVICE_NAME, _UNARY_UNARY_REGISTERED
+            ),
+            _registered_method=True,
+        )
+        for _ in range(2):
+            generic_futures = [
+                generic_multi_callable.future(_REQUEST)
+                for _ in range(test_constants.THREAD_CONCURRENCY)
+            ]
+            registered_futures = [
+                registered_multi_callable.future(_REQUEST)
+                for _ in range(test_constants.THREAD_CONCURRENCY)
+            ]
+            for future in generic_futures:
+                self.assertEqual(_RESPONSE, future.result())
+            for future in registered_futures:
+                self.assertEqual(_REGISTERED_RESPONSE, future.result())
+
+    def test_graceful_stop_drains_outstanding_requests(self):
+        response = self._channel.unary_unary(
+            _UNARY_UNARY,
+            _registered_method=True,
+        )(_REQUEST)
+        self.assertEqual(_RESPONSE, response)
+        self.assertTrue(
+            self._server.stop(test_constants.SHORT_TIMEOUT).wait(
+                test_constants.LONG_TIMEOUT
+            )
+        )
+
+    def test_invalid_request_call_depth(self):
+        for value in (0, True):
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    grpc.server(
+                        futures.ThreadPoolExecutor(max_workers=1),
+                        options=(
+                            (
+                                grpc.experimental.ServerOptions.RequestCallDepth,
+                                value,
+                            ),
+                        ),
+                    )
+
+
 if __name__ == "__main__":
     logging.basicConfig()
     unittest.main(verbosity=2)
@@ -0,0 +1,158 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests serializing client-streaming requests ahead of sending them."""
+
+import logging
+import unittest
+
+import grpc
+from grpc._cython import cygrpc
+
+from tests.unit import test_common
+from tests.unit.framework.common import test_constants
+
+_SERVICE_NAME = "test"
+_STREAM_UNARY = "StreamUnary"
+_STREAM_STREAM = "StreamStream"
+
+_WINDOW = 8
+_RPC_COUNT = 10
+
+
+def _handle_stream_unary(request_iterator, servicer_context):
+    return b"".join(request_iterator)
+
+
+def _handle_stream_stream(request_iterator, servicer_context):
+    for request in request_iterator:
+        yield request
+
+
+_METHOD_HANDLERS = {
+    _STREAM_UNARY: grpc.stream_unary_rpc_method_handler(_handle_stream_unary),
+    _STREAM_STREAM: grpc.stream_stream_rpc_method_handler(
+        _handle_stream_stream
+    ),
+}
+
+
+def _method(name):
+    return grpc._common.fully_qualified_method(_SERVICE_NAME, name)
+
+
+def _requests():
+    return [b"%d" % index for index in range(test_constants.STREAM_LENGTH)]
+
+
+def _failing_request_iterator():
+    for request in _requests()[: _WINDOW * 2]:
+        yield request
+    raise ValueError("Failing request iterator!")
+
+
+class _StreamWriteWindowTestBase(object):
+    def _start(self, channel_options):
+        self._server = test_common.test_server(max_workers=_RPC_COUNT)
+        self._server.add_registered_method_handlers(
+            _SERVICE_NAME, _METHOD_HANDLERS
+        )
+        port = self._server.add_insecure_port("[::]:0")
+        self._server.start()
+        self._channel = grpc.insecure_channel(
+            "localhost:%d" % port,
+            options=(
+                (grpc.experimental.ChannelOptions.StreamWriteWindow, _WINDOW),
+            )
+            + channel_options,
+        )
+        self._stream_unary = self._channel.stream_unary(
+            _method(_STREAM_UNARY), _registered_method=True
+        )
+        self._stream_stream = self._channel.stream_stream(
+            _method(_STREAM_STREAM), _registered_method=True
+        )
+
+    def tearDown(self):
+        self._server.stop(None)
+        self._channel.close()
+
+    def testBlockingStreamUnary(self):
+        self.assertEqual(
+            b"".join(_requests()), self._stream_unary(iter(_requests()))
+        )
+
+    def testConcurrentStreamUnary(self):
+        response_futures = [
+            self._stream_unary.future(iter(_requests()))
+            for _ in range(_RPC_COUNT)
+        ]
+        for response_future in response_futures:
+            self.assertEqual(b"".join(_requests()), response_future.result())
+
+    def testStreamStreamPreservesOrder(self):
+        self.assertSequenceEqual(
+            _requests(), list(self._stream_stream(iter(_requests())))
+        )
+
+    def testEmptyRequestIterator(self):
+        self.assertEqual(b"", self._stream_unary(iter(())))
+
+    def testFailingRequestIterator(self):
+        with self.assertRaises(grpc.RpcError) as exception_context:
+            self._stream_unary(_failing_request_iterator())
+        self.assertIs(
+            grpc.StatusCode.UNKNOWN, exception_context.exception.code()
+        )
+
+    def testInvalidWindow(self):
+        for window in (0, -1, True, 1.5):
+            with self.subTest(window=window):
+                with self.assertRaises(ValueError):
+                    grpc.insecure_channel(
+                        "localhost:1",
+                        options=(
+                            (
+                                grpc.experimental.ChannelOptions.StreamWriteWindow,
+                                window,
+                            ),
+                        ),
+                    )
+
+
+class ThreadStreamWriteWindowTest(
+    _StreamWriteWindowTestBase, unittest.TestCase
+):
+    def setUp(self):
+        self._start(())
+
+
+@unittest.skipIf(
+    cygrpc.is_fork_support_enabled(),
+    "Request iterators are not pooled with fork support enabled.",
+)
+class PoolStreamWriteWindowTest(_StreamWriteWindowTestBase, unittest.TestCase):
+    def setUp(self):
+        self._start(
+            (
+                (
+                    grpc.experimental.ChannelOptions.RequestConsumptionThreads,
+                    2,
+                ),
+            )
+        )
+
+
+if __name__ == "__main__":
+    logging.basicConfig()
+    unittest.main(verbosity=2)
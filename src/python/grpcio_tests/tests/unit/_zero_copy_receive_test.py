@@ -0,0 +1,245 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests receiving messages as buffers rather than as bytes."""
+
+from concurrent import futures
+import logging
+import unittest
+
+from google.protobuf import wrappers_pb2
+import grpc
+
+from tests.unit.framework.common import test_constants
+
+_SERVICE_NAME = "test"
+_UNARY_UNARY = "UnaryUnary"
+_UNARY_STREAM = "UnaryStream"
+_STREAM_UNARY = "StreamUnary"
+_STREAM_STREAM = "StreamStream"
+
+_SMALL_MESSAGE = b"\x07" * 16
+# Large enough to be received in more than one slice.
+_LARGE_MESSAGE = bytes(range(256)) * 16 * 1024
+
+
+def _buffer_deserializer(message):
+    if isinstance(message, bytes):
+        raise TypeError("Expected a buffer, got bytes.")
+    return bytes(memoryview(message))
+
+
+def _handle_unary_unary(request, servicer_context):
+    return bytes(request)
+
+
+def _handle_unary_stream(request, servicer_context):
+    for _ in range(test_constants.STREAM_LENGTH):
+        yield bytes(request)
+
+
+def _handle_stream_unary(request_iterator, servicer_context):
+    return b"".join(bytes(request) for request in request_iterator)
+
+
+def _handle_stream_stream(request_iterator, servicer_context):
+    for request in request_iterator:
+        yield bytes(request)
+
+
+def _method_handlers(request_deserializer):
+    return {
+        _UNARY_UNARY: grpc.unary_unary_rpc_method_handler(
+            _handle_unary_unary, request_deserializer=request_deserializer
+        ),
+        _UNARY_STREAM: grpc.unary_stream_rpc_method_handler(
+            _handle_unary_stream, request_deserializer=request_deserializer
+        ),
+        _STREAM_UNARY: grpc.stream_unary_rpc_method_handler(
+            _handle_stream_unary, request_deserializer=request_deserializer
+        ),
+        _STREAM_STREAM: grpc.stream_stream_rpc_method_handler(
+            _handle_stream_stream, request_deserializer=request_deserializer
+        ),
+    }
+
+
+def _method(name):
+    return grpc._common.fully_qualified_method(_SERVICE_NAME, name)
+
+
+class _ZeroCopyReceiveTestBase(object):
+    def _start(self, request_deserializer, server_options, channel_options):
+        self._server = grpc.server(
+            futures.ThreadPoolExecutor(max_workers=10),
+            options=(("grpc.so_reuseport", 0),) + server_options,
+        )
+        self._server.add_registered_method_handlers(
+            _SERVICE_NAME, _method_handlers(request_deserializer)
+        )
+        port = self._server.add_insecure_port("[::]:0")
+        self._server.start()
+        self._channel = grpc.insecure_channel(
+            "localhost:%d" % port, options=channel_options
+        )
+
+    def tearDown(self):
+        self._server.stop(None)
+        self._channel.close()
+
+    def _assert_unary_unary(self, message):
+        response = self._channel.unary_unary(
+            _method(_UNARY_UNARY),
+            response_deserializer=self._response_deserializer,
+            _registered_method=True,
+        )(message)
+        self.assertEqual(message, bytes(response))
+
+    def testUnaryUnarySmallMessage(self):
+        self._assert_unary_unary(_SMALL_MESSAGE)
+
+    def testUnaryUnaryLargeMessage(self):
+        self._assert_unary_unary(_LARGE_MESSAGE)
+
+    def testUnaryUnaryEmptyMessage(self):
+        self._assert_unary_unary(b"")
+
+    def testUnaryStream(self):
+        response_iterator = self._channel.unary_stream(
+            _method(_UNARY_STREAM),
+            response_deserializer=self._response_deserializer,
+            _registered_method=True,
+        )(_LARGE_MESSAGE)
+        self.assertSequenceEqual(
+            [_LARGE_MESSAGE] * test_constants.STREAM_LENGTH,
+            [bytes(response) for response in response_iterator],
+        )
+
+    def testStreamUnary(self):
+        response = self._channel.stream_unary(
+            _method(_STREAM_UNARY),
+            response_deserializer=self._response_deserializer,
+            _registered_method=True,
+        )(iter([_SMALL_MESSAGE] * test_constants.STREAM_LENGTH))
+        self.assertEqual(
+            _SMALL_MESSAGE * test_constants.STREAM_LENGTH, bytes(response)
+        )
+
+    def testStreamStream(self):
+        response_iterator = self._channel.stream_stream(
+            _method(_STREAM_STREAM),
+            response_deserializer=self._response_deserializer,
+            _registered_method=True,
+        )(iter([_LARGE_MESSAGE] * test_constants.STREAM_LENGTH))
+        self.assertSequenceEqual(
+            [_LARGE_MESSAGE] * test_constants.STREAM_LENGTH,
+            [bytes(response) for response in response_iterator],
+        )
+
+
+class PerMethodZeroCopyReceiveTest(_ZeroCopyReceiveTestBase, unittest.TestCase):
+    def setUp(self):
+        self._response_deserializer = grpc.experimental.zero_copy_deserializer(
+            _buffer_deserializer
+        )
+        self._start(
+            grpc.experimental.zero_copy_deserializer(_buffer_deserializer),
+            (),
+            (),
+        )
+
+
+class OptionZeroCopyReceiveTest(_ZeroCopyReceiveTestBase, unittest.TestCase):
+    def setUp(self):
+        self._response_deserializer = None
+        self._start(
+            None,
+            ((grpc.experimental.ServerOptions.ZeroCopyReceive, True),),
+            ((grpc.experimental.ChannelOptions.ZeroCopyReceive, True),),
+        )
+
+    def testReceivedMessageIsReadOnlyBuffer(self):
+        response = self._channel.unary_unary(
+            _method(_UNARY_UNARY), _registered_method=True
+        )(_SMALL_MESSAGE)
+        self.assertNotIsInstance(response, bytes)
+        self.assertEqual(len(_SMALL_MESSAGE), len(response))
+        view = memoryview(response)
+        self.assertTrue(view.readonly)
+        self.assertEqual(_SMALL_MESSAGE, view.tobytes())
+
+
+def _handle_protobuf_unary_unary(request, servicer_context):
+    return wrappers_pb2.BytesValue(value=request.value[::-1])
+
+
+class ProtobufZeroCopyReceiveTest(unittest.TestCase):
+    def _start(self, request_deserializer, server_options, channel_options):
+        self._server = grpc.server(
+            futures.ThreadPoolExecutor(max_workers=10),
+            options=(("grpc.so_reuseport", 0),) + server_options,
+        )
+        self._server.add_registered_method_handlers(
+            _SERVICE_NAME,
+            {
+                _UNARY_UNARY: grpc.unary_unary_rpc_method_handler(
+                    _handle_protobuf_unary_unary,
+                    request_deserializer=request_deserializer,
+                    response_serializer=wrappers_pb2.BytesValue.SerializeToString,
+                ),
+            },
+        )
+        port = self._server.add_insecure_port("[::]:0")
+        self._server.start()
+        self._channel = grpc.insecure_channel(
+            "localhost:%d" % port, options=channel_options
+        )
+
+    def tearDown(self):
+        self._server.stop(None)
+        self._channel.close()
+
+    def _assert_unary_unary(self, response_deserializer, message):
+        response = self._channel.unary_unary(
+            _method(_UNARY_UNARY),
+            request_serializer=wrappers_pb2.BytesValue.SerializeToString,
+            response_deserializer=response_deserializer,
+            _registered_method=True,
+        )(wrappers_pb2.BytesValue(value=message))
+        self.assertEqual(message[::-1], response.value)
+
+    def testPerMethod(self):
+        deserializer = grpc.experimental.zero_copy_deserializer(
+            wrappers_pb2.BytesValue.FromString
+        )
+        self._start(deserializer, (), ())
+        self._assert_unary_unary(deserializer, _SMALL_MESSAGE)
+        self._assert_unary_unary(deserializer, _LARGE_MESSAGE)
+
+    def testOption(self):
+        self._start(
+            wrappers_pb2.BytesValue.FromString,
+            ((grpc.experimental.ServerOptions.ZeroCopyReceive, True),),
+            ((grpc.experimental.ChannelOptions.ZeroCopyReceive, True),),
+        )
+        self._assert_unary_unary(
+            wrappers_pb2.BytesValue.FromString, _SMALL_MESSAGE
+        )
+        self._assert_unary_unary(
+            wrappers_pb2.BytesValue.FromString, _LARGE_MESSAGE
+        )
+
+
+if __name__ == "__main__":
+    logging.basicConfig()
+    unittest.main(verbosity=2)
@@ -0,0 +1,143 @@
+# Copyright 2026 The gRPC Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Counts the allocations the AsyncIO stack makes for each RPC.
+
+Starts a server and a channel in this process, then runs a number of unary
+RPCs to completion under tracemalloc. The blocks allocated over those RPCs,
+divided by their number, is the per-RPC allocation count of both the client
+and the server. Garbage collection is disabled while measuring, so that
+objects left in reference cycles are counted rather than collected, and
+free-lists are warmed up beforehand, so that reusing them is not counted.
+"""
+
+import argparse
+import asyncio
+import gc
+import logging
+import tracemalloc
+
+import grpc
+from grpc.experimental import aio
+
+_SERVICE = "grpc.testing.AllocationBenchmark"
+_METHOD = "UnaryUnary"
+_REQUEST = b"\x00" * 16
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def _unary_unary(request, unused_context):
+    return request
+
+
+async def _run_rpcs(multicallable, num_rpcs, concurrency):
+    for start in range(0, num_rpcs, concurrency):
+        await asyncio.gather(
+            *(
+                multicallable(_REQUEST)
+                for _ in range(min(concurrency, num_rpcs - start))
+            )
+        )
+
+
+async def _measure(args):
+    options = (
+        (
+            grpc.experimental.ServerOptions.InlineCancellationListener,
+            args.inline_cancellation_listener,
+        ),
+    )
+    server = aio.server(options=options)
+    server.add_generic_rpc_handlers(
+        (
+            grpc.method_handlers_generic_handler(
+                _SERVICE,
+                {_METHOD: grpc.unary_unary_rpc_method_handler(_unary_unary)},
+            ),
+        )
+    )
+    port = server.add_insecure_port("localhost:0")
+    await server.start()
+    async with aio.insecure_channel("localhost:%d" % port) as channel:
+        multicallable = channel.unary_unary("/%s/%s" % (_SERVICE, _METHOD))
+        # Warms up connections, caches and free-lists.
+        await _run_rpcs(multicallable, args.num_rpcs, args.concurrency)
+        gc.collect()
+
+        gc.disable()
+        tracemalloc.start(args.traceback_limit)
+        baseline = tracemalloc.take_snapshot()
+        await _run_rpcs(multicallable, args.num_rpcs, args.concurrency)
+        completed = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        gc.enable()
+    await server.stop(None)
+
+    differences = completed.compare_to(baseline, "lineno")
+    total_blocks = sum(difference.count_diff for difference in differences)
+    total_bytes = sum(difference.size_diff for difference in differences)
+    _LOGGER.info(
+        "Per completed RPC: %.1f blocks allocated, %.1f bytes",
+        total_blocks / args.num_rpcs,
+        total_bytes / args.num_rpcs,
+    )
+    for difference in differences[: args.top]:
+        _LOGGER.info(
+            "%8.2f blocks %10.1f bytes  %s",
+            difference.count_diff / args.num_rpcs,
+            difference.size_diff / args.num_rpcs,
+            difference.traceback,
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Counts per-RPC allocations of the AsyncIO stack."
+    )
+    parser.add_argument(
+        "--num_rpcs",
+        type=int,
+        default=1000,
+        help="The number of RPCs completed when measuring.",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="The number of RPCs in flight at once.",
+    )
+    parser.add_argument(
+        "--inline_cancellation_listener",
+        action="store_true",
+        help="Run each RPC of the server in a single task.",
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=20,
+        help="The number of allocation sites to report.",
+    )
+    parser.add_argument(
+        "--traceback_limit",
+        type=int,
+        default=1,
+        help="The number of frames stored for each allocation.",
+    )
+    args = parser.parse_args()
+    asyncio.run(_measure(args))
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
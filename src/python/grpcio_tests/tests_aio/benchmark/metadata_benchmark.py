@@ -0,0 +1,155 @@
+# Copyright 2026 The gRPC Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measures the throughput of unary calls carrying a lot of metadata.
+
+Starts a server and a channel in this process. Every call sends the given
+number of metadata entries, the servicer looks one of them up and answers
+with as many trailing metadata entries, and the client reads both the
+initial and the trailing metadata of the call.
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+
+import grpc
+from grpc.experimental import aio
+
+_SERVICE = "grpc.testing.MetadataBenchmark"
+_METHOD = "UnaryUnary"
+_REQUEST = b"\x00" * 16
+_LOOKUP_KEY = "x-benchmark-key-0"
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _build_metadata(prefix, num_entries, value_size):
+    return aio.Metadata(
+        *(
+            ("%s-%d" % (prefix, index), "v" * value_size)
+            for index in range(num_entries)
+        )
+    )
+
+
+class _Servicer:
+    def __init__(self, trailing_metadata):
+        self._trailing_metadata = trailing_metadata
+
+    async def unary_unary(self, request, context):
+        invocation_metadata = aio.Metadata.from_tuple(
+            context.invocation_metadata()
+        )
+        invocation_metadata.get(_LOOKUP_KEY)
+        context.set_trailing_metadata(self._trailing_metadata)
+        return request
+
+
+async def _run_calls(multicallable, metadata, num_rpcs):
+    for _ in range(num_rpcs):
+        call = multicallable(_REQUEST, metadata=metadata)
+        await call
+        initial_metadata = await call.initial_metadata()
+        trailing_metadata = await call.trailing_metadata()
+        initial_metadata.get(_LOOKUP_KEY)
+        trailing_metadata.get(_LOOKUP_KEY)
+
+
+async def _measure(args):
+    metadata = _build_metadata(
+        "x-benchmark-key", args.num_entries, args.value_size
+    )
+    servicer = _Servicer(
+        tuple(
+            _build_metadata(
+                "x-benchmark-trailer", args.num_entries, args.value_size
+            )
+        )
+    )
+    server = aio.server()
+    server.add_generic_rpc_handlers(
+        (
+            grpc.method_handlers_generic_handler(
+                _SERVICE,
+                {
+                    _METHOD: grpc.unary_unary_rpc_method_handler(
+                        servicer.unary_unary
+                    )
+                },
+            ),
+        )
+    )
+    port = server.add_insecure_port("localhost:0")
+    await server.start()
+    async with aio.insecure_channel("localhost:%d" % port) as channel:
+        multicallable = channel.unary_unary("/%s/%s" % (_SERVICE, _METHOD))
+        # Warms up the connection.
+        await _run_calls(multicallable, metadata, args.concurrency)
+
+        start_time = time.monotonic()
+        await asyncio.gather(
+            *(
+                _run_calls(multicallable, metadata, args.num_rpcs)
+                for _ in range(args.concurrency)
+            )
+        )
+        elapsed_time = time.monotonic() - start_time
+    await server.stop(None)
+
+    total_rpcs = args.num_rpcs * args.concurrency
+    _LOGGER.info(
+        "%d RPCs with %d metadata entries each: %.1f QPS, %.1f us per RPC",
+        total_rpcs,
+        args.num_entries,
+        total_rpcs / elapsed_time,
+        elapsed_time / total_rpcs * 1e6,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measures unary calls carrying a lot of metadata."
+    )
+    parser.add_argument(
+        "--num_rpcs",
+        type=int,
+        default=2000,
+        help="The number of RPCs issued by each concurrent caller.",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=10,
+        help="The number of concurrent callers.",
+    )
+    parser.add_argument(
+        "--num_entries",
+        type=int,
+        default=32,
+        help="The number of metadata entries sent in each direction.",
+    )
+    parser.add_argument(
+        "--value_size",
+        type=int,
+        default=64,
+        help="The size in bytes of each metadata value.",
+    )
+    args = parser.parse_args()
+    asyncio.run(_measure(args))
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
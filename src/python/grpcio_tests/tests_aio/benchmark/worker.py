@@ -15,6 +15,7 @@
 import argparse
 import asyncio
 import logging
+import os
 
 from grpc.experimental import aio
 
@@ -52,8 +53,25 @@ if __name__ == "__main__":
     parser.add_argument(
         "--uvloop", action="store_true", help="Use uvloop or not"
     )
+    parser.add_argument(
+        "--asyncio_engine",
+        choices=("poller", "per_loop_poller", "callback"),
+        help=(
+            "The gRPC AsyncIO engine, shared with any sub workers. Defaults to"
+            " GRPC_ASYNCIO_ENGINE, or poller if that is unset."
+        ),
+    )
     args = parser.parse_args()
 
+    if args.asyncio_engine:
+        # Read when the first aio object is created, and inherited by the
+        # sub workers spawned for multi-process scenarios.
+        os.environ["GRPC_ASYNCIO_ENGINE"] = args.asyncio_engine
+    logging.info(
+        "Using asyncio engine [%s]",
+        os.environ.get("GRPC_ASYNCIO_ENGINE", "poller"),
+    )
+
     if args.uvloop:
         import uvloop
 
@@ -22,6 +22,7 @@ import time
 from typing import Tuple
 
 import grpc
+from grpc._cython import cygrpc
 from grpc.experimental import aio
 
 from src.proto.grpc.testing import benchmark_service_pb2_grpc
@@ -57,6 +58,26 @@ class _SubWorker(
         return self._repr()
 
 
+class _PollerStats:
+    """Reports the completion queue poller's counters since the last mark."""
+
+    def __init__(self):
+        self._events, self._wakeups = cygrpc.poller_stats()
+
+    def report(self, reset: bool) -> None:
+        events, wakeups = cygrpc.poller_stats()
+        polled_events = events - self._events
+        signalled_wakeups = wakeups - self._wakeups
+        _LOGGER.info(
+            "Poller handled [%d] events in [%d] wake-ups (%.2f events each)",
+            polled_events,
+            signalled_wakeups,
+            polled_events / signalled_wakeups if signalled_wakeups else 0.0,
+        )
+        if reset:
+            self._events, self._wakeups = events, wakeups
+
+
 def _get_server_status(
     start_time: float, end_time: float, port: int
 ) -> control_pb2.ServerStatus:
@@ -212,11 +233,13 @@ class WorkerServicer(worker_service_pb2_grpc.WorkerServiceServicer):
         _LOGGER.info("Server started at port [%d]", port)
 
         start_time = time.monotonic()
+        poller_stats = _PollerStats()
         await context.write(_get_server_status(start_time, start_time, port))
 
         async for request in request_iterator:
             end_time = time.monotonic()
             status = _get_server_status(start_time, end_time, port)
+            poller_stats.report(request.mark.reset)
             if request.mark.reset:
                 start_time = end_time
             await context.write(status)
@@ -306,12 +329,14 @@ class WorkerServicer(worker_service_pb2_grpc.WorkerServiceServicer):
             running_tasks.append(self._loop.create_task(client.run()))
 
         end_time = time.monotonic()
+        poller_stats = _PollerStats()
         await context.write(_get_client_status(start_time, end_time, qps_data))
 
         # Respond to stat requests
         async for request in request_iterator:
             end_time = time.monotonic()
             status = _get_client_status(start_time, end_time, qps_data)
+            poller_stats.report(request.mark.reset)
             if request.mark.reset:
                 qps_data.reset()
                 start_time = time.monotonic()
@@ -13,6 +13,7 @@
 # limitations under the License.
 """Tests for the metadata abstraction that's used in the asynchronous driver."""
 import logging
+import pickle
 import unittest
 
 import grpc
@@ -271,6 +272,84 @@ class TestTypeMetadata(unittest.TestCase):
         self.assertEqual(list(empty_metadata.values()), [])
         self.assertEqual(list(empty_metadata.items()), [])
 
+    def test_grouped_by_key(self):
+        metadata = Metadata(("key1", "a"), ("key2", "b"), ("key1", "c"))
+        metadata.add("key2", "d")
+        grouped = (("key1", "a"), ("key1", "c"), ("key2", "b"), ("key2", "d"))
+        self.assertEqual(grouped, tuple(metadata))
+        self.assertEqual(metadata, grouped)
+        self.assertEqual(
+            Metadata(("key1", "a"), ("key2", "b"), ("key1", "c")),
+            (("key1", "a"), ("key1", "c"), ("key2", "b")),
+        )
+        self.assertEqual(["key1", "key2"], list(metadata.keys()))
+
+    def test_mutation_after_lookup(self):
+        metadata = Metadata(*self._MULTI_ENTRY_DATA)
+        self.assertEqual(metadata["key1"], "value1")
+
+        metadata.add("key3", "value3")
+        metadata["key1"] = "override value"
+        self.assertEqual(metadata["key3"], "value3")
+        self.assertEqual(
+            metadata.get_all("key1"), ["override value", "other value 1"]
+        )
+
+        metadata.set_all("key1", ["replaced"])
+        self.assertEqual(
+            (("key1", "replaced"), ("key2", "value2"), ("key3", "value3")),
+            tuple(metadata),
+        )
+
+        del metadata["key1"]
+        self.assertIn("key1", metadata)
+        self.assertIsNone(metadata.get("key1"))
+        self.assertEqual(2, len(metadata))
+
+    def test_get_all_is_live(self):
+        metadata = Metadata(*self._MULTI_ENTRY_DATA)
+        metadata.get_all("key1").append("added")
+        self.assertEqual(
+            metadata.get_all("key1"), ["value1", "other value 1", "added"]
+        )
+        self.assertEqual(4, len(metadata))
+
+    def test_views_follow_mutations(self):
+        metadata = Metadata(*self._DEFAULT_DATA)
+        keys = metadata.keys()
+        values = metadata.values()
+        items = metadata.items()
+
+        metadata.add("key3", "value3")
+        metadata["key1"] = "override value"
+
+        self.assertEqual(["key1", "key2", "key3"], list(keys))
+        self.assertEqual(
+            [["override value"], ["value2"], ["value3"]], list(values)
+        )
+        self.assertIn(("key3", ["value3"]), items)
+
+    def test_add_metadata(self):
+        metadata = Metadata(*self._DEFAULT_DATA)
+        self.assertEqual(
+            self._DEFAULT_DATA + (("key3", "value3"),),
+            tuple(metadata + (("key3", "value3"),)),
+        )
+        self.assertEqual(
+            (
+                ("key1", "value1"),
+                ("key1", "value1"),
+                ("key2", "value2"),
+                ("key2", "value2"),
+            ),
+            tuple(metadata + Metadata(*self._DEFAULT_DATA)),
+        )
+        self.assertEqual(self._DEFAULT_DATA, tuple(metadata))
+
+    def test_pickle(self):
+        metadata = Metadata(*self._MULTI_ENTRY_DATA)
+        self.assertEqual(metadata, pickle.loads(pickle.dumps(metadata)))
+
 
 class TestMetadataWithServer(AioTestBase):
     async def setUp(self):
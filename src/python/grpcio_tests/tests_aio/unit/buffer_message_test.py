@@ -0,0 +1,131 @@
+# Copyright 2026 The gRPC Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests AsyncIO messages serialized into a sequence of buffers."""
+
+import logging
+import unittest
+
+import grpc
+from grpc import aio
+
+from tests_aio.unit._test_base import AioTestBase
+
+_SERVICE_NAME = "test"
+_ECHO = "Echo"
+_SCATTERED = "Scattered"
+_ECHO_STREAM = "EchoStream"
+
+_SMALL_MESSAGE = b"\x07" * 16
+# Large enough to be sent without being copied.
+_LARGE_MESSAGE = bytes(range(256)) * 16 * 1024
+_NUM_STREAM_MESSAGES = 3
+
+
+def _scatter(message):
+    header = len(message).to_bytes(4, "big")
+    return (header, memoryview(message)[:-1], message[-1:])
+
+
+def _split(message):
+    return [message[:3], memoryview(message)[3:]]
+
+
+async def _echo(request, unused_context):
+    return request
+
+
+async def _echo_stream(request_iterator, unused_context):
+    async for request in request_iterator:
+        yield request
+
+
+def _method(name):
+    return "/%s/%s" % (_SERVICE_NAME, name)
+
+
+class TestBufferMessage(AioTestBase):
+    async def setUp(self):
+        self._server = aio.server()
+        self._server.add_registered_method_handlers(
+            _SERVICE_NAME,
+            {
+                _ECHO: grpc.unary_unary_rpc_method_handler(_echo),
+                _SCATTERED: grpc.unary_unary_rpc_method_handler(
+                    _echo, response_serializer=_scatter
+                ),
+                _ECHO_STREAM: grpc.stream_stream_rpc_method_handler(
+                    _echo_stream, response_serializer=_split
+                ),
+            },
+        )
+        port = self._server.add_insecure_port("[::]:0")
+        await self._server.start()
+        self._channel = aio.insecure_channel("localhost:%d" % port)
+
+    async def tearDown(self):
+        await self._channel.close()
+        await self._server.stop(None)
+
+    async def test_list_request(self):
+        echo = self._channel.unary_unary(
+            _method(_ECHO),
+            request_serializer=_split,
+            _registered_method=True,
+        )
+        self.assertEqual(_SMALL_MESSAGE, await echo(_SMALL_MESSAGE))
+        self.assertEqual(_LARGE_MESSAGE, await echo(_LARGE_MESSAGE))
+
+    async def test_tuple_request(self):
+        response = await self._channel.unary_unary(
+            _method(_ECHO),
+            request_serializer=_scatter,
+            _registered_method=True,
+        )(_LARGE_MESSAGE)
+        self.assertEqual(
+            len(_LARGE_MESSAGE).to_bytes(4, "big") + _LARGE_MESSAGE, response
+        )
+
+    async def test_tuple_response(self):
+        response = await self._channel.unary_unary(
+            _method(_SCATTERED), _registered_method=True
+        )(_LARGE_MESSAGE)
+        self.assertEqual(
+            len(_LARGE_MESSAGE).to_bytes(4, "big") + _LARGE_MESSAGE, response
+        )
+
+    async def test_empty_request(self):
+        response = await self._channel.unary_unary(
+            _method(_ECHO),
+            request_serializer=lambda unused_message: (),
+            _registered_method=True,
+        )(None)
+        self.assertEqual(b"", response)
+
+    async def test_stream_stream(self):
+        call = self._channel.stream_stream(
+            _method(_ECHO_STREAM),
+            request_serializer=_scatter,
+            _registered_method=True,
+        )()
+        expected = len(_LARGE_MESSAGE).to_bytes(4, "big") + _LARGE_MESSAGE
+        for _ in range(_NUM_STREAM_MESSAGES):
+            await call.write(_LARGE_MESSAGE)
+            self.assertEqual(expected, await call.read())
+        await call.done_writing()
+        self.assertEqual(grpc.StatusCode.OK, await call.code())
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG)
+    unittest.main(verbosity=2)
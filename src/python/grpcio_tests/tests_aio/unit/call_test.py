@@ -627,6 +627,39 @@ class TestStreamUnaryCall(_MulticallableTestMixin, AioTestBase):
         with self.assertRaises(asyncio.CancelledError):
             await call
 
+    async def test_write_many(self):
+        call = self._stub.StreamingInputCall()
+
+        payload = messages_pb2.Payload(body=b"\0" * _REQUEST_PAYLOAD_SIZE)
+        request = messages_pb2.StreamingInputCallRequest(payload=payload)
+        await call.write_many([request] * _NUM_STREAM_RESPONSES)
+        await call.done_writing()
+
+        response = await call
+        self.assertEqual(
+            _NUM_STREAM_RESPONSES * _REQUEST_PAYLOAD_SIZE,
+            response.aggregated_payload_size,
+        )
+        self.assertEqual(await call.code(), grpc.StatusCode.OK)
+
+    async def test_corked_writes_flushed_by_done_writing(self):
+        call = self._stub.StreamingInputCall()
+
+        payload = messages_pb2.Payload(body=b"\0" * _REQUEST_PAYLOAD_SIZE)
+        request = messages_pb2.StreamingInputCallRequest(payload=payload)
+        call.cork()
+        for _ in range(_NUM_STREAM_RESPONSES):
+            await call.write(request)
+        await call.write_many([request])
+        await call.done_writing()
+
+        response = await call
+        self.assertEqual(
+            (_NUM_STREAM_RESPONSES + 1) * _REQUEST_PAYLOAD_SIZE,
+            response.aggregated_payload_size,
+        )
+        self.assertEqual(await call.code(), grpc.StatusCode.OK)
+
     async def test_write_after_done_writing(self):
         call = self._stub.StreamingInputCall()
 
@@ -868,6 +901,27 @@ class TestStreamStreamCall(_MulticallableTestMixin, AioTestBase):
         # After the RPC finished, the read should also produce EOF
         self.assertIs(await call.read(), aio.EOF)
 
+    async def test_write_many(self):
+        call = self._stub.FullDuplexCall()
+
+        await call.write_many(
+            [_STREAM_OUTPUT_REQUEST_ONE_RESPONSE] * _NUM_STREAM_RESPONSES
+        )
+        for _ in range(_NUM_STREAM_RESPONSES):
+            response = await call.read()
+            self.assertEqual(_RESPONSE_PAYLOAD_SIZE, len(response.payload.body))
+
+        call.cork()
+        await call.write(_STREAM_OUTPUT_REQUEST_ONE_RESPONSE)
+        await call.write(_STREAM_OUTPUT_REQUEST_ONE_RESPONSE)
+        await call.uncork()
+        for _ in range(2):
+            response = await call.read()
+            self.assertEqual(_RESPONSE_PAYLOAD_SIZE, len(response.payload.body))
+
+        await call.done_writing()
+        self.assertEqual(await call.code(), grpc.StatusCode.OK)
+
     async def test_read_write_after_done_writing(self):
         call = self._stub.FullDuplexCall()
 
@@ -0,0 +1,92 @@
+# Copyright 2026 The gRPC Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests the channel pools of the AsyncIO stack."""
+
+import asyncio
+import logging
+import unittest
+
+import grpc
+from grpc.experimental import aio
+
+from src.proto.grpc.testing import messages_pb2
+from src.proto.grpc.testing import test_pb2_grpc
+from tests_aio.unit._test_base import AioTestBase
+from tests_aio.unit._test_server import start_test_server
+
+_POOL_SIZE = 3
+_NUM_CONCURRENT_CALLS = 10
+
+
+class TestChannelPool(AioTestBase):
+    async def setUp(self):
+        self._server_target, self._server = await start_test_server()
+        self._channel = aio.channel_pool(self._server_target, _POOL_SIZE)
+        self._stub = test_pb2_grpc.TestServiceStub(self._channel)
+
+    async def tearDown(self):
+        await self._channel.close()
+        await self._server.stop(None)
+
+    async def test_unary_unary(self):
+        response = await self._stub.UnaryCall(messages_pb2.SimpleRequest())
+        self.assertIsInstance(response, messages_pb2.SimpleResponse)
+
+    async def test_concurrent_calls(self):
+        calls = [
+            self._stub.UnaryCall(messages_pb2.SimpleRequest())
+            for _ in range(_NUM_CONCURRENT_CALLS)
+        ]
+        responses = await asyncio.gather(*calls)
+        self.assertEqual(_NUM_CONCURRENT_CALLS, len(responses))
+        for call in calls:
+            self.assertEqual(grpc.StatusCode.OK, await call.code())
+
+    async def test_unary_stream(self):
+        request = messages_pb2.StreamingOutputCallRequest()
+        request.response_parameters.append(
+            messages_pb2.ResponseParameters(size=1)
+        )
+        call = self._stub.StreamingOutputCall(request)
+        responses = [response async for response in call]
+        self.assertEqual(1, len(responses))
+        self.assertEqual(grpc.StatusCode.OK, await call.code())
+
+    async def test_stream_stream(self):
+        call = self._stub.FullDuplexCall()
+        request = messages_pb2.StreamingOutputCallRequest()
+        request.response_parameters.append(
+            messages_pb2.ResponseParameters(size=1)
+        )
+        await call.write(request)
+        self.assertIsInstance(
+            await call.read(), messages_pb2.StreamingOutputCallResponse
+        )
+        await call.done_writing()
+        self.assertEqual(grpc.StatusCode.OK, await call.code())
+
+    async def test_channel_ready(self):
+        await self._channel.channel_ready()
+        self.assertEqual(
+            grpc.ChannelConnectivity.READY, self._channel.get_state()
+        )
+
+    async def test_invalid_size(self):
+        with self.assertRaises(ValueError):
+            aio.channel_pool(self._server_target, 0)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG)
+    unittest.main(verbosity=2)
@@ -29,6 +29,8 @@ from tests_aio.unit import _common
 from tests_aio.unit._test_base import AioTestBase
 from tests_aio.unit._test_server import start_test_server
 
+_NUM_CHANNELS = 10
+
 
 class TestChannelReady(AioTestBase):
     async def setUp(self):
@@ -63,6 +65,28 @@ class TestChannelReady(AioTestBase):
             if server:
                 await server.stop(None)
 
+    async def test_channels_ready(self):
+        target, server = await start_test_server()
+        channels = [aio.insecure_channel(target) for _ in range(_NUM_CHANNELS)]
+        try:
+            await aio.channels_ready(
+                channels, timeout=test_constants.LONG_TIMEOUT
+            )
+            for channel in channels:
+                self.assertEqual(
+                    grpc.ChannelConnectivity.READY, channel.get_state()
+                )
+        finally:
+            for channel in channels:
+                await channel.close()
+            await server.stop(None)
+
+    async def test_channels_ready_timeout(self):
+        with self.assertRaises(asyncio.TimeoutError):
+            await aio.channels_ready(
+                [self._channel], timeout=test_constants.SHORT_TIMEOUT
+            )
+
     @unittest.skip(
         "skipping due to flake: https://github.com/grpc/grpc/issues/37949"
     )
@@ -0,0 +1,231 @@
+# Copyright 2026 The gRPC Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests the fast client interceptors of the AsyncIO stack."""
+
+import asyncio
+import logging
+import unittest
+
+import grpc
+from grpc.experimental import aio
+
+from src.proto.grpc.testing import messages_pb2
+from tests_aio.unit._test_base import AioTestBase
+from tests_aio.unit._test_server import _INITIAL_METADATA_KEY
+from tests_aio.unit._test_server import start_test_server
+
+_UNARY_CALL = "/grpc.testing.TestService/UnaryCall"
+_STREAMING_OUTPUT_CALL = "/grpc.testing.TestService/StreamingOutputCall"
+_FULL_DUPLEX_CALL = "/grpc.testing.TestService/FullDuplexCall"
+_UNKNOWN_CALL = "/grpc.testing.TestService/Unknown"
+_INJECTED_VALUE = "injected by a fast interceptor"
+_NUM_STREAM_RESPONSES = 3
+_TIMEOUT_WAIT_FOR_DONE_HOOK = 1.0
+
+
+class _RecordingInterceptor(aio.FastClientInterceptor):
+    def __init__(self, name, record):
+        self._name = name
+        self._record = record
+        self.codes = []
+        self.done = asyncio.Event()
+
+    def intercept_call_details(self, client_call_details):
+        self._record.append(("details", self._name))
+        return client_call_details
+
+    def intercept_done(self, client_call_details, code):
+        self._record.append(("done", self._name))
+        self.codes.append(code)
+        self.done.set()
+
+
+class _InjectMetadataInterceptor(aio.FastClientInterceptor):
+    def intercept_call_details(self, client_call_details):
+        metadata = aio.Metadata(*client_call_details.metadata)
+        metadata.add(_INITIAL_METADATA_KEY, _INJECTED_VALUE)
+        return client_call_details._replace(metadata=metadata)
+
+
+class _RaisingInterceptor(aio.FastClientInterceptor):
+    def intercept_done(self, client_call_details, code):
+        raise RuntimeError("intercept_done failed")
+
+
+class TestFastClientInterceptor(AioTestBase):
+    async def setUp(self):
+        self._server_target, self._server = await start_test_server()
+
+    async def tearDown(self):
+        await self._server.stop(None)
+
+    async def test_hooks_run_in_order(self):
+        record = []
+        interceptors = [
+            _RecordingInterceptor("outer", record),
+            _RecordingInterceptor("inner", record),
+        ]
+        async with aio.insecure_channel(
+            self._server_target, interceptors=interceptors
+        ) as channel:
+            multicallable = channel.unary_unary(
+                _UNARY_CALL,
+                request_serializer=messages_pb2.SimpleRequest.SerializeToString,
+                response_deserializer=messages_pb2.SimpleResponse.FromString,
+            )
+            response = await multicallable(messages_pb2.SimpleRequest())
+            self.assertIsInstance(response, messages_pb2.SimpleResponse)
+            await asyncio.wait_for(
+                interceptors[0].done.wait(), _TIMEOUT_WAIT_FOR_DONE_HOOK
+            )
+
+        self.assertEqual(
+            [
+                ("details", "outer"),
+                ("details", "inner"),
+                ("done", "inner"),
+                ("done", "outer"),
+            ],
+            record,
+        )
+        self.assertEqual([grpc.StatusCode.OK], interceptors[0].codes)
+
+    async def test_modified_call_details(self):
+        async with aio.insecure_channel(
+            self._server_target, interceptors=[_InjectMetadataInterceptor()]
+        ) as channel:
+            multicallable = channel.unary_unary(
+                _UNARY_CALL,
+                request_serializer=messages_pb2.SimpleRequest.SerializeToString,
+                response_deserializer=messages_pb2.SimpleResponse.FromString,
+            )
+            call = multicallable(messages_pb2.SimpleRequest())
+            await call
+            self.assertEqual(
+                _INJECTED_VALUE,
+                (await call.initial_metadata())[_INITIAL_METADATA_KEY],
+            )
+
+    async def test_non_ok_status(self):
+        interceptor = _RecordingInterceptor("interceptor", [])
+        async with aio.insecure_channel(
+            self._server_target, interceptors=[interceptor]
+        ) as channel:
+            call = channel.unary_unary(_UNKNOWN_CALL)(b"")
+            with self.assertRaises(aio.AioRpcError):
+                await call
+            await asyncio.wait_for(
+                interceptor.done.wait(), _TIMEOUT_WAIT_FOR_DONE_HOOK
+            )
+
+        self.assertEqual([grpc.StatusCode.UNIMPLEMENTED], interceptor.codes)
+
+    async def test_unary_stream(self):
+        interceptor = _RecordingInterceptor("interceptor", [])
+        async with aio.insecure_channel(
+            self._server_target, interceptors=[interceptor]
+        ) as channel:
+            multicallable = channel.unary_stream(
+                _STREAMING_OUTPUT_CALL,
+                request_serializer=messages_pb2.StreamingOutputCallRequest.SerializeToString,
+                response_deserializer=messages_pb2.StreamingOutputCallResponse.FromString,
+            )
+            request = messages_pb2.StreamingOutputCallRequest()
+            for _ in range(_NUM_STREAM_RESPONSES):
+                request.response_parameters.append(
+                    messages_pb2.ResponseParameters(size=1)
+                )
+            call = multicallable(request)
+            responses = [response async for response in call]
+            self.assertEqual(_NUM_STREAM_RESPONSES, len(responses))
+            await asyncio.wait_for(
+                interceptor.done.wait(), _TIMEOUT_WAIT_FOR_DONE_HOOK
+            )
+
+        self.assertEqual([grpc.StatusCode.OK], interceptor.codes)
+
+    async def test_stream_stream_cancelled(self):
+        interceptor = _RecordingInterceptor("interceptor", [])
+        async with aio.insecure_channel(
+            self._server_target, interceptors=[interceptor]
+        ) as channel:
+            call = channel.stream_stream(_FULL_DUPLEX_CALL)()
+            self.assertTrue(call.cancel())
+            await asyncio.wait_for(
+                interceptor.done.wait(), _TIMEOUT_WAIT_FOR_DONE_HOOK
+            )
+
+        self.assertEqual([grpc.StatusCode.CANCELLED], interceptor.codes)
+
+    async def test_runs_before_async_interceptors(self):
+        record = []
+        fast_interceptor = _RecordingInterceptor("fast", record)
+
+        class Interceptor(aio.UnaryUnaryClientInterceptor):
+            async def intercept_unary_unary(
+                self, continuation, client_call_details, request
+            ):
+                record.append(("intercept_unary_unary", "async"))
+                return await continuation(client_call_details, request)
+
+        async with aio.insecure_channel(
+            self._server_target,
+            interceptors=[Interceptor(), fast_interceptor],
+        ) as channel:
+            multicallable = channel.unary_unary(
+                _UNARY_CALL,
+                request_serializer=messages_pb2.SimpleRequest.SerializeToString,
+                response_deserializer=messages_pb2.SimpleResponse.FromString,
+            )
+            call = multicallable(messages_pb2.SimpleRequest())
+            await call
+            await asyncio.wait_for(
+                fast_interceptor.done.wait(), _TIMEOUT_WAIT_FOR_DONE_HOOK
+            )
+
+        self.assertEqual(
+            [
+                ("details", "fast"),
+                ("intercept_unary_unary", "async"),
+                ("done", "fast"),
+            ],
+            record,
+        )
+        self.assertEqual([grpc.StatusCode.OK], fast_interceptor.codes)
+
+    async def test_exception_in_done_hook(self):
+        interceptor = _RecordingInterceptor("interceptor", [])
+        async with aio.insecure_channel(
+            self._server_target,
+            interceptors=[interceptor, _RaisingInterceptor()],
+        ) as channel:
+            multicallable = channel.unary_unary(
+                _UNARY_CALL,
+                request_serializer=messages_pb2.SimpleRequest.SerializeToString,
+                response_deserializer=messages_pb2.SimpleResponse.FromString,
+            )
+            with self.assertLogs(level=logging.ERROR):
+                call = multicallable(messages_pb2.SimpleRequest())
+                await call
+                await asyncio.wait_for(
+                    interceptor.done.wait(), _TIMEOUT_WAIT_FOR_DONE_HOOK
+                )
+            self.assertEqual(grpc.StatusCode.OK, await call.code())
+
+        self.assertEqual([grpc.StatusCode.OK], interceptor.codes)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG)
+    unittest.main(verbosity=2)
@@ -0,0 +1,123 @@
+# Copyright 2026 The gRPC Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests the AsyncIO engines with one event loop per thread."""
+
+import os
+import subprocess
+import sys
+import unittest
+
+_INTERPRETER = sys.executable
+_TIMEOUT_S = 60
+
+# The engine is picked once per process, so each scenario runs in a child
+# process. A server runs on one loop, while clients on several other loops,
+# each on a thread of its own, call it concurrently.
+_SCRIPT = """if True:
+    import asyncio
+    import threading
+
+    import grpc
+
+    _LOOP_COUNT = 4
+    _CALL_COUNT = 20
+
+    async def _echo(request, unused_context):
+        return request
+
+    async def _serve(started, stopped):
+        try:
+            server = grpc.aio.server()
+            server.add_generic_rpc_handlers((
+                grpc.method_handlers_generic_handler(
+                    "test",
+                    {"Echo": grpc.unary_unary_rpc_method_handler(_echo)},
+                ),
+            ))
+            port = server.add_insecure_port("[::]:0")
+            await server.start()
+        except BaseException as exception:
+            started.set_exception(exception)
+            raise
+        started.set_result(port)
+        await asyncio.wrap_future(stopped)
+        await server.stop(None)
+
+    async def _call(port):
+        async with grpc.aio.insecure_channel("localhost:%d" % port) as channel:
+            echo = channel.unary_unary("/test/Echo")
+            responses = await asyncio.gather(
+                *(echo(b"%d" % index) for index in range(_CALL_COUNT))
+            )
+        assert responses == [b"%d" % index for index in range(_CALL_COUNT)]
+
+    def _run(coroutine, errors):
+        try:
+            asyncio.new_event_loop().run_until_complete(coroutine)
+        except BaseException as exception:
+            errors.append(exception)
+            raise
+
+    import concurrent.futures
+    started = concurrent.futures.Future()
+    stopped = concurrent.futures.Future()
+    errors = []
+    server_thread = threading.Thread(
+        target=_run, args=(_serve(started, stopped), errors)
+    )
+    server_thread.start()
+    port = started.result()
+    client_threads = [
+        threading.Thread(target=_run, args=(_call(port), errors))
+        for _ in range(_LOOP_COUNT)
+    ]
+    for thread in client_threads:
+        thread.start()
+    for thread in client_threads:
+        thread.join()
+    stopped.set_result(None)
+    server_thread.join()
+    if errors:
+        raise errors[0]
+"""
+
+
+class TestEngines(unittest.TestCase):
+    def _assert_loops_in_threads_succeed(self, engine):
+        env = dict(os.environ, GRPC_ASYNCIO_ENGINE=engine)
+        process = subprocess.run(
+            [_INTERPRETER, "-c", _SCRIPT],
+            env=env,
+            capture_output=True,
+            check=False,
+            timeout=_TIMEOUT_S,
+        )
+        self.assertEqual(
+            0,
+            process.returncode,
+            "Script failed:\n" + process.stderr.decode("utf-8", "replace"),
+        )
+
+    def test_poller(self):
+        self._assert_loops_in_threads_succeed("poller")
+
+    def test_per_loop_poller(self):
+        self._assert_loops_in_threads_succeed("per_loop_poller")
+
+    def test_callback(self):
+        self._assert_loops_in_threads_succeed("callback")
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,60 @@
+# Copyright 2026 The gRPC Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests the counters of the completion queue pollers."""
+
+import asyncio
+import logging
+import unittest
+
+from grpc._cython import cygrpc
+from grpc.experimental import aio
+
+from src.proto.grpc.testing import messages_pb2
+from src.proto.grpc.testing import test_pb2_grpc
+from tests_aio.unit._test_base import AioTestBase
+from tests_aio.unit._test_server import start_test_server
+
+_CALL_COUNT = 100
+
+
+class TestPollerStats(AioTestBase):
+    async def setUp(self):
+        address, self._server = await start_test_server()
+        self._channel = aio.insecure_channel(address)
+        self._stub = test_pb2_grpc.TestServiceStub(self._channel)
+
+    async def tearDown(self):
+        await self._channel.close()
+        await self._server.stop(None)
+
+    async def test_events_counted(self):
+        events_before, wakeups_before = cygrpc.poller_stats()
+        await asyncio.gather(
+            *(
+                self._stub.UnaryCall(messages_pb2.SimpleRequest())
+                for _ in range(_CALL_COUNT)
+            )
+        )
+        events_after, wakeups_after = cygrpc.poller_stats()
+        events = events_after - events_before
+        wakeups = wakeups_after - wakeups_before
+        # Each call completes several batches on both the client and server.
+        self.assertGreaterEqual(events, _CALL_COUNT * 2)
+        self.assertGreater(wakeups, 0)
+        self.assertLessEqual(wakeups, events)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG)
+    unittest.main(verbosity=2)
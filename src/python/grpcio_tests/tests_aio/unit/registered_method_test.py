@@ -0,0 +1,202 @@
+# Copyright 2026 The gRPC Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests registered method handlers of the AsyncIO server."""
+
+import logging
+import unittest
+
+import grpc
+from grpc import aio
+
+from tests_aio.unit._test_base import AioTestBase
+
+_SERVICE_NAME = "test"
+_UNARY_UNARY = "UnaryUnary"
+_UNARY_STREAM = "UnaryStream"
+_STREAM_STREAM = "StreamStream"
+_SHADOWED = "Shadowed"
+
+_REQUEST = b"\x00\x00\x00"
+_RESPONSE = b"\x01\x01\x01"
+_GENERIC_RESPONSE = b"\x02\x02\x02"
+_NUM_STREAM_MESSAGES = 3
+
+
+async def _unary_unary(unused_request, unused_context):
+    return _RESPONSE
+
+
+async def _unary_stream(request, unused_context):
+    for _ in range(_NUM_STREAM_MESSAGES):
+        yield request
+
+
+async def _stream_stream(request_iterator, unused_context):
+    async for request in request_iterator:
+        yield request
+
+
+def _method(name):
+    return "/%s/%s" % (_SERVICE_NAME, name)
+
+
+class _GenericHandler(grpc.GenericRpcHandler):
+    def __init__(self):
+        self.queried_methods = []
+
+    def service(self, handler_call_details):
+        self.queried_methods.append(handler_call_details.method)
+        if handler_call_details.method == _method(_SHADOWED):
+            return grpc.unary_unary_rpc_method_handler(
+                lambda unused_request, unused_context: _GENERIC_RESPONSE
+            )
+        return None
+
+
+class _RecordingInterceptor(aio.ServerInterceptor):
+    def __init__(self):
+        self.intercepted_methods = []
+
+    async def intercept_service(self, continuation, handler_call_details):
+        self.intercepted_methods.append(handler_call_details.method)
+        return await continuation(handler_call_details)
+
+
+class TestRegisteredMethod(AioTestBase):
+    async def setUp(self):
+        self._generic_handler = _GenericHandler()
+        self._interceptor = _RecordingInterceptor()
+        self._server = aio.server(interceptors=(self._interceptor,))
+        self._server.add_generic_rpc_handlers((self._generic_handler,))
+        self._server.add_registered_method_handlers(
+            _SERVICE_NAME,
+            {
+                _UNARY_UNARY: grpc.unary_unary_rpc_method_handler(_unary_unary),
+                _STREAM_STREAM: grpc.stream_stream_rpc_method_handler(
+                    _stream_stream
+                ),
+                _SHADOWED: grpc.unary_unary_rpc_method_handler(_unary_unary),
+            },
+        )
+        port = self._server.add_insecure_port("[::]:0")
+        await self._server.start()
+        self._channel = aio.insecure_channel("localhost:%d" % port)
+
+    async def tearDown(self):
+        await self._channel.close()
+        await self._server.stop(None)
+
+    async def test_unary_unary(self):
+        response = await self._channel.unary_unary(
+            _method(_UNARY_UNARY), _registered_method=True
+        )(_REQUEST)
+        self.assertEqual(_RESPONSE, response)
+        self.assertEqual([], self._generic_handler.queried_methods)
+        self.assertEqual(
+            [_method(_UNARY_UNARY)], self._interceptor.intercepted_methods
+        )
+
+    async def test_stream_stream(self):
+        call = self._channel.stream_stream(
+            _method(_STREAM_STREAM), _registered_method=True
+        )()
+        for _ in range(_NUM_STREAM_MESSAGES):
+            await call.write(_REQUEST)
+            self.assertEqual(_REQUEST, await call.read())
+        await call.done_writing()
+        self.assertEqual(grpc.StatusCode.OK, await call.code())
+
+    async def test_registered_handler_takes_precedence(self):
+        response = await self._channel.unary_unary(_method(_SHADOWED))(_REQUEST)
+        self.assertEqual(_RESPONSE, response)
+        self.assertEqual([], self._generic_handler.queried_methods)
+
+    async def test_unregistered_method(self):
+        with self.assertRaises(aio.AioRpcError) as exception_context:
+            await self._channel.unary_unary(_method("Unknown"))(_REQUEST)
+        self.assertEqual(
+            grpc.StatusCode.UNIMPLEMENTED, exception_context.exception.code()
+        )
+        self.assertEqual(
+            [_method("Unknown")], self._generic_handler.queried_methods
+        )
+
+    async def test_register_after_start_is_ignored(self):
+        self._server.add_registered_method_handlers(
+            _SERVICE_NAME,
+            {"Late": grpc.unary_unary_rpc_method_handler(_unary_unary)},
+        )
+        with self.assertRaises(aio.AioRpcError) as exception_context:
+            await self._channel.unary_unary(_method("Late"))(_REQUEST)
+        self.assertEqual(
+            grpc.StatusCode.UNIMPLEMENTED, exception_context.exception.code()
+        )
+
+
+class TestRegisteredMethodWithoutInterceptors(AioTestBase):
+    """Registered methods with a unary request have it read by Core along
+    with the call when no interceptor may substitute their handler.
+    """
+
+    async def setUp(self):
+        self._server = aio.server()
+        self._server.add_registered_method_handlers(
+            _SERVICE_NAME,
+            {
+                _UNARY_UNARY: grpc.unary_unary_rpc_method_handler(_unary_unary),
+                _UNARY_STREAM: grpc.unary_stream_rpc_method_handler(
+                    _unary_stream
+                ),
+                _STREAM_STREAM: grpc.stream_stream_rpc_method_handler(
+                    _stream_stream
+                ),
+            },
+        )
+        port = self._server.add_insecure_port("[::]:0")
+        await self._server.start()
+        self._channel = aio.insecure_channel("localhost:%d" % port)
+
+    async def tearDown(self):
+        await self._channel.close()
+        await self._server.stop(None)
+
+    async def test_unary_unary(self):
+        unary_unary = self._channel.unary_unary(
+            _method(_UNARY_UNARY), _registered_method=True
+        )
+        for _ in range(_NUM_STREAM_MESSAGES):
+            self.assertEqual(_RESPONSE, await unary_unary(_REQUEST))
+
+    async def test_unary_stream(self):
+        call = self._channel.unary_stream(
+            _method(_UNARY_STREAM), _registered_method=True
+        )(_REQUEST)
+        responses = [response async for response in call]
+        self.assertEqual([_REQUEST] * _NUM_STREAM_MESSAGES, responses)
+        self.assertEqual(grpc.StatusCode.OK, await call.code())
+
+    async def test_stream_stream(self):
+        call = self._channel.stream_stream(
+            _method(_STREAM_STREAM), _registered_method=True
+        )()
+        for _ in range(_NUM_STREAM_MESSAGES):
+            await call.write(_REQUEST)
+            self.assertEqual(_REQUEST, await call.read())
+        await call.done_writing()
+        self.assertEqual(grpc.StatusCode.OK, await call.code())
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG)
+    unittest.main(verbosity=2)
@@ -36,6 +36,8 @@ _STREAM_UNARY_EVILLY_MIXED = "/test/StreamUnaryEvillyMixed"
 _STREAM_STREAM_ASYNC_GEN = "/test/StreamStreamAsyncGen"
 _STREAM_STREAM_READER_WRITER = "/test/StreamStreamReaderWriter"
 _STREAM_STREAM_EVILLY_MIXED = "/test/StreamStreamEvillyMixed"
+_STREAM_STREAM_CORKED = "/test/StreamStreamCorked"
+_STREAM_STREAM_ASYNC_GEN_CORKED = "/test/StreamStreamAsyncGenCorked"
 _UNIMPLEMENTED_METHOD = "/test/UnimplementedMethod"
 _ERROR_IN_STREAM_STREAM = "/test/ErrorInStreamStream"
 _ERROR_IN_STREAM_UNARY = "/test/ErrorInStreamUnary"
@@ -48,6 +50,7 @@ _RESPONSE = b"\x01\x01\x01"
 _NUM_STREAM_REQUESTS = 3
 _NUM_STREAM_RESPONSES = 5
 _MAXIMUM_CONCURRENT_RPCS = 5
+_REQUEST_CALL_DEPTH = 8
 
 
 class _GenericHandler(grpc.GenericRpcHandler):
@@ -87,6 +90,12 @@ class _GenericHandler(grpc.GenericRpcHandler):
             _STREAM_STREAM_READER_WRITER: grpc.stream_stream_rpc_method_handler(
                 self._stream_stream_reader_writer
             ),
+            _STREAM_STREAM_CORKED: grpc.stream_stream_rpc_method_handler(
+                self._stream_stream_corked
+            ),
+            _STREAM_STREAM_ASYNC_GEN_CORKED: grpc.stream_stream_rpc_method_handler(
+                self._stream_stream_async_gen_corked
+            ),
             _STREAM_STREAM_EVILLY_MIXED: grpc.stream_stream_rpc_method_handler(
                 self._stream_stream_evilly_mixed
             ),
@@ -169,6 +178,23 @@ class _GenericHandler(grpc.GenericRpcHandler):
         for _ in range(_NUM_STREAM_RESPONSES):
             await context.write(_RESPONSE)
 
+    async def _stream_stream_corked(self, unused_request, context):
+        for _ in range(_NUM_STREAM_REQUESTS):
+            assert _REQUEST == await context.read()
+        await context.write_many([_RESPONSE] * (_NUM_STREAM_RESPONSES - 2))
+        # Left corked, so flushed once the handler returns.
+        context.cork()
+        await context.write(_RESPONSE)
+        await context.write_many([_RESPONSE])
+
+    async def _stream_stream_async_gen_corked(self, request_iterator, context):
+        async for request in request_iterator:
+            assert _REQUEST == request
+        # Every response is corked, so none is sent before the generator ends.
+        context.cork()
+        for _ in range(_NUM_STREAM_RESPONSES):
+            yield _RESPONSE
+
     async def _stream_stream_evilly_mixed(self, request_iterator, context):
         assert _REQUEST == await context.read()
         request_count = 0
@@ -239,8 +265,8 @@ class _GenericHandler(grpc.GenericRpcHandler):
         await self._called
 
 
-async def _start_test_server():
-    server = aio.server()
+async def _start_test_server(options=None):
+    server = aio.server(options=options)
     port = server.add_insecure_port("[::]:0")
     generic_handler = _GenericHandler()
     server.add_generic_rpc_handlers((generic_handler,))
@@ -249,8 +275,12 @@ async def _start_test_server():
 
 
 class TestServer(AioTestBase):
+    _SERVER_OPTIONS = None
+
     async def setUp(self):
-        addr, self._server, self._generic_handler = await _start_test_server()
+        addr, self._server, self._generic_handler = await _start_test_server(
+            self._SERVER_OPTIONS
+        )
         self._channel = aio.insecure_channel(addr)
 
     async def tearDown(self):
@@ -406,6 +436,38 @@ class TestServer(AioTestBase):
 
         self.assertEqual(await call.code(), grpc.StatusCode.OK)
 
+    async def test_stream_stream_corked(self):
+        stream_stream_call = self._channel.stream_stream(_STREAM_STREAM_CORKED)
+        call = stream_stream_call()
+
+        for _ in range(_NUM_STREAM_REQUESTS):
+            await call.write(_REQUEST)
+        await call.done_writing()
+
+        for _ in range(_NUM_STREAM_RESPONSES):
+            response = await call.read()
+            self.assertEqual(_RESPONSE, response)
+
+        self.assertEqual(aio.EOF, await call.read())
+        self.assertEqual(await call.code(), grpc.StatusCode.OK)
+
+    async def test_stream_stream_async_gen_corked(self):
+        stream_stream_call = self._channel.stream_stream(
+            _STREAM_STREAM_ASYNC_GEN_CORKED
+        )
+        call = stream_stream_call()
+
+        for _ in range(_NUM_STREAM_REQUESTS):
+            await call.write(_REQUEST)
+        await call.done_writing()
+
+        for _ in range(_NUM_STREAM_RESPONSES):
+            response = await call.read()
+            self.assertEqual(_RESPONSE, response)
+
+        self.assertEqual(aio.EOF, await call.read())
+        self.assertEqual(await call.code(), grpc.StatusCode.OK)
+
     async def test_shutdown(self):
         await self._server.stop(None)
         # Ensures no SIGSEGV triggered, and ends within timeout.
@@ -615,6 +677,47 @@ class TestServer(AioTestBase):
         await channel.close()
         await server.stop(0)
 
+    async def test_request_call_depth(self):
+        # A smoke test: a server serving calls one request at a time passes
+        # it too, as Core queues the calls it has no request for yet.
+        server = aio.server(
+            options=(
+                (
+                    grpc.experimental.ServerOptions.RequestCallDepth,
+                    _REQUEST_CALL_DEPTH,
+                ),
+            )
+        )
+        port = server.add_insecure_port("[::]:0")
+        server.add_generic_rpc_handlers((_GenericHandler(),))
+        await server.start()
+        channel = aio.insecure_channel("localhost:%d" % port)
+        multicallable = channel.unary_unary(_BLOCK_BRIEFLY)
+
+        # More RPCs than outstanding requests, so accepted requests must be
+        # re-armed while the earlier RPCs are still running.
+        responses = await asyncio.gather(
+            *(multicallable(_REQUEST) for _ in range(4 * _REQUEST_CALL_DEPTH))
+        )
+        self.assertEqual([_RESPONSE] * 4 * _REQUEST_CALL_DEPTH, responses)
+
+        # The outstanding requests are failed by Core and drained on stop.
+        await channel.close()
+        await server.stop(test_constants.SHORT_TIMEOUT)
+
+    async def test_invalid_request_call_depth(self):
+        for value in (0, True):
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    aio.server(
+                        options=(
+                            (
+                                grpc.experimental.ServerOptions.RequestCallDepth,
+                                value,
+                            ),
+                        )
+                    )
+
     async def test_maximum_concurrent_rpcs_not_underflow(self):
         """Test that the concurrent RPC counter doesn't underflow.
 
@@ -694,6 +797,19 @@ class TestServer(AioTestBase):
         self.assertIn("trailing", rpc_error.details())
 
 
+class TestServerInlineCancellationListener(TestServer):
+    _SERVER_OPTIONS = (
+        (grpc.experimental.ServerOptions.InlineCancellationListener, True),
+    )
+
+
+class TestServerEagerTaskExecution(TestServer):
+    _SERVER_OPTIONS = (
+        (grpc.experimental.ServerOptions.EagerTaskExecution, True),
+        (grpc.experimental.ServerOptions.InlineCancellationListener, True),
+    )
+
+
 if __name__ == "__main__":
     logging.basicConfig(level=logging.DEBUG)
     unittest.main(verbosity=2)
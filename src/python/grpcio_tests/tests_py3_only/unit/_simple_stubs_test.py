@@ -227,6 +227,34 @@ class SimpleStubsTest(unittest.TestCase):
 
             self.assert_cached(_invoke)
 
+    def test_channel_shared_across_threads(self):
+        target = "localhost:1"
+        options = ((inspect.stack()[0][3], ""),)
+        channels = []
+
+        def _get_channel():
+            for _ in range(_CACHE_EPOCHS):
+                channel, _ = grpc._simple_stubs.ChannelCache.get().get_channel(
+                    target=target,
+                    options=options,
+                    channel_credentials=None,
+                    insecure=True,
+                    compression=None,
+                    method=_UNARY_UNARY,
+                    _registered_method=True,
+                )
+                channels.append(channel)
+
+        threads = [
+            threading.Thread(target=_get_channel) for _ in range(_CACHE_TRIALS)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(_CACHE_EPOCHS * _CACHE_TRIALS, len(channels))
+        self.assertEqual(1, len(set(map(id, channels))))
+
     def test_channels_evicted(self):
         with _server(grpc.local_server_credentials()) as port:
             target = f"localhost:{port}"
@@ -1048,6 +1048,25 @@ class PythonLanguage(Language):
             server_type="ASYNC_SERVER",
         )
 
+        yield _ping_pong_scenario(
+            "python_generic_sync_streaming_from_client",
+            rpc_type="STREAMING_FROM_CLIENT",
+            client_type="SYNC_CLIENT",
+            server_type="ASYNC_GENERIC_SERVER",
+            use_generic_payload=True,
+        )
+
+        scenario = _ping_pong_scenario(
+            "python_generic_sync_streaming_from_client_write_window_16",
+            rpc_type="STREAMING_FROM_CLIENT",
+            client_type="SYNC_CLIENT",
+            server_type="ASYNC_GENERIC_SERVER",
+            use_generic_payload=True,
+        )
+        # A Python-only channel option; see grpc.experimental.ChannelOptions.
+        _add_channel_arg(scenario["client_config"], "StreamWriteWindow", 16)
+        yield scenario
+
         yield _ping_pong_scenario(
             "python_protobuf_async_unary_ping_pong",
             rpc_type="UNARY",